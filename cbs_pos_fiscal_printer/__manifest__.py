@@ -34,13 +34,77 @@ For this module to work, the fisca printer must be accessed from the odoo server
 1.4.0 cbs_no_zero_value_on_fiscal_receipt = true will not print 0 value lines
         cbs_after_fiscal_receipt_print_non_fiscal = true will print a non fiscal receipt after fiscal one
 1.5.0 on pos order put also the paid with cash
+1.6.0 the commands are sent to ZFPLAB server on pooled keep-alive connections (not a new tcp connection per command);
+    configurable connect/read timeouts in pos config
+1.7.0 the receipt (from open to close) is sent to ZFPLAB server in one request (FP_core.batch());
+    falls back to command by command if the server does not accept batches
+1.8.0 the pos does not wait the printing in its request: it adds a cbs.fiscal.print.job and polls it; the jobs are
+    printed by a cron dispatcher per printer (in order, retried with backoff, one waiting job per receipt)
+1.9.0 the handshake with ZFPLAB server/fiscal device is done once per cbs_fiscal_handshake_ttl (not at every
+    receipt), again after changing the connection settings or after a connection error
+1.10.0 one reusable FP client per (ZFPLAB server, fiscal device) in the worker process (FP_registry), with a lock
+    that serializes the prints at the device; different devices print in parallel; FP state is per instance
+1.11.0 the commands of the receipt lines/payments are encoded from templates (FP_codec), not with ElementTree
+1.12.0 FP.py has only the receipt/report commands; the others are in FP_more and the enumerations in FP_enums,
+    imported at first use; the result classes have __slots__
+1.13.0 consecutive receipt text lines are packed in commands of up to cbs_print_text_max_symbols (FP_core.text_block);
+    option to print the non fiscal receipts as one document (postponed printing)
+1.14.0 cbs_fiscal_receipt_print_type: fiscal receipts can be printed postponed/buffered; then a failed line cancels
+    the receipt before anything is printed
+1.15.0 the tax to tremol VAT class mapping is a list of rows per pos config (cbs_tax_vat_class_ids, migrated from
+    cbs_odoo_tax_id_to_tremol_vat_json, whose tax ids never matched); cached, resolved once per receipt
+1.16.0 the receipt is read from the database into a plain python plan (fiscal_receipt) before opening it at the
+    fiscal device, with the same few queries for any number of lines; the device conversation only replays it
+1.17.0 the sanitized (unidecode) and split receipt texts are memoized in LRU caches per worker (fiscal_text),
+    cleared when product names or cbs_fiscal_printer_line_symbols change; fiscal_text.stats() gives the hit rates
+1.18.0 cbs_sell_by_plu: the pos products are programmed as PLUs in the fiscal device (cron/button, only the
+    changes, cbs.fiscal.plu keeps what the device has); the fiscal receipts sell them by PLU number
+1.19.0 X/Z reports of the selected pos configs (list action), printed in parallel (up to 8 devices at a time);
+    the result and the device counters of each config are kept in a cbs.fiscal.report.run
+1.20.0 the device counters read after a fiscal receipt or a daily report are kept in cbs.fiscal.counter.snapshot
+    (integer columns); cbs.fiscal.session.reconciliation (sql view) compares them per session with the orders
+1.21.0 pos.order has the integer cbs_fiscal_receipt_num/cbs_fiscal_total_counter and the device serial
+    (ReadSerialNum at handshake), indexed; cbs.fiscal.receipt.sequence.issue lists the gaps and duplicates
+1.22.0 heartbeat (cron each minute, button Check status): the status of the fiscal devices of the open sessions
+    (ReadStatus) is kept in cbs.fiscal.device.status; a receipt fails at once while the device is known as
+    unreachable, without paper or blocked; the heartbeat keeps the handshake and the pooled connection warm
+1.23.0 the requests to ZFPLAB server are measured (FP_metrics: wall/connect time, bytes, error code per command);
+    summed per pos config, day and command with a histogram (cbs.fiscal.command.stat, also as Prometheus text at
+    /cbs_pos_fiscal_printer/metrics); receipts slower than cbs_slow_receipt_ms are kept with their requests
+1.24.0 a write-ahead journal (cbs.fiscal.receipt.journal, committed on its own cursor) keeps the step of each
+    receipt at the device; an interrupted receipt is ended from its step (closed or cancelled) before the next one
+    and by the heartbeat; the print jobs of an offline device wait, not counted as attempts, until the heartbeat
+    sees it back
+1.25.0 the receipt plan is rendered once into the device commands (fiscal_receipt.render) and emitted as they are;
+    the non fiscal copy after a fiscal receipt is rendered with it and printed in the same device conversation
+    (no second status check, handshake or counter read)
+1.26.0 the mock ZfpLab server of the tests answers settings(...), finddevice and clientremove; the print path of
+    typical receipts (1/10/50 lines, storno, mixed payments) is checked for its round trips and benchmarked
+    (receipts per second, p50/p95/p99) with odoo-bin --test-tags cbs_fiscal_bench
+1.27.0 export of the electronic journal / fiscal memory of the devices by Z report range (cbs.fiscal.ej.export):
+    read by the cron in chunks of Z reports, the devices in parallel, streamed to a gzip file in the filestore
+    and resumed after the last chunk committed; the fiscal receipts found are indexed and linked to the pos orders
+1.28.0 the handshake reads the device settings of the ZfpLab server and sends them only if the server works with
+    another device (each sending reconnects it to the device); the device found connected is shared by the
+    workers (cbs.fiscal.server.device) for cbs_fiscal_handshake_ttl seconds; the sendings are counted in the
+    command timings as serverSetDeviceSettings
+1.29.0 ZfpLab servers shared by the devices of several pos configs: the devices of one server are used one at a
+    time (one lock per server in the worker, an advisory lock between the workers) and the server is asked for
+    its device before each use; the print jobs are dispatched per server, the receipts of the connected device
+    before switching to another one (at most 20 while others wait); a server busy with another client no longer
+    turns off the batches
+1.30.0 FP_async: the commands of FP as coroutines (AsyncFP) over non-blocking keep-alive connections, with the
+    same answers and ServerException, a limit of commands at the same time per device and timeouts; one event
+    loop drives many devices
+1.30.1 the fiscal reconciliation is per fiscal day (cbs.fiscal.day.reconciliation, one row per Z report, the
+    receipts printed since the previous one) instead of per session
 Future:
 - to make also to work directly from javascript ( or other version for javascript, when the server is installed locally and also the printer, and odoo server can not access them)
 - to make it work only from some ip/or the ip where is the fiscal printer (read the request ip and use it as ip of fiscal driver)
     """,
     'category': 'Sales/Point of Sale',
     'sequence': 300,
-    'version': '16.0.1.5.0',
+    'version': '16.0.1.30.1',
     "website": "https://cbssolutions.ro",
     "author": "dev@cbssolutions.ro",
     "maintainers": ["dev@cbssolutions.ro"],
@@ -48,8 +112,16 @@ Future:
     "development_status": "Mature",
     'depends': ['point_of_sale', ],
     'data': [
+             'security/ir.model.access.csv',
+             'data/ir_cron.xml',
              'views/pos_config_views.xml',
              'views/pos_order_views.xml',
+             'views/cbs_fiscal_print_job_views.xml',
+             'views/cbs_fiscal_report_run_views.xml',
+             'views/cbs_fiscal_counter_snapshot_views.xml',
+             'views/cbs_fiscal_metrics_views.xml',
+             'views/cbs_fiscal_receipt_journal_views.xml',
+             'views/cbs_fiscal_ej_export_views.xml',
     ],
     'installable': True,
     'application': False,
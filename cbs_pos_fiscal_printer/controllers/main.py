@@ -0,0 +1,45 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import os
+
+from werkzeug.exceptions import BadRequest, Forbidden, NotFound
+from werkzeug.wsgi import wrap_file
+
+from odoo import http
+from odoo.http import request
+
+
+class CbsFiscalMetrics(http.Controller):
+
+    @http.route('/cbs_pos_fiscal_printer/metrics', type='http', auth='user', methods=['GET'])
+    def metrics(self, days='1', **kw):
+        """Timings of the fiscal printer commands of the last days (default today) per pos config and command,
+        as Prometheus text; for the pos managers."""
+        if not request.env.user.has_group('point_of_sale.group_pos_manager'):
+            raise Forbidden()
+        try:
+            days = max(int(days), 1)
+        except ValueError:
+            raise BadRequest("days must be a number of days")
+        text = request.env['cbs.fiscal.command.stat'].cbs_prometheus(days)
+        return request.make_response(text, headers=[('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')])
+
+
+class CbsFiscalEjExport(http.Controller):
+
+    @http.route('/cbs_pos_fiscal_printer/ej/<int:export_id>', type='http', auth='user', methods=['GET'])
+    def ej_export(self, export_id, **kw):
+        """The gzip file of an electronic journal export, streamed from the disk; for the pos managers."""
+        if not request.env.user.has_group('point_of_sale.group_pos_manager'):
+            raise Forbidden()
+        export = request.env['cbs.fiscal.ej.export'].browse(export_id).exists()
+        if not export or not export.file_path or not os.path.isfile(export.file_path):
+            raise NotFound()
+        name = os.path.basename(export.file_path)
+        file = open(export.file_path, 'rb')
+        return request.make_response(wrap_file(request.httprequest.environ, file), headers=[
+            ('Content-Type', 'application/gzip'),
+            ('Content-Length', str(os.path.getsize(export.file_path))),
+            ('Content-Disposition', f'attachment; filename="{name}"'),
+        ])
@@ -0,0 +1,36 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """cbs_odoo_tax_id_to_tremol_vat_json of pos.config -> cbs.pos.tax.vat.class rows."""
+    cr.execute("SELECT 1 FROM information_schema.columns WHERE table_name = 'pos_config' "
+               "AND column_name = 'cbs_odoo_tax_id_to_tremol_vat_json'")
+    if not cr.fetchone():
+        return
+    cr.execute("SELECT id, cbs_odoo_tax_id_to_tremol_vat_json FROM pos_config "
+               "WHERE cbs_odoo_tax_id_to_tremol_vat_json IS NOT NULL")
+    for config_id, mapping in cr.fetchall():
+        try:
+            mapping = json.loads(mapping)
+        except ValueError:
+            _logger.warning("pos.config %s: tax to VAT class mapping %r is not json, not migrated", config_id, mapping)
+            continue
+        if not isinstance(mapping, dict):
+            continue
+        for tax_id, vat_class in mapping.items():
+            if not str(tax_id).isdigit() or vat_class not in ('A', 'B', 'C', 'D', 'E', 'F'):
+                _logger.warning("pos.config %s: tax %r to VAT class %r not migrated", config_id, tax_id, vat_class)
+                continue
+            cr.execute("""
+                INSERT INTO cbs_pos_tax_vat_class (config_id, tax_id, vat_class, create_uid, create_date,
+                                                   write_uid, write_date)
+                SELECT %s, id, %s, 1, now() at time zone 'UTC', 1, now() at time zone 'UTC'
+                  FROM account_tax WHERE id = %s
+                ON CONFLICT (config_id, tax_id) DO NOTHING
+            """, (config_id, vat_class, int(tax_id)))
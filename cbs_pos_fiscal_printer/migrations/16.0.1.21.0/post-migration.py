@@ -0,0 +1,20 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """cbs_fiscal_receipt_num and cbs_fiscal_total_counter of pos.order from the json of
+    cbs_ReadLastAndTotalReceiptNum, like {"last_nr": "12", "last_total": "1234"}. The device serial is not
+    known for these orders."""
+    cr.execute("""
+        UPDATE pos_order
+           SET cbs_fiscal_receipt_num = substring("cbs_ReadLastAndTotalReceiptNum" FROM '"last_nr": *"(\\d{1,9})"')::int,
+               cbs_fiscal_total_counter = substring("cbs_ReadLastAndTotalReceiptNum"
+                                                    FROM '"last_total": *"(\\d{1,9})"')::int
+         WHERE "cbs_ReadLastAndTotalReceiptNum" IS NOT NULL AND cbs_fiscal_total_counter IS NULL
+    """)
+    _logger.info("fiscal receipt numbers of %s pos orders taken from cbs_ReadLastAndTotalReceiptNum", cr.rowcount)
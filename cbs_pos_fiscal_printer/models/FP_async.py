@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+#  -*- coding: utf-8 -*-
+"""Tremol fiscal printer client for asyncio: the commands of FP as coroutines.
+
+One event loop can drive many ZfpLab servers at once (a store with many registers, a status poll of all the
+devices) without a thread per device. AsyncFP sends the commands of FP and FP_more over non-blocking
+keep-alive HTTP connections, with the same encoding (FP_codec), the same answers and the same ServerException
+as FP; at most max_concurrency commands of one AsyncFP are at its ZfpLab server at the same time.
+
+Not here: the batches and text blocks of FP_core, the server* settings methods, and FP_metrics (its counters
+are per thread).
+"""
+import asyncio
+
+from . import FP_codec, FP_transport
+from .FP import FP
+from .FP_core import HEADERS, ServerException, SErrorType, parse_answer
+
+_HEADERS = "".join(f"{name}: {value}\r\n" for name, value in HEADERS.items())
+
+
+class _Capture(Exception):
+    """Stops a command of FP at its do(), with what it sends."""
+
+    def __init__(self, command_name, arguments):
+        super().__init__(command_name)
+        self.command_name = command_name
+        self.arguments = arguments
+
+
+class _Capturing:
+    "self of a command of FP that only tells what it sends"
+
+    @staticmethod
+    def do(command_name, *arguments):
+        raise _Capture(command_name, arguments)
+
+
+class _Answered:
+    "self of a command of FP that gets the decoded answer of the server"
+
+    def __init__(self, answer):
+        self._answer = answer
+
+    def do(self, command_name, *arguments):
+        return self._answer
+
+
+class AsyncConnection:
+    """One keep-alive HTTP/1.1 connection to a ZfpLab server."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    @property
+    def is_open(self):
+        return self.writer is not None and not self.writer.is_closing()
+
+    @property
+    def dropped(self):
+        """An idle connection that the server closed."""
+        return not self.is_open or self.reader.at_eof()
+
+    async def open(self, connect_timeout):
+        self.reader, self.writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port),
+                                                          connect_timeout)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def send(self, method, path, body):
+        """Sends one request."""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n{_HEADERS}"
+        if body is not None:
+            head += f"Content-Length: {len(body)}\r\n"
+        self.writer.write(head.encode("latin-1") + b"\r\n" + (body or b""))
+        await self.writer.drain()
+
+    async def response(self, read_timeout):
+        """(http status, response body, keep the connection open) of the request sent."""
+        return await asyncio.wait_for(self._response(), read_timeout)
+
+    async def _response(self):
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Remote end closed connection without response")
+        version, status = status_line.split(None, 2)[:2]
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _sep, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            data = b""
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if not size:
+                    await self.reader.readline()  # no trailers
+                    break
+                data += await self.reader.readexactly(size)
+                await self.reader.readline()
+        elif "content-length" in headers:
+            data = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            data = await self.reader.read()
+            headers["connection"] = "close"
+        keep_alive = headers.get("connection", "").lower() != "close" and version != b"HTTP/1.0"
+        return int(status), data, keep_alive
+
+
+class AsyncFP:
+    """The commands of FP (and FP_more) as coroutines, to the ZfpLab server host:port:
+    await fp.ReadLastAndTotalReceiptNum() answers as fp.ReadLastAndTotalReceiptNum() of FP.
+    Use it from one event loop, in an async with block (or await close() at the end)."""
+
+    def __init__(self, host, port, max_concurrency=1, connect_timeout=FP_transport.DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=FP_transport.DEFAULT_READ_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.max_concurrency = max_concurrency
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._semaphore = None  # created in the event loop of the first command
+        self._idle = []
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    async def do(self, command_name, *arguments):
+        """Sends command to ZfpLab server"""
+        try:
+            text = FP_codec.encode_command(command_name, arguments)
+        except Exception as ex:
+            raise ServerException(str(ex), SErrorType.ServerErr)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            try:
+                status, data = await self._send("POST", "/", text)
+            except asyncio.TimeoutError:
+                raise ServerException("Server connection error (timed out)", SErrorType.ServerConnectionError)
+            except Exception as ex:
+                raise ServerException("Server connection error (" + str(ex) + ")", SErrorType.ServerConnectionError)
+        resp = parse_answer(status, data)
+        try:
+            return FP_codec.decode_result(resp)
+        except Exception as ex:
+            raise ServerException(str(ex), SErrorType.ServerErr)
+
+    async def _send(self, method, path, body):
+        """(http status, body) of one request. A reused connection closed by the server is reopened once if
+        sending the request failed; a failure after sending is raised: the command may have been executed."""
+        while True:
+            conn = self._idle.pop() if self._idle else None
+            reused = conn is not None
+            if reused and conn.dropped:
+                conn.close()
+                continue
+            try:
+                if not reused:
+                    conn = AsyncConnection(self.host, self.port)
+                    self.connections_opened += 1
+                    await conn.open(self.connect_timeout)
+                await conn.send(method, path, body)
+            except ConnectionError:
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            try:
+                status, data, keep_alive = await conn.response(self.read_timeout)
+            except BaseException:
+                conn.close()
+                raise
+            self.requests_sent += 1
+            if keep_alive:
+                self._idle.append(conn)
+            else:
+                conn.close()
+            return status, data
+
+    async def close(self):
+        """Closes the idle connections."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+def _command(method):
+    """The coroutine of the command method of FP: the same arguments, encoding and result."""
+
+    async def command(self, *args, **kwargs):
+        try:
+            method(_Capturing(), *args, **kwargs)
+        except _Capture as capture:
+            answer = await self.do(capture.command_name, *capture.arguments)
+        else:
+            return None  # sends nothing
+        return method(_Answered(answer), *args, **kwargs)
+
+    command.__name__ = command.__qualname__ = method.__name__
+    command.__doc__ = method.__doc__
+    return command
+
+
+def _install():
+    from . import FP_more
+    commands = dict(vars(FP_more.FPMore))
+    commands.update(vars(FP))
+    for name, value in commands.items():
+        if not name.startswith("_") and callable(value) and not hasattr(AsyncFP, name):
+            setattr(AsyncFP, name, _command(value))
+
+
+_install()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+#  -*- coding: utf-8 -*-
+"""Encoding of the commands sent to ZfpLab server and decoding of its answers, used by FP_core.
+
+The commands sent for every line or payment of a receipt are encoded from pre-built templates,
+without building an ElementTree; the bytes are the ones ElementTree writes for the same command.
+"""
+import base64
+from datetime import datetime
+from enum import Enum
+import xml.etree.ElementTree as XML
+
+FP_DATETIME_FORMAT = "%d-%m-%Y %H:%M:%S"
+
+# the commands encoded from templates; the others are encoded with ElementTree
+TEMPLATE_COMMANDS = frozenset((
+    "PrintText", "SellPLUwithSpecifiedVAT", "SellPLUFromFD_DB", "StornoPLU", "Payment",
+    "OpenReceipt", "OpenNonFiscalReceipt", "CloseReceipt", "CloseNonFiscalReceipt",
+    "ReadLastAndTotalReceiptNum", "PaperFeed", "CutPaper",
+))
+
+# characters that ElementTree escapes differently from a python version to another: a value
+# with one of them is encoded with ElementTree
+_ELEMENTTREE_CHARS = ("\r", "\n", "\t")
+
+# (command name, names of the not None arguments, has arguments) -> %s template of the command
+_templates = {}
+
+
+def arg_value(val):
+    """The text of an argument value, as ZfpLab server expects it."""
+    if isinstance(val, str):
+        return val
+    if isinstance(val, Enum):
+        return val.value
+    if isinstance(val, datetime):
+        return val.strftime(FP_DATETIME_FORMAT)
+    if isinstance(val, bytearray):
+        return base64.b64encode(val).decode("utf-8")
+    return str(val)
+
+
+def encode_command_xml(command_name, arguments):
+    """<Command> of command_name with the (name, value, name, value...) arguments, built with ElementTree."""
+    count = len(arguments)
+    if count > 0 and count % 2 == 1:
+        raise Exception("Invalid number of arguments!")
+    root = XML.Element("Command")
+    root.set("Name", command_name)
+    if count > 0:
+        args = XML.SubElement(root, "Args")
+        for aaa in range(0, count, 2):
+            if arguments[aaa] is None or arguments[aaa + 1] is None:
+                continue
+            arg = XML.SubElement(args, "Arg")
+            arg.set("Name", arguments[aaa])
+            arg.set("Value", arg_value(arguments[aaa + 1]))
+    return XML.tostring(root)
+
+
+def _escape(text):
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    if "\"" in text:
+        text = text.replace("\"", "&quot;")
+    return text
+
+
+def _template(key):
+    command_name, names, has_args = key
+    if not has_args:
+        template = '<Command Name="%s" />' % command_name
+    elif not names:
+        template = '<Command Name="%s"><Args /></Command>' % command_name
+    else:
+        template = '<Command Name="%s"><Args>%s</Args></Command>' % (
+            command_name, "".join('<Arg Name="%s" Value="%%s" />' % name for name in names))
+    _templates[key] = template
+    return template
+
+
+def encode_command(command_name, arguments):
+    """Same bytes as encode_command_xml; faster for the TEMPLATE_COMMANDS."""
+    if command_name not in TEMPLATE_COMMANDS:
+        return encode_command_xml(command_name, arguments)
+    count = len(arguments)
+    if count % 2 == 1:
+        raise Exception("Invalid number of arguments!")
+    names = []
+    values = []
+    for aaa in range(0, count, 2):
+        val = arguments[aaa + 1]
+        if arguments[aaa] is None or val is None:
+            continue
+        if type(val) is not str:
+            val = arg_value(val)
+        for char in _ELEMENTTREE_CHARS:
+            if char in val:
+                return encode_command_xml(command_name, arguments)
+        names.append(arguments[aaa])
+        values.append(_escape(val))
+    key = (command_name, tuple(names), count > 0)
+    template = _templates.get(key) or _template(key)
+    # like ElementTree: us-ascii, the other characters as character references
+    return (template % tuple(values)).encode("ascii", "xmlcharrefreplace")
+
+
+def _same(value):
+    return value
+
+
+def _status(value):
+    return value == "1"
+
+
+def _null(value):
+    return None
+
+
+def _datetime(value):
+    return datetime.strptime(value, FP_DATETIME_FORMAT)
+
+
+# Type of a <Res> -> conversion of its Value
+_CONVERTERS = {
+    "Text": _same,
+    "Number": int,
+    "Decimal": float,
+    "Option": _same,
+    "DateTime": _datetime,
+    "Base64": base64.b64decode,
+    "Decimal_with_format": float,
+    "Decimal_plus_80h": float,
+    "Status": _status,
+    "Null": _null,
+}
+_SKIPPED_TYPES = frozenset(("Reserve", "OptionHardcoded"))
+
+
+def decode_result(res_root):
+    """The result of a command from its <Res> answer: None, one value or the list of the values."""
+    props = res_root.findall("Res")
+    result_obj = []
+    last_skipped = False
+    for index, prop in enumerate(props):
+        typ = prop.get("Type")
+        last_skipped = typ in _SKIPPED_TYPES or prop.get("Name") == "Reserve"
+        if last_skipped:
+            continue
+        value = prop.get("Value")
+        convert = _CONVERTERS.get(typ)
+        if convert is not None:
+            result_obj.append(convert(value))
+        elif index == 0 and value == "@":
+            result_obj.append(None)
+        else:  # unknown typ => string
+            result_obj.append(value)
+    # as the generated library expects: a skipped last value does not count
+    count = len(props) - 1 if last_skipped else len(props)
+    if count == 0:
+        return None
+    elif count == 1:
+        return result_obj[0]
+    else:
+        return result_obj
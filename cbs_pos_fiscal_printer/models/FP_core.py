@@ -1,38 +1,70 @@
 #!/usr/bin/env python
 #  -*- coding: utf-8 -*-
 """Tremol fiscal printer python core module."""
-from datetime import datetime
-from enum import Enum
+from contextlib import contextmanager
 import xml.etree.ElementTree as XML
-import base64
 import time
 
-try:
-    from urllib2 import urlopen, Request
-except Exception:
-    from urllib.request import urlopen, Request
+from . import FP_codec, FP_metrics, FP_transport
+
+# headers of the requests to ZfpLab server
+HEADERS = {"Content-Type": "text/plain",
+           "Keep-Alive": "timeout=60000",
+           "Connection": "keep-alive",
+           "Accept-Charset": "ISO-8859-1,utf-8;q=0.7,*;q=0.7"}
+
+
+def throw_on_server_error(res_root):
+    """Raises the ServerException of an answer of ZfpLab server with an error."""
+    res_code = int(res_root.get("Code"))
+    if res_code != 0:
+        err_node = res_root.find("Err")
+        # source = err_node.get("Source");
+        err_msg = err_node.find("Message").text
+        if res_code == 40:
+            ste1 = err_node.get("STE1")
+            ste2 = err_node.get("STE2")
+            raise ServerException(err_msg, res_code, int(ste1, 16), int(ste2, 16))
+        else:
+            raise ServerException(err_msg, res_code)
+
+
+def parse_answer(status, data):
+    """The parsed answer (http status, body) of ZfpLab server; raises ServerException if it is an error."""
+    try:
+        if status != 200:
+            raise Exception("HTTP code " + str(status))
+        if not data:
+            raise ServerException("Server response missing", SErrorType.ServerResponseMissing)
+        xml_parsed = XML.fromstring(data)
+        throw_on_server_error(xml_parsed)
+        return xml_parsed
+    except ServerException as fpe:
+        raise fpe
+    except Exception as ex:
+        raise ServerException("Server connection error (" + str(ex) + ")", SErrorType.ServerConnectionError)
 
 
 class FP_core:
     """Tremol fiscal printer python core library."""
     _timestamp = 0
     __coreVersion = '1.0.0.4'
-    __fp_datetime_format = "%d-%m-%Y %H:%M:%S"
-    __lab_ip = "localhost"
-    __lab_port = 4444
-    __lab_url = "http://localhost:4444/"
-    __w = False
-    __ok = False
-    __hdrs = {"Content-Type": "text/plain",
-              "Keep-Alive": "timeout=60000",
-              "Connection": "keep-alive",
-              "Accept-Charset": "ISO-8859-1,utf-8;q=0.7,*;q=0.7"}
-
-    @staticmethod
-    def __range_with_step(start, end, step):
-        while start < end:
-            yield start
-            start += step
+    # ZfpLab server url -> does it accept a <Commands> list in one request
+    _batch_support = {}
+    __hdrs = HEADERS
+
+    def __init__(self):
+        # the state of a client is only its own: FP objects of different printers can be used
+        # from different threads; one FP object must be used by one thread at a time (see FP_registry)
+        self.__lab_ip = "localhost"
+        self.__lab_port = 4444
+        self.__lab_url = "http://localhost:4444/"
+        self.__w = False
+        self.__ok = False
+        self.__batch = None
+        self.__text_block = None
+        self.__connect_timeout = FP_transport.DEFAULT_CONNECT_TIMEOUT
+        self.__read_timeout = FP_transport.DEFAULT_READ_TIMEOUT
 
     @staticmethod
     def __string_equal_true(text):
@@ -40,71 +72,11 @@ class FP_core:
 
     def __send_req(self, my_url, xml_text=None):
         try:
-            request_post = Request(my_url, data=xml_text, headers=self.__hdrs)
-            req = urlopen(request_post)
-            if req.code != 200:
-                raise Exception("HTTP code " + str(req.code))
-            lines = req.readlines()
-            req.close()
-            if not lines:
-                raise ServerException("Server response missing", SErrorType.ServerResponseMissing)
-            xml_parsed = XML.fromstringlist(lines)
-            self.__throwOnServerError(xml_parsed)
-            return xml_parsed
-        except ServerException as fpe:
-            raise fpe
+            status, data = FP_transport.send(my_url, xml_text, self.__hdrs,
+                                             self.__connect_timeout, self.__read_timeout)
         except Exception as ex:
             raise ServerException("Server connection error (" + str(ex) + ")", SErrorType.ServerConnectionError)
-
-    def __analyzeResponse(self, res_root):
-        """Analyzes the response from the FP"""
-        props = res_root.findall("Res")
-        length = len(props)
-        result_obj = []
-        ppp = 0
-        for ppp in range(0, length):
-            prop = props[ppp]
-            typ = prop.get("Type")
-            name = prop.get("Name")
-            value = prop.get("Value")
-            if name == "Reserve" or typ == "Reserve" or typ == "OptionHardcoded":
-                continue  # SKIP
-            if typ == "Text":
-                result_obj.append(value)
-            elif typ == "Number":
-                result_obj.append(int(value))
-            elif typ == "Decimal":
-                result_obj.append(float(value))
-            elif typ == "Option":
-                result_obj.append(value)
-            elif typ == "DateTime":
-                result_obj.append(datetime.strptime(value, self.__fp_datetime_format))
-            elif typ == "Base64":
-                result_obj.append(base64.b64decode(value))
-            elif typ == "Decimal_with_format":
-                result_obj.append(float(value))
-            elif typ == "Decimal_plus_80h":
-                result_obj.append(float(value))
-            elif typ == "Status":
-                if value == "1":
-                    result_obj.append(True)
-                else:
-                    result_obj.append(False)
-            elif typ == "Null":
-                result_obj.append(None)
-            elif ppp == 0 and value == "@":
-                result_obj.append(None)
-            else:  # unknown typ => string
-                result_obj.append(value)
-            ppp += 1
-        # self.__w = False # в do
-        if ppp == 0:
-            return None
-        elif ppp == 1:
-            # return result_obj[name]
-            return result_obj[0]
-        else:
-            return result_obj
+        return parse_answer(status, data)
 
     def __checkVersion(self, res_root):
         self.__ok = False
@@ -127,51 +99,25 @@ class FP_core:
 
     def __throwOnServerError(self, res_root):
         """Checks for error from the server"""
-        res_code = int(res_root.get("Code"))
-        if res_code != 0:
-            err_node = res_root.find("Err")
-            # source = err_node.get("Source");
-            err_msg = err_node.find("Message").text
-            if res_code == 40:
-                ste1 = err_node.get("STE1")
-                ste2 = err_node.get("STE2")
-                raise ServerException(err_msg, res_code, int(ste1, 16), int(ste2, 16))
-            else:
-                raise ServerException(err_msg, res_code)
+        throw_on_server_error(res_root)
 
     def do(self, command_name, *arguments):
         """Sends command to ZfpLab server"""
+        if self.__text_block is not None:
+            if command_name == "PrintText" and len(arguments) == 2 and arguments[1] is not None:
+                self.__text_block.lines.append(FP_codec.arg_value(arguments[1]))
+                return None
+            if self.__text_block.lines:
+                self.__print_text_block()
         self.__w = True
         try:
-            count = len(arguments)
-            if count > 0 and count % 2 == 1:
-                raise Exception("Invalid number of arguments!")
-            root = XML.fromstringlist("<Command></Command>")
-            root.set("Name", command_name)
-            if count > 0:
-                args = XML.SubElement(root, "Args")
-                for aaa in FP_core.__range_with_step(0, count, 2):
-                    if arguments[aaa] is None or arguments[aaa+1] is None:
-                        continue
-                    arg = XML.SubElement(args, "Arg")
-                    arg.set("Name", arguments[aaa])
-                    val = arguments[aaa + 1]
-                    if isinstance(val, str):
-                        arg.set("Value", val)
-                    elif isinstance(val, Enum):
-                        arg.set("Value", val.value)
-                    elif isinstance(val, datetime):
-                        dtt = val.strftime(self.__fp_datetime_format)
-                        arg.set("Value", dtt)
-                    elif isinstance(val, bytearray):
-                        b64 = base64.b64encode(val)
-                        arg.set("Value", b64.decode("utf-8"))
-                    else:
-                        arg.set("Value", str(val))
-
-            text = XML.tostring(root)
-            resp = self.__send_req(self.__lab_url, text)
-            return self.__analyzeResponse(resp)
+            text = FP_codec.encode_command(command_name, arguments)
+            if self.__batch is not None:
+                self.__batch.commands.append((command_name, text))
+                return None
+            with FP_metrics.command(command_name):
+                resp = self.__send_req(self.__lab_url, text)
+            return FP_codec.decode_result(resp)
         except ServerException as fpe:
             raise fpe
         except Exception as ex:
@@ -179,6 +125,100 @@ class FP_core:
         finally:
             self.__w = False
 
+    @contextmanager
+    def batch(self):
+        """Queues the commands given in the with block and sends them to ZfpLab server in one request
+        at the end of the block. The queued commands return None, their results are in batch.results.
+        If the block raises, nothing is sent. A failed command raises ServerException with its
+        command_name and batch_index; the commands after it are not executed."""
+        if self.__batch is not None:  # nested, the outer block sends
+            yield self.__batch
+            return
+        batch = self.__batch = __FPBatch__()
+        try:
+            yield batch
+        finally:
+            self.__batch = None
+        self.__w = True
+        try:
+            self.__flush_batch(batch)
+        finally:
+            self.__w = False
+
+    @contextmanager
+    def text_block(self, line_len, max_symbols):
+        """Coalesces the consecutive PrintText given in the with block: their lines are sent in as few
+        PrintText of at most max_symbols as possible, each line padded to a multiple of line_len (the
+        printed line width) so that the device wraps the text where the lines ended. Another command
+        prints first the text before it. If the block raises, the waiting text is not sent."""
+        if self.__text_block is not None or line_len < 1 or max_symbols < 2 * line_len:  # nested, or nothing to pack
+            yield
+            return
+        self.__text_block = __FPTextBlock__(line_len, max_symbols)
+        try:
+            yield
+            self.__print_text_block()
+        finally:
+            self.__text_block = None
+
+    def __print_text_block(self):
+        block = self.__text_block
+        lines, block.lines = block.lines, []
+        self.__text_block = None  # the packed texts are sent by do()
+        try:
+            for text in block.pack(lines):
+                self.do("PrintText", "Text", text)
+        finally:
+            self.__text_block = block
+
+    def __flush_batch(self, batch):
+        """Sends the queued commands; one by one if the server does not accept batches."""
+        if not batch.commands:
+            return
+        if FP_core._batch_support.get(self.__lab_url, True):
+            text = b"<Commands>" + b"".join(command for _name, command in batch.commands) + b"</Commands>"
+            with FP_metrics.command("batch", len(batch.commands)):
+                try:
+                    status, data = FP_transport.send(self.__lab_url, text, self.__hdrs,
+                                                     self.__connect_timeout, self.__read_timeout)
+                    res_root = XML.fromstring(data) if status == 200 and data else None
+                except Exception as ex:
+                    raise ServerException("Server connection error (" + str(ex) + ")",
+                                          SErrorType.ServerConnectionError)
+                if res_root is not None and res_root.tag == "Commands":
+                    FP_core._batch_support[self.__lab_url] = True
+                    for res in res_root.findall("Res"):
+                        self.__batch_result(batch, res)
+                    if len(batch.results) != len(batch.commands):
+                        raise ServerException("Server response missing", SErrorType.ServerResponseMissing)
+                    return
+                if res_root is not None and res_root.tag == "Res" and 30 <= int(res_root.get("Code", 0)) <= 35:
+                    # the device is unreachable or the server busy with another client: nothing was executed,
+                    # the server accepts batches
+                    self.__throwOnServerError(res_root)
+            # an older server answers with an error to the unknown <Commands> and executes nothing
+            FP_core._batch_support[self.__lab_url] = False
+        for name, command in batch.commands:
+            try:
+                with FP_metrics.command(name):
+                    res = self.__send_req(self.__lab_url, command)
+            except ServerException as fpe:
+                self.__batch_error(batch, fpe)
+            batch.results.append(FP_codec.decode_result(res))
+
+    def __batch_result(self, batch, res):
+        try:
+            self.__throwOnServerError(res)
+        except ServerException as fpe:
+            self.__batch_error(batch, fpe)
+        batch.results.append(FP_codec.decode_result(res))
+
+    @staticmethod
+    def __batch_error(batch, fpe):
+        fpe.batch_index = len(batch.results)
+        fpe.command_name = batch.commands[fpe.batch_index][0]
+        raise fpe
+
     def getVersionCore(self):
         """Returns the verion of the core library"""
         return self.__coreVersion
@@ -206,13 +246,17 @@ class FP_core:
         """Sets ZfpLab server settings."""
         self.__lab_ip = ipaddress
         self.__lab_port = tcp_port
-        if not self.__lab_ip.startswith("http"):
-            self.__lab_url = "http://"
-        self.__lab_url += self. __lab_ip
+        url = self.__lab_ip if self.__lab_ip.startswith("http") else "http://" + self.__lab_ip
         if self.__lab_port > 0:
-            self.__lab_url += ":" + str(self.__lab_port)
-        if not self.__lab_url.endswith("/"):
-            self.__lab_url += "/"
+            url += ":" + str(self.__lab_port)
+        if not url.endswith("/"):
+            url += "/"
+        self.__lab_url = url
+
+    def serverSetTimeouts(self, connect_timeout, read_timeout):
+        """Sets the seconds to wait for connecting to the ZfpLab server and for its answer."""
+        self.__connect_timeout = connect_timeout
+        self.__read_timeout = read_timeout
 
     def serverFindDevice(self):
         """Finds device connected on USB or serial port."""
@@ -357,6 +401,45 @@ class FP_core:
             self.__w = False
 
 
+class __FPBatch__:
+    """Commands queued by FP_core.batch() and, after sending, their results."""
+    def __init__(self):
+        self.commands = []
+        self.results = []
+
+
+class __FPTextBlock__:
+    """Text lines queued by FP_core.text_block()."""
+    def __init__(self, line_len, max_symbols):
+        self.line_len = line_len
+        self.max_symbols = max_symbols
+        self.lines = []
+
+    def width(self, line):
+        """Symbols that line takes on paper: a multiple of line_len."""
+        return max(-(-len(line) // self.line_len), 1) * self.line_len
+
+    def pack(self, lines):
+        """The texts of the PrintText commands that print lines."""
+        texts = []
+        command = []
+        command_len = 0
+        for line in lines:
+            line = line or " "  # a last empty line would not be printed after the padding
+            if command and command_len + len(line) > self.max_symbols:
+                texts.append(self.join(command))
+                command = []
+                command_len = 0
+            command.append(line)
+            command_len += self.width(line)
+        if command:
+            texts.append(self.join(command))
+        return texts
+
+    def join(self, lines):
+        return "".join(line.ljust(self.width(line)) for line in lines[:-1]) + lines[-1]
+
+
 class __FPServerSettings__:
     """ZfpLab server settings."""
     ipaddress = "localhost"
@@ -427,11 +510,14 @@ class ServerException(Exception):
     :type ste1: int\n
     :param ste2: int if code==40 or None\n
     :type ste2: int\n
+    command_name and batch_index tell the failed command of a FP_core.batch()
     """
     def __init__(self, message, code, ste1=None, ste2=None):
         super(ServerException, self).__init__(message)
         self.code = code
         self.ste1 = ste1
         self.ste2 = ste2
+        self.command_name = None
+        self.batch_index = None
         self.isFiscalPrinterError = (code == SErrorType.FPException)
 
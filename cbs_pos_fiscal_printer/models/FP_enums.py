@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tremol fiscal printer python module: the values of the Option parameters of FP commands."""
+from enum import Enum
+
+
+class Enums:
+    """Enumerations"""
+
+    class OptionZeroing(Enum):
+        Not_zeroing = u'X'
+        Zeroing = u'Z'
+
+    class OptionDecimalPointPosition(Enum):
+        Fractions = u'2'
+        Whole_numbers = u'0'
+
+    class OptionPrintLogo(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionAutoOpenDrawer(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionAutoCut(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionExternalDispManagement(Enum):
+        Auto = u'0'
+        Manual = u'1'
+
+    class OptionEnableCurrency(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionUSBHost(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionVATClass(Enum):
+        Alte_taxe = u'F'
+        VAT_Class_A = u'A'
+        VAT_Class_B = u'B'
+        VAT_Class_C = u'C'
+        VAT_Class_D = u'D'
+        VAT_Class_E = u'E'
+
+    class OptionDepPrice(Enum):
+        Free_price_disabled = u'0'
+        Free_price_disabled_for_single_transaction = u'4'
+        Free_price_enabled = u'1'
+        Free_price_enabled_for_single_transaction = u'5'
+        Limited_price = u'2'
+        Limited_price_for_single_transaction = u'6'
+
+    class OptionPrice(Enum):
+        Free_price_is_disable_valid_only_programmed_price = u'0'
+        Free_price_is_enable = u'1'
+        Limited_price = u'2'
+
+    class OptionTransaction(Enum):
+        Active_Single_transaction_in_receipt = u'1'
+        Inactive_default_value = u'0'
+
+    class OptionTypeVATregistration(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionReportStorage(Enum):
+        Printing = u'J1'
+        Storage_in_External_SD_card_memory = u'J4'
+        Storage_in_External_USB_Flash_memory = u'J2'
+
+    class OptionType(Enum):
+        Defined_from_the_device = u'2'
+        Over_subtotal = u'1'
+        Over_transaction_sum = u'0'
+
+    class OptionDisplay(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionCommunicationModule(Enum):
+        GSM = u'0'
+        LAN = u'1'
+
+    class OptionSign(Enum):
+        Correction = u'-'
+        Sale = u'+'
+
+    class OptionPaymentType(Enum):
+        Payment_0 = u'0'
+        Payment_1 = u'1'
+        Payment_2 = u'2'
+        Payment_3 = u'3'
+        Payment_4 = u'4'
+        Payment_5 = u'5'
+        Payment_6 = u'6'
+        Payment_7 = u'7'
+        Payment_8 = u'8'
+        Payment_9 = u'9'
+
+    class OptionStorage(Enum):
+        Storage_in_External_SD_card_memory = u'4'
+        Storage_in_External_USB_Flash_memory = u'2'
+
+    class OptionQuantityType(Enum):
+        Availability_of_PLU_stock_is_not_monitored = u'0'
+        Disable_negative_quantity = u'1'
+        Enable_negative_quantity = u'2'
+
+    class OptionCustomerReceiptPrintType(Enum):
+        Buffered_printing = u'5'
+        Postponed_printing = u'3'
+        Step_by_step_printing = u'1'
+
+    class OptionCurrencySaleRcpPrintType(Enum):
+        Postponed_printing = u'2'
+        Step_by_step_printing = u'0'
+
+    class OptionDhcpStatus(Enum):
+        Disabled = u'0'
+        Enabled = u'1'
+
+    class OptionAddressType(Enum):
+        DNS_address = u'5'
+        Gateway_address = u'4'
+        IP_address = u'2'
+        Subnet_Mask = u'3'
+
+    class OptionProfileType(Enum):
+        Profile_0 = u'0'
+        Profile_1 = u'1'
+
+    class OptionHeaderLine(Enum):
+        Header_1 = u'1'
+        Header_2 = u'2'
+        Header_3 = u'3'
+        Header_4 = u'4'
+        Header_5 = u'5'
+        Header_6 = u'6'
+        Header_7 = u'7'
+        Header_8 = u'8'
+
+    class OptionTCPAutoStart(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionUsedModule(Enum):
+        LAN = u'1'
+        WiFi = u'2'
+
+    class OptionPrinting(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionCodeType(Enum):
+        CODABAR = u'6'
+        CODE_128 = u'I'
+        CODE_39 = u'4'
+        CODE_93 = u'H'
+        EAN_13 = u'2'
+        EAN_8 = u'3'
+        ITF = u'5'
+        UPC_A = u'0'
+        UPC_E = u'1'
+
+    class OptionStorageReport(Enum):
+        To_PC = u'j0'
+        To_SD_card = u'j4'
+        To_USB_Flash_Drive = u'j2'
+
+    class OptionLAN(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionWiFi(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionGPRS(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionBT(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionSingleTransaction(Enum):
+        Active_Single_transaction_in_receipt = u'1'
+        Inactive_default_value = u'0'
+
+    class OptionIsReceiptOpened(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionForbiddenVoid(Enum):
+        allowed = u'0'
+        forbidden = u'1'
+
+    class OptionVATinReceipt(Enum):
+        with_printing = u'0'
+        without_printing = u'1'
+
+    class OptionReceiptFormat(Enum):
+        Brief = u'0'
+        Detailed = u'1'
+
+    class OptionInitiatedPayment(Enum):
+        initiated_payment = u'0'
+        not_initiated_payment = u'1'
+
+    class OptionFinalizedPayment(Enum):
+        finalized_payment = u'0'
+        not_finalized_payment = u'1'
+
+    class OptionPowerDownInReceipt(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionClientReceipt(Enum):
+        invoice_client_receipt = u'1'
+        standard_receipt = u'0'
+
+    class OptionChangeType(Enum):
+        Change_In_Cash = u'0'
+        Change_In_Currency = u'2'
+        Same_As_The_payment = u'1'
+
+    class OptionSendAfterZ(Enum):
+        No = u'0'
+        Yes = u'1'
+
+    class OptionFiscalReceiptPrintType(Enum):
+        Buffered_Printing = u'4'
+        Postponed_printing = u'2'
+        Step_by_step_printing = u'0'
+
+    class OptionPaymentNum(Enum):
+        Payment_1 = u'1'
+        Payment_2 = u'2'
+        Payment_3 = u'3'
+        Payment_4 = u'4'
+        Payment_5 = u'5'
+        Payment_6 = u'6'
+        Payment_7 = u'7'
+        Payment_8 = u'8'
+        Payment_9 = u'9'
+
+    class OptionFooterLine(Enum):
+        Footer_1 = u'1'
+        Footer_2 = u'2'
+        Footer_3 = u'3'
+
+    class OptionBTstatus(Enum):
+        Disabled = u'0'
+        Enabled = u'1'
+
+    class OptionCurrencyBuyingRcpPrintType(Enum):
+        Postponed_printing = u':'
+        Step_by_step_printing = u'8'
+
+    class OptionNonFiscalPrintType(Enum):
+        Postponed_printing = u'1'
+        Step_by_step_printing = u'0'
+
+    class OptionRecieptXmlStorage(Enum):
+        Storage_in_External_SD_card_memory = u'JX'
+        Storage_in_External_USB_Flash_memory = u'Jx'
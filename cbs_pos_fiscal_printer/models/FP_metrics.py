@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+#  -*- coding: utf-8 -*-
+"""Timing of the requests sent to ZfpLab servers, collected per thread.
+
+FP_transport notes the connection time and the bytes of each request, FP_core the wall time and the error
+of the command (or of the batch of commands) that sent it. Nothing is measured unless the thread is inside
+recording(); the caller stores the samples, aggregated per command (see aggregate()).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import NamedTuple
+
+# upper bounds (milliseconds) of the histogram buckets; one more bucket has no bound
+BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_local = threading.local()
+
+
+class Sample(NamedTuple):
+    command: str  # command name, 'batch' for the commands sent in one request by FP_core.batch()
+    ms: float  # from sending the request to having its answer
+    connect_ms: float  # of ms, opening the connection to the server (0 on a pooled connection)
+    bytes_out: int
+    bytes_in: int
+    error: str  # '' if ok, else error_code() of the exception
+    commands: int = 1  # commands sent in the request
+
+
+class CommandStats:
+    """Aggregate of the samples of one command: counts, sums and the histogram of the wall times."""
+    __slots__ = ('count', 'error_count', 'last_error', 'total_ms', 'connect_ms', 'max_ms', 'bytes_out',
+                 'bytes_in', 'buckets')
+
+    def __init__(self):
+        self.count = self.error_count = self.bytes_out = self.bytes_in = 0
+        self.total_ms = self.connect_ms = self.max_ms = 0.0
+        self.last_error = ''
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, sample):
+        self.count += 1
+        if sample.error:
+            self.error_count += 1
+            self.last_error = sample.error
+        self.total_ms += sample.ms
+        self.connect_ms += sample.connect_ms
+        self.max_ms = max(self.max_ms, sample.ms)
+        self.bytes_out += sample.bytes_out
+        self.bytes_in += sample.bytes_in
+        self.buckets[bucket(sample.ms)] += 1
+
+
+def bucket(ms):
+    """Index in CommandStats.buckets of a wall time."""
+    for index, bound in enumerate(BUCKETS_MS):
+        if ms <= bound:
+            return index
+    return len(BUCKETS_MS)
+
+
+def error_code(ex):
+    """'code' of a ServerException, 'code:STE1:STE2' of an error of the device, else the exception class."""
+    code = getattr(ex, 'code', None)
+    if code is None:
+        return type(ex).__name__
+    if getattr(ex, 'ste1', None) is not None:
+        return f"{code}:{ex.ste1:02X}:{ex.ste2:02X}"
+    return str(code)
+
+
+@contextmanager
+def recording():
+    """Collects in the yielded list the samples of the requests sent by this thread in the block.
+    A nested block yields None: its samples go to the list of the outer block."""
+    if getattr(_local, 'samples', None) is not None:
+        yield None
+        return
+    samples = _local.samples = []
+    try:
+        yield samples
+    finally:
+        _local.samples = None
+
+
+def note_transport(connect_ms, bytes_out, bytes_in):
+    """Called by FP_transport for each request (a retried one is noted twice)."""
+    if getattr(_local, 'samples', None) is None:
+        return
+    pending = getattr(_local, 'pending', None)
+    if pending is not None:
+        pending[0] += connect_ms
+        pending[1] += bytes_out
+        pending[2] += bytes_in
+
+
+@contextmanager
+def command(name, commands=1):
+    """Measures the block that sends the request(s) of the command name."""
+    samples = getattr(_local, 'samples', None)
+    if samples is None:
+        yield
+        return
+    pending = _local.pending = [0.0, 0, 0]
+    error = ''
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as ex:
+        error = error_code(ex)
+        raise
+    finally:
+        _local.pending = None
+        samples.append(Sample(name, (time.perf_counter() - start) * 1000, pending[0], pending[1], pending[2],
+                              error, commands))
+
+
+def aggregate(samples):
+    """{command: CommandStats} of the samples."""
+    res = {}
+    for sample in samples:
+        stats = res.get(sample.command)
+        if stats is None:
+            stats = res[sample.command] = CommandStats()
+        stats.add(sample)
+    return res
+
+
+def breakdown(samples):
+    """The samples as text, one request per line, in the order they were sent."""
+    lines = []
+    for sample in samples:
+        name = f"{sample.command}({sample.commands})" if sample.commands != 1 else sample.command
+        line = f"{name}: {sample.ms:.0f} ms"
+        if sample.connect_ms:
+            line += f" (connect {sample.connect_ms:.0f} ms)"
+        line += f", {sample.bytes_out}/{sample.bytes_in} bytes"
+        if sample.error:
+            line += f", error {sample.error}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(rows):
+    """Prometheus text exposition of rows [(labels dict, CommandStats)]: the wall time histogram (cumulative
+    buckets in milliseconds), the connection time, the bytes and the errors of each command."""
+    out = [
+        "# HELP cbs_fiscal_command_ms Wall time of the fiscal printer commands.",
+        "# TYPE cbs_fiscal_command_ms histogram",
+    ]
+    totals = []
+    for labels, stats in rows:
+        text = ",".join(f'{key}="{_label(value)}"' for key, value in labels.items())
+        cumulative = 0
+        for bound, count in zip(BUCKETS_MS + ('+Inf',), stats.buckets):
+            cumulative += count
+            out.append(f'cbs_fiscal_command_ms_bucket{{{text},le="{bound}"}} {cumulative}')
+        out.append(f"cbs_fiscal_command_ms_sum{{{text}}} {stats.total_ms:.3f}")
+        out.append(f"cbs_fiscal_command_ms_count{{{text}}} {stats.count}")
+        totals.append((text, stats))
+    for name, help_text, attr in (
+            ("cbs_fiscal_command_connect_ms_total", "Time spent opening connections to the ZfpLab server.",
+             'connect_ms'),
+            ("cbs_fiscal_command_errors_total", "Fiscal printer commands that failed.", 'error_count'),
+            ("cbs_fiscal_command_bytes_out_total", "Bytes sent to the ZfpLab server.", 'bytes_out'),
+            ("cbs_fiscal_command_bytes_in_total", "Bytes received from the ZfpLab server.", 'bytes_in')):
+        out.append(f"# HELP {name} {help_text}")
+        out.append(f"# TYPE {name} counter")
+        for text, stats in totals:
+            out.append(f"{name}{{{text}}} {getattr(stats, attr)}")
+    return "\n".join(out) + "\n"
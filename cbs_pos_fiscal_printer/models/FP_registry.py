@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#  -*- coding: utf-8 -*-
+"""Registry of the fiscal printer clients of the odoo worker process.
+
+A client is the FP object of one fiscal device reached through one ZfpLab server, kept for
+reuse together with the handshake it verified. Its lock serializes the use of that device (the
+commands of a receipt must not be interleaved with the ones of another receipt). The lock is the
+one of the ZfpLab server: a server works with one device at a time, so the clients of the devices
+of one server are used one after the other (see fiscal_arbiter), while the clients of different
+servers are used in parallel by different threads.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+from . import FP_metrics
+from .FP import FP
+
+# seconds a thread waits for a device used by another thread (printing another receipt)
+DEVICE_LOCK_TIMEOUT = 120
+
+_clients = {}
+_clients_lock = threading.Lock()
+# lock of each ZfpLab server, reentrant: printing a receipt can print another one (the non fiscal copy)
+_server_locks = {}
+
+
+class DeviceBusyError(Exception):
+    """The device was used by another thread for more than the lock timeout."""
+
+
+class FPClient:
+    """FP of one (server, device) pair, the lock of the server and the time of its last handshake."""
+
+    def __init__(self, server, device):
+        self.server = server  # (host, port) of the ZfpLab server
+        self.device = device  # ('tcp', ip, port, password) or ('serial', com, baud)
+        self.fp = FP()
+        self.fp.serverSetSettings(*server)
+        self.lock = _server_lock(server)
+        self.verified_at = None  # time.monotonic() of the last successful handshake
+
+    def is_verified(self, ttl):
+        return self.verified_at is not None and time.monotonic() - self.verified_at < ttl
+
+    def set_verified(self):
+        self.verified_at = time.monotonic()
+
+    def invalidate(self):
+        self.verified_at = None
+
+    @contextmanager
+    def use(self, timeout=DEVICE_LOCK_TIMEOUT):
+        """Yields the FP, owned by the calling thread until the end of the block."""
+        if not self.lock.acquire(timeout=timeout):
+            raise DeviceBusyError(f"The fiscal device {self.device[:3]} of the ZfpLab server {self.server} "
+                                  f"(or the server) is used by another print for more than {timeout} seconds.")
+        try:
+            yield self.fp
+        finally:
+            self.lock.release()
+
+
+def _server_lock(server):
+    "the lock of the clients of the ZfpLab server (host, port)"
+    return _server_locks.setdefault(server, threading.RLock())  # atomic
+
+
+def get_client(server, device):
+    """Returns the process wide client of device at the ZfpLab server (host, port)."""
+    key = (server, device)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = FPClient(server, device)
+    return client
+
+
+def settings_device(settings):
+    """The device key (see FPClient.device) of the device settings read from a ZfpLab server."""
+    if settings.is_working_on_tcp:
+        return ('tcp', settings.ipaddress, settings.tcp_port, settings.password or None)
+    return ('serial', settings.serial_port, settings.baud_rate)
+
+
+def connect_device(fp, device):
+    """Makes the ZfpLab server of fp work with device. Its settings are sent only if the server works with
+    another device: each sending makes the server reconnect to the device, interrupting the clients using it.
+    Returns True if they were sent. Both requests are measured (FP_metrics), the sending as
+    'serverSetDeviceSettings': its count is the count of the device reconnections."""
+    with FP_metrics.command('serverGetDeviceSettings'):
+        connected = settings_device(fp.serverGetDeviceSettings())
+    if connected == device:
+        return False
+    with FP_metrics.command('serverSetDeviceSettings'):
+        if device[0] == 'tcp':
+            _tcp, ipaddress, tcp_port, password = device
+            fp.serverSetDeviceTcpSettings(ipaddress, tcp_port, password or "")  # "": no password, as read
+        else:
+            fp.serverSetDeviceSerialSettings(*device[1:])
+    return True
+
+
+def invalidate(server, device):
+    """Forgets the handshake of the device, if it has a client."""
+    client = _clients.get((server, device))
+    if client is not None:
+        client.invalidate()
+
+
+def clear():
+    """Forgets all the clients (used by tests)."""
+    with _clients_lock:
+        _clients.clear()
+        _server_locks.clear()
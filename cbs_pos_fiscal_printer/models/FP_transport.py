@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+#  -*- coding: utf-8 -*-
+"""Keep-alive HTTP transport used by FP_core to talk with ZfpLab servers.
+
+One pool of idle http.client connections is kept per ZfpLab server (host, port) and
+shared by all the FP objects (and threads) of the odoo worker process, so a receipt
+does not pay a TCP connect/teardown for every command it sends.
+"""
+import http.client
+import select
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+from . import FP_metrics
+
+DEFAULT_CONNECT_TIMEOUT = 2.0
+DEFAULT_READ_TIMEOUT = 30.0
+MAX_IDLE_CONNECTIONS = 4
+
+# errors that, sending on a reused (idle) keep-alive socket, mean that the server closed it meanwhile
+_STALE_CONNECTION_ERRORS = (ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+# the same, reading the answer: the server may have executed the request
+_STALE_ANSWER_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine) + _STALE_CONNECTION_ERRORS
+
+
+def _dropped(conn):
+    """An idle keep-alive connection that the server closed (readable: end of file, nothing is expected)."""
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class ZfpConnectionPool:
+    """Idle keep-alive connections to one ZfpLab server."""
+
+    def __init__(self, host, port, max_idle=MAX_IDLE_CONNECTIONS):
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    def _acquire(self, connect_timeout):
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+                if conn is None:
+                    self.connections_opened += 1
+                    break
+            if conn.sock is not None and not _dropped(conn):
+                return conn, True
+            conn.close()
+        return http.client.HTTPConnection(self.host, self.port, timeout=connect_timeout), False
+
+    def _release(self, conn):
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method, path, body=None, headers=None,
+                connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT):
+        """Sends one request and returns (http status, response body).
+        A reused connection that was dropped by the server is reopened once if sending the request failed:
+        the server did not get it. A failure after sending is raised to the caller, unless it is a GET (it only
+        reads): a command may have been executed (printed) and is not sent twice."""
+        while True:
+            conn, reused = self._acquire(connect_timeout)
+            connect_ms, data = 0.0, b""
+            try:
+                try:
+                    if conn.sock is None:
+                        conn.timeout = connect_timeout
+                        start = time.perf_counter()
+                        conn.connect()
+                        connect_ms = (time.perf_counter() - start) * 1000
+                        # small request/answer messages: do not wait for delayed ACKs
+                        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    conn.sock.settimeout(read_timeout)
+                    conn.request(method, path, body=body, headers=headers or {})
+                except _STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    if reused:
+                        continue
+                    raise
+                try:
+                    resp = conn.getresponse()
+                    data = resp.read()
+                except _STALE_ANSWER_ERRORS:
+                    conn.close()
+                    if reused and method == "GET":
+                        continue
+                    raise
+            except Exception:
+                conn.close()
+                raise
+            finally:
+                FP_metrics.note_transport(connect_ms, len(body) if body else 0, len(data))
+            with self._lock:
+                self.requests_sent += 1
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return resp.status, data
+
+    def clear(self):
+        """Closes all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def get_pool(host, port):
+    """Returns the process wide pool for the ZfpLab server host:port."""
+    key = (host, port)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = ZfpConnectionPool(host, port)
+    return pool
+
+
+def send(url, body=None, headers=None, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+         read_timeout=DEFAULT_READ_TIMEOUT):
+    """POSTs body (or GETs if body is None) to url through the pool of its server."""
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    pool = get_pool(parts.hostname, parts.port or 80)
+    return pool.request("GET" if body is None else "POST", path, body, headers,
+                        connect_timeout=connect_timeout, read_timeout=read_timeout)
+
+
+def clear_pools():
+    """Closes the idle connections of all the pools (used by tests and after a fork)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.clear()
@@ -1,3 +1,14 @@
 from . import pos_config
 from . import pos_order
 from . import product_product
+from . import cbs_fiscal_print_job
+from . import cbs_pos_tax_vat_class
+from . import cbs_fiscal_plu
+from . import cbs_fiscal_report_run
+from . import cbs_fiscal_counter_snapshot
+from . import cbs_fiscal_receipt_sequence_issue
+from . import cbs_fiscal_device_status
+from . import cbs_fiscal_metrics
+from . import cbs_fiscal_receipt_journal
+from . import cbs_fiscal_ej_export
+from . import cbs_fiscal_server_device
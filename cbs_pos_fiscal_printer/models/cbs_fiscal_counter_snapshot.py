@@ -0,0 +1,116 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo import api, fields, models, tools
+
+SNAPSHOT_SOURCES = [('receipt', 'Fiscal receipt'), ('x_report', 'X report'), ('z_report', 'Z report')]
+
+
+class CbsFiscalCounterSnapshot(models.Model):
+    """The counters of a fiscal device read while printing a fiscal receipt or a daily report, kept to
+    reconcile the pos orders with the device without asking it again."""
+    _name = 'cbs.fiscal.counter.snapshot'
+    _description = 'Fiscal device counters'
+    _order = 'date desc, id desc'
+
+    config_id = fields.Many2one('pos.config', required=True, readonly=True, index=True, ondelete='cascade')
+    session_id = fields.Many2one('pos.session', readonly=True, ondelete='set null')
+    order_id = fields.Many2one('pos.order', readonly=True, index='btree_not_null', ondelete='set null')
+    source = fields.Selection(SNAPSHOT_SOURCES, required=True, readonly=True)
+    date = fields.Datetime(required=True, readonly=True, default=fields.Datetime.now)
+    # after a receipt (ReadLastAndTotalReceiptNum)
+    last_receipt_num = fields.Integer(readonly=True)
+    total_receipt_counter = fields.Integer(readonly=True)
+    # before a daily report, the amounts of the day it zeroes (ReadDailyReceivedSalesAmounts, ReadDailyAmountsByVAT)
+    amount_cash = fields.Float(readonly=True, digits=(16, 2), help="Payment type 0.")
+    amount_non_cash = fields.Float(readonly=True, digits=(16, 2), help="Payment types 1 to 9.")
+    amount_vat_a = fields.Float(readonly=True, digits=(16, 2))
+    amount_vat_b = fields.Float(readonly=True, digits=(16, 2))
+    amount_vat_c = fields.Float(readonly=True, digits=(16, 2))
+    amount_vat_d = fields.Float(readonly=True, digits=(16, 2))
+    amount_vat_e = fields.Float(readonly=True, digits=(16, 2))
+    amount_vat_f = fields.Float(readonly=True, digits=(16, 2))
+    # after a daily report (ReadLastDailyReportInfo)
+    last_z_report_num = fields.Integer(readonly=True)
+
+    def init(self):
+        tools.create_index(self.env.cr, 'cbs_fiscal_counter_snapshot_session_source_date_index', self._table,
+                           ['session_id', 'source', 'date'])
+
+    @api.model
+    def cbs_add(self, config, source, **vals):
+        """Stores the counters of the fiscal device of config; the session is the last one of config."""
+        session = vals.pop('session', None)
+        if session is None:
+            session = self.env['pos.session'].search([('config_id', '=', config.id)], limit=1)
+        return self.sudo().create(dict(vals, config_id=config.id, source=source, session_id=session.id))
+
+
+class CbsFiscalDayReconciliation(models.Model):
+    """Per fiscal day of a device, closed by a Z report: the totals of the fiscal receipts in odoo against the
+    counters of the device, from the stored snapshots. The receipts of the day are the ones printed by the pos
+    config after its previous Z report (snapshots in their order), whatever their pos sessions: a session can
+    span midnight, a day can have several sessions. The day not closed yet has no row."""
+    _name = 'cbs.fiscal.day.reconciliation'
+    _description = 'Fiscal device reconciliation per fiscal day'
+    _auto = False
+    _order = 'report_date desc, id desc'
+    _rec_name = 'z_report_num'
+
+    config_id = fields.Many2one('pos.config', readonly=True)
+    session_id = fields.Many2one('pos.session', readonly=True, help="Session of the Z report.")
+    z_report_num = fields.Integer("Z report", readonly=True)
+    report_date = fields.Datetime(readonly=True, help="Date of the Z report.")
+    nr_receipts = fields.Integer("Fiscal receipts", readonly=True)
+    odoo_cash = fields.Float(readonly=True, digits=(16, 2))
+    odoo_non_cash = fields.Float(readonly=True, digits=(16, 2))
+    first_receipt_num = fields.Integer(readonly=True)
+    last_receipt_num = fields.Integer(readonly=True)
+    missing_receipts = fields.Integer(
+        readonly=True, help="Receipt numbers of the device between the first and the last one of the day "
+        "without a snapshot of a receipt.")
+    device_cash = fields.Float(readonly=True, digits=(16, 2))
+    device_non_cash = fields.Float(readonly=True, digits=(16, 2))
+    cash_difference = fields.Float(readonly=True, digits=(16, 2), help="Device minus odoo.")
+    non_cash_difference = fields.Float(readonly=True, digits=(16, 2), help="Device minus odoo.")
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute("""
+            CREATE OR REPLACE VIEW cbs_fiscal_day_reconciliation AS (
+                WITH z AS (
+                    SELECT id, config_id, session_id, date, last_z_report_num, amount_cash, amount_non_cash,
+                           coalesce(lag(id) OVER (PARTITION BY config_id ORDER BY id), 0) AS previous_id
+                      FROM cbs_fiscal_counter_snapshot
+                     WHERE source = 'z_report'
+                ), day_receipts AS (
+                    SELECT z.id AS z_id, s.order_id, s.last_receipt_num
+                      FROM z
+                      JOIN cbs_fiscal_counter_snapshot s ON s.config_id = z.config_id AND s.source = 'receipt'
+                                                        AND s.id > z.previous_id AND s.id < z.id
+                ), orders AS (
+                    SELECT d.z_id, count(*) AS nr_receipts, sum(o.cbs_cash_payment) AS odoo_cash,
+                           sum(o.cbs_non_cash_payment) AS odoo_non_cash
+                      FROM (SELECT DISTINCT z_id, order_id FROM day_receipts WHERE order_id IS NOT NULL) d
+                      JOIN pos_order o ON o.id = d.order_id
+                  GROUP BY d.z_id
+                ), receipts AS (
+                    SELECT z_id, min(last_receipt_num) AS first_receipt_num,
+                           max(last_receipt_num) AS last_receipt_num,
+                           max(last_receipt_num) - min(last_receipt_num) + 1
+                               - count(DISTINCT last_receipt_num) AS missing_receipts
+                      FROM day_receipts
+                  GROUP BY z_id
+                )
+                SELECT z.id AS id, z.config_id, z.session_id, z.last_z_report_num AS z_report_num,
+                       z.date AS report_date, coalesce(o.nr_receipts, 0) AS nr_receipts,
+                       coalesce(o.odoo_cash, 0) AS odoo_cash, coalesce(o.odoo_non_cash, 0) AS odoo_non_cash,
+                       r.first_receipt_num, r.last_receipt_num, r.missing_receipts,
+                       z.amount_cash AS device_cash, z.amount_non_cash AS device_non_cash,
+                       z.amount_cash - coalesce(o.odoo_cash, 0) AS cash_difference,
+                       z.amount_non_cash - coalesce(o.odoo_non_cash, 0) AS non_cash_difference
+                  FROM z
+             LEFT JOIN orders o ON o.z_id = z.id
+             LEFT JOIN receipts r ON r.z_id = z.id
+            )
+        """)
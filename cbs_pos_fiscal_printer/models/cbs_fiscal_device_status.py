@@ -0,0 +1,53 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo import api, fields, models
+
+from .fiscal_status import STATUS_FLAGS
+
+
+class CbsFiscalDeviceStatus(models.Model):
+    """The last status of the fiscal device of a pos config, read by the heartbeat (cron) or after a daily
+    report; one row per pos config, read by the pos and before the receipts instead of the device."""
+    _name = 'cbs.fiscal.device.status'
+    _description = 'Fiscal device status'
+    _order = 'config_id'
+    _rec_name = 'config_id'
+
+    config_id = fields.Many2one('pos.config', required=True, readonly=True, ondelete='cascade')
+    state = fields.Selection([('ok', 'Ok'), ('warning', 'Warning'), ('error', 'Error'),
+                              ('unreachable', 'Unreachable')], required=True, readonly=True)
+    checked_at = fields.Datetime(required=True, readonly=True)
+    message = fields.Char(readonly=True)
+    no_paper = fields.Boolean(readonly=True)
+    overheated = fields.Boolean(readonly=True)
+    blocked_24h = fields.Boolean(readonly=True, string="Blocked after 24h")
+    fm_full = fields.Boolean(readonly=True, string="FM full")
+    fm_error = fields.Boolean(readonly=True, string="FM error")
+    ej_full = fields.Boolean(readonly=True, string="EJ full")
+    near_paper_end = fields.Boolean(readonly=True)
+    opened_fiscal_receipt = fields.Boolean(readonly=True)
+    opened_non_fiscal_receipt = fields.Boolean(readonly=True)
+    fm_near_full = fields.Boolean(readonly=True, string="FM near full")
+    ej_near_full = fields.Boolean(readonly=True, string="EJ near full")
+
+    _sql_constraints = [
+        ('config_uniq', 'unique(config_id)', 'A pos config has only one fiscal device status.'),
+    ]
+
+    @api.model
+    def cbs_set(self, config, vals):
+        """Stores vals (fiscal_status.device_status/failed_status) as the status of config, checked now."""
+        vals = dict(vals, checked_at=fields.Datetime.now())
+        status = self.search([('config_id', '=', config.id)])
+        if status:
+            status.write(vals)
+        else:
+            status = self.create(dict(vals, config_id=config.id))
+        return status
+
+    def cbs_read(self):
+        "the status as sent to the pos"
+        self.ensure_one()
+        return dict({field: self[field] for field in STATUS_FLAGS}, state=self.state, message=self.message or '',
+                    checked_at=fields.Datetime.to_string(self.checked_at))
@@ -0,0 +1,222 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import gzip
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo import api, fields, models, registry, tools, SUPERUSER_ID, _
+from odoo.exceptions import UserError
+
+from . import fiscal_ej
+_logger = logging.getLogger(__name__)
+
+# fiscal devices that export at the same time
+EXPORT_THREADS = 8
+# namespace of the postgres advisory locks taken by the export running
+EXPORT_LOCK_NAMESPACE = 7302
+
+
+class CbsFiscalEjExport(models.Model):
+    """The electronic journal (or the fiscal memory) of the fiscal device of a pos config for a range of Z
+    reports, read by the cron in requests of z_chunk Z reports and appended to a gzip file; after each request
+    the progress is committed, so an interrupted export resumes after the last Z read. The exports of
+    different devices run in parallel."""
+    _name = 'cbs.fiscal.ej.export'
+    _description = 'Fiscal electronic journal export'
+    _order = 'id desc'
+
+    config_id = fields.Many2one('pos.config', required=True, ondelete='cascade',
+                                states={'done': [('readonly', True)], 'running': [('readonly', True)]})
+    kind = fields.Selection([('ej', 'Electronic journal'), ('fm', 'Fiscal memory')], required=True, default='ej',
+                            states={'done': [('readonly', True)], 'running': [('readonly', True)]})
+    z_from = fields.Integer(string="From Z report", required=True, default=1,
+                            states={'done': [('readonly', True)], 'running': [('readonly', True)]})
+    z_to = fields.Integer(string="To Z report", states={'done': [('readonly', True)], 'running': [('readonly', True)]},
+                          help="0: up to the last Z report of the device.")
+    z_chunk = fields.Integer(string="Z reports per request", default=10,
+                             states={'done': [('readonly', True)], 'running': [('readonly', True)]})
+    state = fields.Selection([('draft', 'Draft'), ('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'),
+                              ('error', 'Error')], default='draft', required=True, readonly=True, index=True)
+    last_z_done = fields.Integer(readonly=True, help="The export resumes after this Z report.")
+    device_serial = fields.Char(readonly=True)
+    file_path = fields.Char(readonly=True)
+    file_size = fields.Integer(readonly=True, help="Bytes of the file written by the Z reports done.")
+    line_count = fields.Integer(readonly=True)
+    receipt_count = fields.Integer(readonly=True)
+    duration = fields.Float(readonly=True, help="Seconds spent reading the device.")
+    error = fields.Text(readonly=True)
+    receipt_ids = fields.One2many('cbs.fiscal.ej.receipt', 'export_id', readonly=True)
+
+    def name_get(self):
+        return [(export.id, f"{export.config_id.name} {export.kind.upper()} Z {export.z_from}-{export.z_to or ''}")
+                for export in self]
+
+    @api.model
+    def cbs_run(self, configs, kind, z_from, z_to=0, z_chunk=10):
+        """Exports kind ('ej' or 'fm') of Z reports z_from..z_to of the fiscal devices of configs."""
+        exports = self.create([{'config_id': config.id, 'kind': kind, 'z_from': z_from, 'z_to': z_to,
+                                'z_chunk': z_chunk} for config in configs])
+        exports.action_start()
+        return exports
+
+    def action_start(self):
+        """Starts (or resumes after an error) the exports; they are run by the cron."""
+        if self.filtered(lambda export: export.state not in ('draft', 'error')):
+            raise UserError(_("Only a draft or failed export can be started."))
+        self.write({'state': 'pending', 'error': False})
+        self.env.ref('cbs_pos_fiscal_printer.ir_cron_cbs_fiscal_ej_export')._trigger()
+
+    def action_download(self):
+        self.ensure_one()
+        return {'type': 'ir.actions.act_url', 'url': f'/cbs_pos_fiscal_printer/ej/{self.id}', 'target': 'self'}
+
+    def _cbs_file_path(self):
+        directory = os.path.join(tools.config.filestore(self.env.cr.dbname), 'cbs_fiscal_ej')
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{self.id}_{self.kind}.txt.gz")
+
+    @api.model
+    def _cron_export(self):
+        """Runs the pending exports and the ones interrupted while running, up to EXPORT_THREADS in parallel."""
+        export_ids = self.search([('state', 'in', ('pending', 'running'))], order='id').ids
+        if len(export_ids) <= 1 or getattr(threading.current_thread(), 'testing', False):
+            for export_id in export_ids:
+                self._cbs_export(export_id)
+            return
+        dbname = self.env.cr.dbname
+        with ThreadPoolExecutor(max_workers=min(EXPORT_THREADS, len(export_ids)),
+                                thread_name_prefix="cbs_fiscal_ej_export") as executor:
+            list(executor.map(lambda export_id: self._cbs_export_thread(dbname, export_id), export_ids))
+
+    @api.model
+    def _cbs_export_thread(self, dbname, export_id):
+        with registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            env[self._name]._cbs_export(export_id)
+
+    @api.model
+    def _cbs_export(self, export_id):
+        """Reads the Z reports not done of one export; only one cron runs an export."""
+        cr = self.env.cr
+        cr.execute("SELECT pg_try_advisory_lock(%s, %s)", (EXPORT_LOCK_NAMESPACE, export_id))
+        if not cr.fetchone()[0]:
+            return  # already running
+        export = self.browse(export_id)
+        try:
+            export.state = 'running'
+            cr.commit()
+            while export.state == 'running':
+                export._cbs_export_chunk()
+                cr.commit()
+        except Exception as ex:
+            cr.rollback()
+            _logger.warning("fiscal EJ export %s: %s", export_id, ex)
+            export.write({'state': 'error', 'error': str(ex.args[0] if len(ex.args) == 1 else ex)})
+            cr.commit()
+        finally:
+            cr.rollback()  # an aborted transaction would refuse the unlock
+            cr.execute("SELECT pg_advisory_unlock(%s, %s)", (EXPORT_LOCK_NAMESPACE, export_id))
+
+    def _cbs_export_chunk(self):
+        """Reads the next z_chunk Z reports from the device and appends their lines to the file, as a gzip
+        member: the file is first cut to the size of the Z reports done, dropping what an interrupted
+        request wrote. The device is taken for one request at a time, the receipts print in between."""
+        self.ensure_one()
+        start = time.perf_counter()
+        config = self.config_id
+        with config._cbs_fiscal_printer() as fp:
+            z_to = self.z_to or int(fp.ReadLastDailyReportInfo().LastZDailyReportNum)
+            first = max(self.z_from, self.last_z_done + 1)
+            if first > z_to:
+                self.write({'state': 'done', 'z_to': z_to})
+                return
+            first, last = next(fiscal_ej.z_ranges(first, z_to, self.z_chunk))
+            path = self.file_path or self._cbs_file_path()
+            with open(path, 'ab') as raw:
+                raw.truncate(self.file_size)
+            line_count = 0
+
+            def written(lines):
+                nonlocal line_count
+                for line in lines:
+                    file.write(line + "\n")
+                    line_count += 1
+                    yield line
+
+            with gzip.open(path, 'at', encoding='utf-8') as file:
+                found = list(fiscal_ej.index_receipts(written(fiscal_ej.read_report(fp, self.kind, first, last)),
+                                                      last))
+        # the fiscal memory has the Z reports, not the receipts
+        receipts = self.env['cbs.fiscal.ej.receipt'].create([{
+            'export_id': self.id,
+            'device_serial': config.cbs_fiscal_device_serial,
+            'z_num': z_num,
+            'receipt_num': receipt_num,
+            'line_no': self.line_count + line_no,
+        } for z_num, receipt_num, line_no in found] if self.kind == 'ej' else [])
+        receipts._cbs_link_orders()
+        self.write({
+            'z_to': z_to,
+            'last_z_done': last,
+            'device_serial': config.cbs_fiscal_device_serial,
+            'file_path': path,
+            'file_size': os.path.getsize(path),
+            'line_count': self.line_count + line_count,
+            'receipt_count': self.receipt_count + len(receipts),
+            'duration': self.duration + time.perf_counter() - start,
+            'state': 'done' if last >= z_to else 'running',
+        })
+
+
+class CbsFiscalEjReceipt(models.Model):
+    """A fiscal receipt found in an exported electronic journal, linked to its pos order: the device, the Z
+    report that closed it, its number and its line in the export file."""
+    _name = 'cbs.fiscal.ej.receipt'
+    _description = 'Fiscal receipt of an exported electronic journal'
+    _order = 'export_id, line_no'
+    _rec_name = 'receipt_num'
+
+    export_id = fields.Many2one('cbs.fiscal.ej.export', required=True, readonly=True, index=True, ondelete='cascade')
+    config_id = fields.Many2one(related='export_id.config_id', store=True)
+    device_serial = fields.Char(readonly=True)
+    z_num = fields.Integer(readonly=True, string="Z report")
+    receipt_num = fields.Integer(readonly=True)
+    line_no = fields.Integer(readonly=True, help="First line of the receipt in the export file, from 0.")
+    order_id = fields.Many2one('pos.order', readonly=True, index='btree_not_null', ondelete='set null')
+
+    def init(self):
+        tools.create_index(self.env.cr, 'cbs_fiscal_ej_receipt_device_z_receipt_index', self._table,
+                           ['device_serial', 'z_num', 'receipt_num'])
+
+    def _cbs_link_orders(self):
+        """Links the receipts to the pos orders printed by the same pos config with the same number on the same
+        fiscal day: between the counter snapshots of the Z report that closed it and of the previous one (the
+        receipt numbers restart after each Z report; a day can have several sessions, a session several days)."""
+        if not self:
+            return
+        self.flush_recordset()
+        self.env['cbs.fiscal.counter.snapshot'].flush_model()
+        self.env.cr.execute("""
+            WITH z AS (
+                SELECT id, config_id, last_z_report_num,
+                       coalesce(lag(id) OVER (PARTITION BY config_id ORDER BY id), 0) AS previous_id
+                  FROM cbs_fiscal_counter_snapshot
+                 WHERE source = 'z_report'
+            )
+            UPDATE cbs_fiscal_ej_receipt r
+               SET order_id = s.order_id
+              FROM z
+              JOIN cbs_fiscal_counter_snapshot s ON s.config_id = z.config_id AND s.source = 'receipt'
+                                                AND s.id > z.previous_id AND s.id < z.id
+              JOIN pos_order o ON o.id = s.order_id
+             WHERE r.id IN %s
+               AND z.config_id = r.config_id AND z.last_z_report_num = r.z_num
+               AND s.last_receipt_num = r.receipt_num
+               AND (o.cbs_fiscal_device_serial IS NULL OR r.device_serial IS NULL
+                    OR o.cbs_fiscal_device_serial = r.device_serial)
+        """, (tuple(self.ids),))
+        self.invalidate_recordset(['order_id'])
@@ -0,0 +1,132 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+from . import FP_metrics
+
+# columns summed by the upsert of cbs_add: attributes of FP_metrics.CommandStats, then its buckets
+TOTAL_FIELDS = ['count', 'error_count', 'total_ms', 'connect_ms', 'bytes_out', 'bytes_in']
+BUCKET_FIELDS = [f'le_{bound}ms' for bound in FP_metrics.BUCKETS_MS] + ['le_inf']
+SUM_FIELDS = TOTAL_FIELDS + BUCKET_FIELDS
+# most days summed by cbs_prometheus: ten years, more is all the rows
+MAX_PROMETHEUS_DAYS = 3650
+
+
+class CbsFiscalCommandStat(models.Model):
+    """The commands sent to the fiscal device of a pos config in one day: counts, times and the histogram of
+    the wall times (FP_metrics), added after each use of the device."""
+    _name = 'cbs.fiscal.command.stat'
+    _description = 'Fiscal printer command timings'
+    _order = 'day desc, config_id, command'
+    _rec_name = 'command'
+
+    config_id = fields.Many2one('pos.config', required=True, readonly=True, ondelete='cascade')
+    day = fields.Date(required=True, readonly=True)
+    command = fields.Char(required=True, readonly=True, help="'batch' is a receipt sent in one request.")
+    count = fields.Integer(readonly=True)
+    error_count = fields.Integer(readonly=True)
+    last_error = fields.Char(readonly=True, help="Code of the last error: code, or code:STE1:STE2 from the device.")
+    total_ms = fields.Float(readonly=True, string="Total ms", help="Wall time of the commands.")
+    avg_ms = fields.Float(compute='_compute_avg_ms', string="Average ms")
+    max_ms = fields.Float(readonly=True, string="Max ms", group_operator='max')
+    connect_ms = fields.Float(readonly=True, string="Connect ms",
+                              help="Of the wall time, opening connections to the ZfpLab server.")
+    bytes_out = fields.Integer(readonly=True)
+    bytes_in = fields.Integer(readonly=True)
+    le_10ms = fields.Integer(readonly=True, string="<= 10 ms")
+    le_25ms = fields.Integer(readonly=True, string="<= 25 ms")
+    le_50ms = fields.Integer(readonly=True, string="<= 50 ms")
+    le_100ms = fields.Integer(readonly=True, string="<= 100 ms")
+    le_250ms = fields.Integer(readonly=True, string="<= 250 ms")
+    le_500ms = fields.Integer(readonly=True, string="<= 500 ms")
+    le_1000ms = fields.Integer(readonly=True, string="<= 1 s")
+    le_2500ms = fields.Integer(readonly=True, string="<= 2.5 s")
+    le_5000ms = fields.Integer(readonly=True, string="<= 5 s")
+    le_10000ms = fields.Integer(readonly=True, string="<= 10 s")
+    le_inf = fields.Integer(readonly=True, string="> 10 s")
+
+    _sql_constraints = [
+        ('config_day_command_uniq', 'unique(config_id, day, command)', 'One row per pos config, day and command.'),
+    ]
+
+    @api.depends('count', 'total_ms')
+    def _compute_avg_ms(self):
+        for stat in self:
+            stat.avg_ms = stat.total_ms / stat.count if stat.count else 0.0
+
+    @api.model
+    def cbs_add(self, config, samples):
+        """Adds the FP_metrics samples of config to the rows of today; one upsert per command, so the workers
+        printing at the same time do not conflict."""
+        day = fields.Date.context_today(self)
+        now = fields.Datetime.now()
+        columns = ['config_id', 'day', 'command', 'last_error', 'max_ms', 'create_uid', 'create_date', 'write_uid',
+                   'write_date'] + SUM_FIELDS
+        updates = ", ".join(f"{name} = t.{name} + EXCLUDED.{name}" for name in SUM_FIELDS)
+        query = f"""
+            INSERT INTO cbs_fiscal_command_stat AS t ({", ".join(columns)})
+            VALUES ({", ".join(["%s"] * len(columns))})
+            ON CONFLICT (config_id, day, command) DO UPDATE
+               SET {updates}, max_ms = greatest(t.max_ms, EXCLUDED.max_ms),
+                   last_error = coalesce(EXCLUDED.last_error, t.last_error),
+                   write_uid = EXCLUDED.write_uid, write_date = EXCLUDED.write_date
+        """
+        for command, stats in FP_metrics.aggregate(samples).items():
+            values = [config.id, day, command, stats.last_error or None, stats.max_ms, self.env.uid, now,
+                      self.env.uid, now, stats.count, stats.error_count, stats.total_ms, stats.connect_ms,
+                      stats.bytes_out, stats.bytes_in, *stats.buckets]
+            self.env.cr.execute(query, values)
+        self.invalidate_model()
+
+    @api.model
+    def cbs_prometheus(self, days=1):
+        """The rows of the last days (at most MAX_PROMETHEUS_DAYS), summed per pos config and command, as
+        Prometheus text."""
+        days = min(days, MAX_PROMETHEUS_DAYS)
+        rows = self.search([('day', '>', fields.Date.context_today(self) - timedelta(days=days))],
+                           order='config_id, command')
+        totals = {}
+        for row in rows:
+            stats = totals.get((row.config_id, row.command))
+            if stats is None:
+                stats = totals[(row.config_id, row.command)] = FP_metrics.CommandStats()
+            for name in TOTAL_FIELDS:
+                setattr(stats, name, getattr(stats, name) + row[name])
+            stats.buckets = [count + row[name] for count, name in zip(stats.buckets, BUCKET_FIELDS)]
+            stats.max_ms = max(stats.max_ms, row.max_ms)
+        return FP_metrics.prometheus_text(
+            [({'config_id': config.id, 'config': config.name, 'command': command}, stats)
+             for (config, command), stats in totals.items()])
+
+
+class CbsFiscalSlowReceipt(models.Model):
+    """A receipt printed slower than cbs_slow_receipt_ms of its pos config, with the time of each request."""
+    _name = 'cbs.fiscal.slow.receipt'
+    _description = 'Slow fiscal receipt'
+    _order = 'id desc'
+    _rec_name = 'order_id'
+
+    config_id = fields.Many2one('pos.config', required=True, readonly=True, index=True, ondelete='cascade')
+    order_id = fields.Many2one('pos.order', readonly=True, ondelete='cascade')
+    duration_ms = fields.Float(readonly=True, string="Duration ms", help="From reading the order to the last answer.")
+    device_ms = fields.Float(readonly=True, string="Device ms", help="Of the duration, waiting for the ZfpLab server.")
+    connect_ms = fields.Float(readonly=True, string="Connect ms")
+    request_count = fields.Integer(readonly=True)
+    error = fields.Char(readonly=True)
+    breakdown = fields.Text(readonly=True, help="The requests sent, in order, with their times.")
+
+    @api.model
+    def cbs_add(self, order, duration_ms, samples):
+        return self.create({
+            'config_id': order.config_id.id,
+            'order_id': order.id,
+            'duration_ms': duration_ms,
+            'device_ms': sum(sample.ms for sample in samples),
+            'connect_ms': sum(sample.connect_ms for sample in samples),
+            'request_count': len(samples),
+            'error': next((sample.error for sample in reversed(samples) if sample.error), False),
+            'breakdown': FP_metrics.breakdown(samples),
+        })
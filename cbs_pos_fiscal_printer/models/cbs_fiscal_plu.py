@@ -0,0 +1,33 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo import fields, models
+
+from .cbs_pos_tax_vat_class import TREMOL_VAT_CLASSES
+from .fiscal_plu import PluState
+
+
+class CbsFiscalPlu(models.Model):
+    """A product programmed as article (PLU) in the database of the fiscal device of a pos config, with the
+    data the device has. Written by pos.config._cbs_plu_sync only after the device accepted it."""
+    _name = 'cbs.fiscal.plu'
+    _description = 'Fiscal device article (PLU)'
+    _order = 'config_id, plu_number'
+
+    config_id = fields.Many2one('pos.config', required=True, readonly=True, index=True, ondelete='cascade')
+    product_id = fields.Many2one('product.product', required=True, readonly=True, ondelete='cascade')
+    plu_number = fields.Integer(required=True, readonly=True)
+    name = fields.Char(required=True, readonly=True)
+    price = fields.Float(readonly=True, digits=(16, 2))
+    vat_class = fields.Selection(TREMOL_VAT_CLASSES, required=True, readonly=True)
+    barcode = fields.Char(readonly=True)
+    sync_date = fields.Datetime(readonly=True)
+
+    _sql_constraints = [
+        ('config_product_uniq', 'unique(config_id, product_id)', 'A product can have only one PLU per pos config.'),
+        ('config_plu_number_uniq', 'unique(config_id, plu_number)', 'A PLU number can have only one product.'),
+    ]
+
+    def _cbs_state(self):
+        self.ensure_one()
+        return PluState(self.name, self.price, self.vat_class, self.barcode or '')
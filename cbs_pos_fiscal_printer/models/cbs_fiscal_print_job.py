@@ -0,0 +1,227 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import json
+import logging
+import threading
+from datetime import timedelta
+
+import psycopg2
+
+from odoo import api, fields, models, registry, SUPERUSER_ID, _
+from odoo.exceptions import ValidationError
+
+from . import fiscal_arbiter
+_logger = logging.getLogger(__name__)
+
+# namespace of the postgres advisory locks taken by the dispatcher of a ZfpLab server
+PRINT_JOB_LOCK_NAMESPACE = 7301
+# seconds a job waiting for its device is retried anyway, if the heartbeat does not see the device back before
+WAITING_DEVICE_DELAY = 300
+# seconds between two looks, while dispatchers run, for the ZfpLab servers that got jobs meanwhile
+DISPATCH_RESCAN_INTERVAL = 2
+
+
+class CbsFiscalPrintJob(models.Model):
+    """A receipt to print at the fiscal printer of a pos.config, printed outside the POS request
+    by the dispatcher of its ZfpLab server (cron), in the order of the jobs of the pos.config."""
+    _name = 'cbs.fiscal.print.job'
+    _description = 'Fiscal printer print job'
+    _order = 'id desc'
+
+    order_id = fields.Many2one('pos.order', required=True, readonly=True, ondelete='cascade')
+    pos_reference = fields.Char(required=True, readonly=True, index=True,
+                                help="Receipt reference; only one job per reference can wait for printing.")
+    config_id = fields.Many2one('pos.config', required=True, readonly=True, index=True, ondelete='cascade')
+    state = fields.Selection([('pending', 'Pending'), ('printing', 'Printing'), ('done', 'Done'), ('error', 'Error')],
+                             default='pending', required=True, readonly=True, index=True)
+    attempt_count = fields.Integer(readonly=True)
+    next_attempt = fields.Datetime(default=fields.Datetime.now, readonly=True,
+                                   help="The job is not printed before this time (backoff after an error).")
+    result = fields.Text(readonly=True, help="Answer of cbs_print_at_fiscal_server, as json.")
+    error = fields.Text(readonly=True)
+    waiting_device = fields.Boolean(readonly=True, help="The fiscal device was offline; printed when the heartbeat "
+                                                       "sees it back, without counting the attempts.")
+
+    def init(self):
+        # idempotent enqueue: one waiting job per receipt
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS cbs_fiscal_print_job_pos_reference_waiting_uniq
+            ON cbs_fiscal_print_job (pos_reference) WHERE state IN ('pending', 'printing')
+        """)
+
+    @api.model
+    def cbs_enqueue(self, order, waiting_device=False):
+        """Returns the job that prints order; a new one only if none is waiting for it. waiting_device: the
+        device is offline, the job waits for the heartbeat (cbs_drain). Two requests enqueuing the same
+        receipt at once get the same job: the second insert fails on the unique index and finds the first."""
+        domain = [('pos_reference', '=', order.pos_reference), ('state', 'in', ('pending', 'printing'))]
+        job = self.search(domain, limit=1)
+        if job:
+            return job
+        vals = {'order_id': order.id, 'pos_reference': order.pos_reference, 'config_id': order.config_id.id}
+        next_attempt = None
+        if waiting_device:
+            next_attempt = fields.Datetime.now() + timedelta(seconds=WAITING_DEVICE_DELAY)
+            vals.update(waiting_device=True, next_attempt=next_attempt)
+        try:
+            with self.env.cr.savepoint():
+                job = self.create(vals)
+        except psycopg2.IntegrityError:
+            job = self.search(domain, limit=1)
+            if not job:
+                raise  # committed by a transaction that this one does not see
+            return job
+        self.env.ref('cbs_pos_fiscal_printer.ir_cron_cbs_fiscal_print_job')._trigger(next_attempt)
+        return job
+
+    def cbs_job_status(self):
+        """Polled by the POS until the state is done or error."""
+        self.ensure_one()
+        return {'id': self.id, 'state': self.state, 'error': self.error, 'waiting_device': self.waiting_device,
+                'result': json.loads(self.result) if self.result else {}}
+
+    def _cbs_set_result(self, res):
+        """Stores the answer of cbs_print_at_fiscal_server; an error is retried with exponential backoff,
+        a device offline waits for the heartbeat (cbs_drain)."""
+        self.ensure_one()
+        if res.get('offline'):
+            next_attempt = fields.Datetime.now() + timedelta(seconds=WAITING_DEVICE_DELAY)
+            self.write({'state': 'pending', 'error': res.get('error'), 'result': json.dumps(res, default=str),
+                        'waiting_device': True, 'next_attempt': next_attempt})
+            self.env.ref('cbs_pos_fiscal_printer.ir_cron_cbs_fiscal_print_job')._trigger(next_attempt)
+            return
+        attempt_count = self.attempt_count + 1
+        vals = {'attempt_count': attempt_count, 'result': json.dumps(res, default=str), 'waiting_device': False}
+        error = res.get('error')
+        if not error:
+            vals.update(state='done', error=False)
+        elif attempt_count < max(self.config_id.cbs_print_job_max_attempts, 1):
+            delay = min(self.config_id.cbs_print_job_retry_delay * 2 ** (attempt_count - 1), 300)
+            next_attempt = fields.Datetime.now() + timedelta(seconds=delay)
+            vals.update(state='pending', error=error, next_attempt=next_attempt)
+            self.env.ref('cbs_pos_fiscal_printer.ir_cron_cbs_fiscal_print_job')._trigger(next_attempt)
+        else:
+            vals.update(state='error', error=error)
+        self.write(vals)
+
+    @api.model
+    def cbs_drain(self, config):
+        """The device of config is back: its jobs waiting for it are printed now, in their order."""
+        jobs = self.search([('config_id', '=', config.id), ('state', '=', 'pending'), ('waiting_device', '=', True)])
+        if jobs:
+            jobs.write({'waiting_device': False, 'next_attempt': fields.Datetime.now()})
+            self.env.ref('cbs_pos_fiscal_printer.ir_cron_cbs_fiscal_print_job')._trigger()
+        return jobs
+
+    @api.model
+    def _cron_dispatch(self):
+        """Runs the dispatcher of each ZfpLab server that has jobs; different servers print in parallel. The
+        cron cannot be triggered again while it runs: until the last dispatcher ends, the servers that get
+        jobs meanwhile get a dispatcher too, so they do not wait for the busiest server to be idle."""
+        if getattr(threading.current_thread(), 'testing', False):
+            done = set()
+            while True:
+                servers = [server_key for server_key in self._cbs_pending_servers() if server_key not in done]
+                if not servers:
+                    return
+                for server_key in servers:
+                    self._cbs_dispatch_server(server_key)
+                    done.add(server_key)
+        dbname = self.env.cr.dbname
+        threads = {}
+        while True:
+            # the jobs committed by the POS and the dispatchers meanwhile
+            self.env.cr.commit()
+            self.env.invalidate_all()
+            for server_key, devices in self._cbs_pending_servers().items():
+                thread = threads.get(server_key)
+                if thread is not None and (thread.is_alive() or not self._cbs_dispatch_heads(list(devices))):
+                    continue
+                thread = threads[server_key] = threading.Thread(
+                    target=self._cbs_dispatch_server_thread, args=(dbname, server_key),
+                    name=f"cbs_fiscal_dispatch_{server_key}")
+                thread.start()
+            running = [thread for thread in threads.values() if thread.is_alive()]
+            if not running:
+                return
+            running[0].join(DISPATCH_RESCAN_INTERVAL)
+
+    @api.model
+    def _cbs_pending_servers(self):
+        """{server key: {pos config id: its device}} of the pos configs having pending jobs, grouped by their
+        ZfpLab server (fiscal_arbiter.server_key); a pos config without server is alone, keyed by its id."""
+        self.flush_model(['config_id', 'state'])
+        self.env.cr.execute("SELECT DISTINCT config_id FROM cbs_fiscal_print_job WHERE state = 'pending'")
+        servers = {}
+        for config in self.env['pos.config'].browse([row[0] for row in self.env.cr.fetchall()]):
+            try:
+                key = fiscal_arbiter.server_key(config._cbs_fiscal_server_address())
+                device = config._cbs_fiscal_device()
+            except (ValidationError, TypeError, ValueError):
+                key, device = config.id, None  # not configured: its jobs end in error
+            servers.setdefault(key, {})[config.id] = device
+        return servers
+
+    @api.model
+    def _cbs_dispatch_server_thread(self, dbname, server_key):
+        with registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            env[self._name]._cbs_dispatch_server(server_key)
+
+    @api.model
+    def _cbs_dispatch_server(self, server_key):
+        """Prints the pending jobs of the pos configs of one ZfpLab server, one at a time: the jobs of a pos
+        config in their order, the ones of the device the server is connected to before switching it to
+        another device (fiscal_arbiter.next_job). Only one dispatcher per server can run."""
+        cr = self.env.cr
+        cr.execute("SELECT pg_try_advisory_lock(%s, %s)", (PRINT_JOB_LOCK_NAMESPACE, server_key))
+        if not cr.fetchone()[0]:
+            return  # this server has already a dispatcher
+        try:
+            # we own the server: a job still printing was interrupted (worker killed); its receipt can be
+            # printed or not, so it is not printed again automatically
+            devices = self._cbs_pending_servers().get(server_key, {})
+            self.search([('config_id', 'in', list(devices)), ('state', '=', 'printing')]).write(
+                {'state': 'error', 'error': _("Printing was interrupted. Verify the receipt at the fiscal printer.")})
+            cr.commit()
+            device, served = None, 0
+            while True:
+                # the pos configs of the server that got jobs meanwhile are served too
+                devices = self._cbs_pending_servers().get(server_key, {})
+                heads = self._cbs_dispatch_heads(list(devices))
+                index = fiscal_arbiter.next_job([(job, devices[job.config_id.id]) for job in heads], device, served)
+                if index is None:
+                    break
+                job = heads[index]
+                served = served + 1 if devices[job.config_id.id] == device else 1
+                device = devices[job.config_id.id]
+                job.state = 'printing'
+                cr.commit()
+                try:
+                    res = job.order_id.cbs_print_at_fiscal_server()
+                except Exception as ex:
+                    cr.rollback()
+                    _logger.exception("fiscal print job %s", job.id)
+                    res = {'error': f"CBS: {ex}"}
+                job._cbs_set_result(res)
+                cr.commit()
+        finally:
+            cr.rollback()  # an aborted transaction would refuse the unlock
+            cr.execute("SELECT pg_advisory_unlock(%s, %s)", (PRINT_JOB_LOCK_NAMESPACE, server_key))
+
+    @api.model
+    def _cbs_dispatch_heads(self, config_ids):
+        """The next job of each of the pos configs, the oldest first, if it can be printed now (fifo: the next
+        jobs of a pos config wait for the one in backoff)."""
+        if not config_ids:
+            return self
+        self.env.cr.execute("""
+            SELECT DISTINCT ON (config_id) id
+              FROM cbs_fiscal_print_job
+             WHERE config_id IN %s AND state = 'pending'
+          ORDER BY config_id, id
+        """, (tuple(config_ids),))
+        now = fields.Datetime.now()
+        return self.browse(sorted(row[0] for row in self.env.cr.fetchall())).filtered(
+            lambda job: job.next_attempt <= now)
@@ -0,0 +1,87 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from contextlib import contextmanager
+
+from odoo import api, fields, models, tools
+
+from . import fiscal_journal
+
+
+class CbsFiscalReceiptJournal(models.Model):
+    """Write-ahead journal of the receipts sent to the fiscal device of a pos config: the entry of a receipt is
+    committed before sending it and after each known step (fiscal_journal), on a cursor of its own, so that a
+    receipt interrupted by an error, a rollback or a killed worker is ended from its last step at the next
+    use of the device (pos.config._cbs_journal_recover)."""
+    _name = 'cbs.fiscal.receipt.journal'
+    _description = 'Fiscal receipt journal'
+    _order = 'id desc'
+    _rec_name = 'order_id'
+
+    config_id = fields.Many2one('pos.config', required=True, readonly=True, ondelete='cascade')
+    order_id = fields.Many2one('pos.order', readonly=True, ondelete='cascade')
+    device_serial = fields.Char(readonly=True)
+    fiscal = fields.Boolean(readonly=True)
+    step = fields.Selection(fiscal_journal.STEPS, required=True, readonly=True, default='planned')
+    step_date = fields.Datetime(readonly=True, default=fields.Datetime.now)
+    before_receipt_num = fields.Integer(readonly=True, help="LastReceiptNum of the device before the receipt.")
+    before_total_counter = fields.Integer(readonly=True, help="TotalReceiptCounter of the device before the receipt; "
+                                          "a higher one after means that the fiscal receipt was closed.")
+    payments_done = fields.Integer(readonly=True, help="Payment commands executed by the device.")
+    recovered = fields.Boolean(readonly=True, help="Ended by the recovery, not by its print.")
+    plan = fields.Text(readonly=True, help="The receipt plan (fiscal_receipt.ReceiptPlan) as json.")
+    message = fields.Text(readonly=True)
+
+    def init(self):
+        # the entries not ended, looked for before each receipt
+        tools.create_index(self.env.cr, 'cbs_fiscal_receipt_journal_open_index', self._table, ['config_id'],
+                           where="step NOT IN ('closed', 'cancelled')")
+
+    @contextmanager
+    def _cbs_durable(self):
+        """This model on a cursor of its own, committed at the end of the block."""
+        with self.env.registry.cursor() as cr:
+            yield self.with_env(self.env(cr=cr))
+
+    @api.model
+    def cbs_plan(self, config, order, plan, before):
+        """The committed entry of the receipt plan of order, before sending it; before is the
+        ReadLastAndTotalReceiptNum of the device."""
+        with self._cbs_durable() as journal:
+            entry_id = journal.create({
+                'config_id': config.id,
+                'order_id': order.id,
+                'device_serial': config.cbs_fiscal_device_serial,
+                'fiscal': plan.fiscal,
+                'before_receipt_num': before.LastReceiptNum,
+                'before_total_counter': before.TotalReceiptCounter,
+                'plan': plan.to_json(),
+            }).id
+        return self.browse(entry_id)
+
+    @api.model
+    def cbs_open_entries(self, config):
+        """The entries of config not ended, oldest first, as dicts; read on a cursor of their own, as the
+        transaction of the caller does not see the entries committed after it started."""
+        with self._cbs_durable() as journal:
+            return journal.search([('config_id', '=', config.id), ('step', 'not in', fiscal_journal.DONE_STEPS)],
+                                  order='id').read(['order_id', 'fiscal', 'step', 'before_receipt_num',
+                                                    'before_total_counter', 'payments_done', 'plan'], load=None)
+
+    def cbs_step(self, command_names=None, step=None, message=None, recovered=False):
+        """Commits the step reached: from the commands executed by the device (command_names) or given.
+        Returns the step written."""
+        vals = {'step_date': fields.Datetime.now()}
+        if command_names is not None:
+            vals.update(step=fiscal_journal.step_of(command_names),
+                        payments_done=fiscal_journal.payments_done(command_names))
+        if step:
+            vals['step'] = step
+        if message:
+            vals['message'] = message
+        if recovered:
+            vals['recovered'] = True
+        with self._cbs_durable() as journal:
+            journal.browse(self.ids).write(vals)
+        self.invalidate_recordset()
+        return vals.get('step')
@@ -0,0 +1,47 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo import fields, models, tools
+
+
+class CbsFiscalReceiptSequenceIssue(models.Model):
+    """The gaps and the duplicates of the TotalReceiptCounter of the fiscal receipts, per fiscal device: each
+    pos order whose counter is not the one after the counter of the previous order of the device."""
+    _name = 'cbs.fiscal.receipt.sequence.issue'
+    _description = 'Fiscal receipt sequence gaps and duplicates'
+    _auto = False
+    _order = 'device, total_counter'
+
+    device = fields.Char(readonly=True, help="Serial number of the fiscal device; the pos config if not known.")
+    order_id = fields.Many2one('pos.order', readonly=True)
+    total_counter = fields.Integer(readonly=True)
+    receipt_num = fields.Integer(readonly=True)
+    previous_order_id = fields.Many2one('pos.order', readonly=True)
+    previous_total_counter = fields.Integer(readonly=True)
+    issue = fields.Selection([('gap', 'Gap'), ('duplicate', 'Duplicate')], readonly=True)
+    missing = fields.Integer(readonly=True, help="Receipts of the device missing before this one.")
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        # one pass over the index (device, counter) of pos_order
+        self.env.cr.execute("""
+            CREATE OR REPLACE VIEW cbs_fiscal_receipt_sequence_issue AS (
+                SELECT id, device, order_id, total_counter, receipt_num, previous_order_id, previous_total_counter,
+                       CASE WHEN total_counter = previous_total_counter THEN 'duplicate' ELSE 'gap' END AS issue,
+                       greatest(total_counter - previous_total_counter - 1, 0) AS missing
+                  FROM (
+                    SELECT o.id AS id,
+                           coalesce(o.cbs_fiscal_device_serial, 'pos.config ' || s.config_id) AS device,
+                           o.id AS order_id, o.cbs_fiscal_total_counter AS total_counter,
+                           o.cbs_fiscal_receipt_num AS receipt_num,
+                           lag(o.id) OVER w AS previous_order_id,
+                           lag(o.cbs_fiscal_total_counter) OVER w AS previous_total_counter
+                      FROM pos_order o
+                      JOIN pos_session s ON s.id = o.session_id
+                     WHERE o.cbs_fiscal_total_counter IS NOT NULL
+                    WINDOW w AS (PARTITION BY coalesce(o.cbs_fiscal_device_serial, 'pos.config ' || s.config_id)
+                                 ORDER BY o.cbs_fiscal_total_counter, o.id)
+                  ) sequence
+                 WHERE total_counter <> previous_total_counter + 1
+            )
+        """)
@@ -0,0 +1,100 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo import api, fields, models, registry, _
+_logger = logging.getLogger(__name__)
+
+# fiscal devices that print their daily report at the same time
+REPORT_THREADS = 8
+
+
+class CbsFiscalReportRun(models.Model):
+    """The daily report (X or Z) of several pos configs, printed in parallel, with the result of each one."""
+    _name = 'cbs.fiscal.report.run'
+    _description = 'Fiscal printer daily reports'
+    _order = 'id desc'
+
+    report_type = fields.Selection([('X', 'X report'), ('Z', 'Z report')], required=True, readonly=True)
+    state = fields.Selection([('done', 'Done'), ('partial', 'Partially done'), ('error', 'Error')],
+                             readonly=True)
+    duration = fields.Float(readonly=True, help="Seconds to print all the reports.")
+    line_ids = fields.One2many('cbs.fiscal.report.run.line', 'run_id', readonly=True)
+
+    def name_get(self):
+        return [(run.id, f"{run.report_type} {run.create_date}") for run in self]
+
+    @api.model
+    def cbs_run(self, configs, report_type):
+        """Prints the daily report at the fiscal devices of configs, up to REPORT_THREADS in parallel (the
+        configs of the same device one after the other); returns the run with the result of each config."""
+        start = time.perf_counter()
+        if len(configs) <= 1 or getattr(threading.current_thread(), 'testing', False):
+            results = [self._cbs_report_config(config, report_type) for config in configs]
+        else:
+            dbname, uid, context = self.env.cr.dbname, self.env.uid, self.env.context
+            with ThreadPoolExecutor(max_workers=min(REPORT_THREADS, len(configs)),
+                                    thread_name_prefix="cbs_fiscal_report") as executor:
+                results = list(executor.map(
+                    lambda config_id: self._cbs_report_config_thread(dbname, uid, context, config_id, report_type),
+                    configs.ids))
+        errors = sum(1 for res in results if res.get('error'))
+        return self.create({
+            'report_type': report_type,
+            'state': 'done' if not errors else 'error' if errors == len(results) else 'partial',
+            'duration': time.perf_counter() - start,
+            'line_ids': [(0, 0, res) for res in results],
+        })
+
+    @api.model
+    def _cbs_report_config_thread(self, dbname, uid, context, config_id, report_type):
+        with registry(dbname).cursor() as cr:
+            env = api.Environment(cr, uid, context)
+            return env[self._name]._cbs_report_config(env['pos.config'].browse(config_id), report_type)
+
+    @api.model
+    def _cbs_report_config(self, config, report_type):
+        "values of the cbs.fiscal.report.run.line of config; an error does not stop the reports of the others"
+        start = time.perf_counter()
+        vals = {'config_id': config.id}
+        try:
+            vals.update(config._cbs_daily_report(report_type), state='done')
+        except Exception as ex:
+            _logger.warning("daily report %s of pos.config %s: %s", report_type, config.id, ex)
+            vals.update(state='error', error=str(ex.args[0] if len(ex.args) == 1 else ex))
+        vals['duration'] = time.perf_counter() - start
+        return vals
+
+    def action_view(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _("Fiscal daily reports"),
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
+
+
+class CbsFiscalReportRunLine(models.Model):
+    _name = 'cbs.fiscal.report.run.line'
+    _description = 'Fiscal printer daily report of a pos config'
+    _order = 'run_id, id'
+
+    run_id = fields.Many2one('cbs.fiscal.report.run', required=True, readonly=True, index=True, ondelete='cascade')
+    config_id = fields.Many2one('pos.config', required=True, readonly=True, ondelete='cascade')
+    state = fields.Selection([('done', 'Done'), ('error', 'Error')], required=True, readonly=True)
+    error = fields.Text(readonly=True)
+    duration = fields.Float(readonly=True, help="Seconds to print the report and read the counters.")
+    # counters of the device after the report (ReadLastDailyReportInfo, ReadDailyCounters)
+    last_z_report_num = fields.Integer(readonly=True)
+    last_z_report_date = fields.Date(readonly=True)
+    last_report_num_from_reset = fields.Integer(readonly=True)
+    num_last_fm_block = fields.Integer(readonly=True)
+    num_ej = fields.Integer(readonly=True)
+    last_fm_block_date = fields.Datetime(readonly=True)
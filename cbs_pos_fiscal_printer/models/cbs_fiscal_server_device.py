@@ -0,0 +1,81 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import hashlib
+import logging
+from datetime import timedelta
+
+import psycopg2
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+def device_key(device):
+    "hash of a device key of FP_registry (it has the password of the device)"
+    return hashlib.sha256(repr(device).encode()).hexdigest()
+
+
+class CbsFiscalServerDevice(models.Model):
+    """The fiscal device a ZfpLab server was last found connected to, shared by the odoo workers: a pos config
+    finding here its device, checked less than cbs_fiscal_handshake_ttl seconds ago, neither asks the server
+    nor sends it the device settings (that would make it reconnect to the device). One row per server."""
+    _name = 'cbs.fiscal.server.device'
+    _description = 'Fiscal device connected to a ZfpLab server'
+    _order = 'server'
+    _rec_name = 'server'
+
+    server = fields.Char(required=True, readonly=True, help="host:port of the ZfpLab server.")
+    device = fields.Char(readonly=True, help="The device, without its password.")
+    device_key = fields.Char(readonly=True)
+    config_id = fields.Many2one('pos.config', readonly=True, ondelete='set null', help="Last pos config checking it.")
+    checked_at = fields.Datetime(required=True, readonly=True)
+
+    _sql_constraints = [
+        ('server_uniq', 'unique(server)', 'A ZfpLab server has only one connected fiscal device.'),
+    ]
+
+    @staticmethod
+    def _cbs_server(server):
+        return f"{server[0]}:{server[1]}"
+
+    @api.model
+    def cbs_is_connected(self, server, device, ttl):
+        """True if the ZfpLab server (host, port) was found connected to device in the last ttl seconds."""
+        if ttl <= 0:
+            return False
+        self.env.cr.execute("SELECT device_key, checked_at FROM cbs_fiscal_server_device WHERE server = %s",
+                            (self._cbs_server(server),))
+        row = self.env.cr.fetchone()
+        return bool(row) and row[0] == device_key(device) and \
+            row[1] > fields.Datetime.now() - timedelta(seconds=ttl)
+
+    @api.model
+    def cbs_set(self, server, device, config):
+        """Stores that the ZfpLab server (host, port) is connected to device, checked now by config; committed
+        at once, for the other workers; one upsert. Never fails the print: a concurrent update is only logged."""
+        now = fields.Datetime.now()
+        try:
+            with self.env.registry.cursor() as cr:
+                cr.execute("""
+                    INSERT INTO cbs_fiscal_server_device (server, device, device_key, config_id, checked_at,
+                                                         create_uid, create_date, write_uid, write_date)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (server) DO UPDATE
+                       SET device = EXCLUDED.device, device_key = EXCLUDED.device_key,
+                           config_id = EXCLUDED.config_id, checked_at = EXCLUDED.checked_at,
+                           write_uid = EXCLUDED.write_uid, write_date = EXCLUDED.write_date
+                """, (self._cbs_server(server), " ".join(str(value) for value in device[:3]), device_key(device),
+                      config.id, now, self.env.uid, now, self.env.uid, now))
+        except psycopg2.Error as ex:
+            _logger.info("ZfpLab server %s: connected device not stored (%s)", server, ex)
+
+    @api.model
+    def cbs_forget(self, server):
+        """After a connection error: the next pos config using the ZfpLab server asks it for its device."""
+        try:
+            with self.env.registry.cursor() as cr:
+                cr.execute("DELETE FROM cbs_fiscal_server_device WHERE server = %s", (self._cbs_server(server),))
+        except psycopg2.Error as ex:
+            _logger.info("ZfpLab server %s: connected device not forgotten (%s)", server, ex)
@@ -0,0 +1,39 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo import api, fields, models
+
+TREMOL_VAT_CLASSES = [('A', 'A'), ('B', 'B'), ('C', 'C'), ('D', 'D'), ('E', 'E'), ('F', 'F')]
+
+
+class CbsPosTaxVatClass(models.Model):
+    """Tremol VAT class of the receipt lines with an odoo tax, per pos config."""
+    _name = 'cbs.pos.tax.vat.class'
+    _description = 'Tax to fiscal printer VAT class'
+    _order = 'config_id, tax_id'
+
+    config_id = fields.Many2one('pos.config', required=True, index=True, ondelete='cascade')
+    tax_id = fields.Many2one('account.tax', required=True, ondelete='cascade',
+                             help="The first tax of the receipt line.")
+    vat_class = fields.Selection(TREMOL_VAT_CLASSES, required=True, default='A',
+                                 help="VAT class from tremol, like A that is usualy 19.00.")
+
+    _sql_constraints = [
+        ('config_tax_uniq', 'unique(config_id, tax_id)', 'A tax can have only one VAT class per pos config.'),
+    ]
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['pos.config'].clear_caches()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env['pos.config'].clear_caches()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env['pos.config'].clear_caches()
+        return res
@@ -0,0 +1,34 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""Arbitration of a ZfpLab server shared by the fiscal devices of several pos configs.
+
+The server works with one device at a time: connecting it to another device (sending the device settings)
+makes it reconnect, and a command sent while it executes the command of another client waits and fails with
+ServWaitOtherClientCmdProcessingTimeOut. So the receipts of all the devices of one server are printed one at
+a time (FP_registry locks the server, the workers lock it with server_key()), and the print job dispatcher of
+the server prints the waiting receipts of the connected device before switching to another one (next_job()).
+"""
+import zlib
+
+# receipts of one device printed while the receipts of other devices of the server wait, before switching
+DEVICE_BATCH_MAX = 20
+
+
+def server_key(server):
+    """Key of the ZfpLab server (host, port) in the postgres advisory locks (int4)."""
+    return zlib.crc32(f"{server[0]}:{server[1]}".encode()) & 0x7FFFFFFF
+
+
+def next_job(heads, device, served, batch_max=DEVICE_BATCH_MAX):
+    """Index in heads of the job to print next at a ZfpLab server connected to device, after served jobs
+    printed at it in a row. heads are the (job, device) ready to print, the oldest first (one per pos config:
+    the jobs of a pos config are printed in their order). The oldest job of the connected device goes first,
+    unless batch_max jobs of it were printed in a row while other devices wait: then the oldest job of another
+    device."""
+    if not heads:
+        return None
+    others = [index for index, (_job, head_device) in enumerate(heads) if head_device != device]
+    if served >= batch_max and others:
+        return others[0]
+    return next((index for index, (_job, head_device) in enumerate(heads) if head_device == device), 0)
@@ -0,0 +1,67 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""Reading the electronic journal (EJ) or the fiscal memory (FM) of a fiscal device, by Z report number.
+
+The report asked by ReadEJByZReportNum/ReadDetailedFMReportByZNum is sent by the device as text lines, read
+one by one with RawRead until the end line; read_report() yields them decoded, so that the caller writes
+them to the export file without keeping the report in memory. index_receipts() finds in the lines the
+fiscal receipts and the Z report that closed them, to link them to the pos orders.
+"""
+import re
+
+# commands that start the report of Z numbers StartNum..EndNum
+REPORT_COMMANDS = {'ej': 'ReadEJByZReportNum', 'fm': 'ReadDetailedFMReportByZNum'}
+LINE_END = "\n"
+# the device ends the report with this line; an empty read also ends it
+REPORT_END = "@"
+ENCODING = 'cp1250'
+
+# as printed by the devices: "BON FISCAL 0012" (receipt number) and "RAPORT Z 0041" (Z report number)
+RECEIPT_RE = re.compile(r"\bBON\s+FISCAL\s*(?:NR\.?)?\s*:?\s*(\d+)", re.IGNORECASE)
+Z_REPORT_RE = re.compile(r"\b(?:RAPORT\s+Z|Z\s+RAPORT|Z\s+REPORT)\s*(?:NR\.?)?\s*:?\s*(\d+)", re.IGNORECASE)
+
+
+def z_ranges(start, end, chunk):
+    """(first, last) Z numbers of the requests that read start..end, chunk Z reports at a time."""
+    chunk = max(chunk, 1)
+    for first in range(start, end + 1, chunk):
+        yield first, min(first + chunk - 1, end)
+
+
+def decode(raw):
+    "a line read by RawRead, without its end"
+    if isinstance(raw, (bytes, bytearray)):
+        raw = bytes(raw).decode(ENCODING, errors='replace')
+    return (raw or "").rstrip("\r\n")
+
+
+def read_report(fp, kind, first, last):
+    """Yields the lines of the EJ (kind 'ej') or FM ('fm') report of the Z numbers first..last."""
+    getattr(fp, REPORT_COMMANDS[kind])(first, last)
+    while True:
+        raw = fp.RawRead(0, LINE_END)
+        line = decode(raw)
+        if not raw or line == REPORT_END:
+            return
+        yield line
+
+
+def index_receipts(lines, last_z):
+    """Yields (z_num, receipt_num, line_no) of the fiscal receipts found in lines (line_no counted from 0).
+    A receipt belongs to the next Z report of the lines, or to last_z (the last Z report read) if none follows:
+    only closed Z reports are read, a Z report line not recognized must not make up a day."""
+    pending = []
+    for line_no, line in enumerate(lines):
+        z_match = Z_REPORT_RE.search(line)
+        if z_match:
+            z_num = int(z_match.group(1))
+            for receipt_num, receipt_line in pending:
+                yield z_num, receipt_num, receipt_line
+            pending = []
+            continue
+        receipt_match = RECEIPT_RE.search(line)
+        if receipt_match:
+            pending.append((int(receipt_match.group(1)), line_no))
+    for receipt_num, receipt_line in pending:
+        yield last_z, receipt_num, receipt_line
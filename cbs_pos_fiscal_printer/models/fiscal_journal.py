@@ -0,0 +1,50 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""The steps of a receipt at the fiscal device, as kept by the receipt journal (cbs.fiscal.receipt.journal).
+
+The journal entry of a receipt is committed before the receipt is sent and updated with the step reached
+after; a receipt that is not closed or cancelled is ended from its last known step before the next use of
+the device: a paid fiscal receipt can not be cancelled anymore, so its missing payments are sent and it is
+closed; an unpaid one is cancelled and printed again.
+"""
+
+STEPS = [('planned', 'Planned'), ('opened', 'Opened'), ('lines_sent', 'Lines sent'), ('paid', 'Paid'),
+         ('closed', 'Closed'), ('cancelled', 'Cancelled')]
+DONE_STEPS = ('closed', 'cancelled')
+
+OPEN_COMMANDS = frozenset(('OpenReceipt', 'OpenNonFiscalReceipt'))
+PAYMENT_COMMANDS = frozenset(('Payment',))
+CLOSE_COMMANDS = frozenset(('CloseReceipt', 'CloseNonFiscalReceipt', 'CashPayCloseReceipt'))
+
+
+def step_of(command_names):
+    """Step of a receipt after the device executed command_names, in order."""
+    step = 'planned'
+    for name in command_names:
+        if name in CLOSE_COMMANDS:
+            return 'closed'
+        if name in OPEN_COMMANDS:
+            step = 'opened'
+        elif name in PAYMENT_COMMANDS:
+            step = 'paid'
+        elif step == 'opened':
+            step = 'lines_sent'
+    return step
+
+
+def payments_done(command_names):
+    return sum(1 for name in command_names if name in PAYMENT_COMMANDS)
+
+
+def recovery_commands(step, done, payment_commands, opened_fiscal, opened_non_fiscal):
+    """(command, args) that end the receipt left open at the device (ReadStatus flags opened_fiscal,
+    opened_non_fiscal): the payments after the done ones and the close of a paid fiscal receipt, the cancel
+    of an unpaid one, the close of a non fiscal one; nothing if the device has no opened receipt."""
+    if opened_non_fiscal:
+        return [('CloseNonFiscalReceipt', ())]
+    if not opened_fiscal:
+        return []
+    if step == 'paid':
+        return [*payment_commands[done:], ('CloseReceipt', ())]
+    return [('CancelReceipt', ())]
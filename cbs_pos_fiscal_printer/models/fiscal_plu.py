@@ -0,0 +1,61 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""The articles (PLU) of the fiscal device database: what to program at the device so that it has the
+products of the pos, and which receipt lines can be sold by PLU number (pos.config._cbs_plu_sync)."""
+from typing import NamedTuple
+
+PLU_NAME_SYMBOLS = 34
+PLU_BARCODE_SYMBOLS = 13
+# OptionPrice of ProgPLUgeneral/ProgPLUprice: the device sells only at the programmed price
+PLU_PROGRAMMED_PRICE = '0'
+
+
+class PluState(NamedTuple):
+    """What a PLU has at the device."""
+    name: str  # ascii, at most PLU_NAME_SYMBOLS
+    price: float  # with VAT, rounded at 2 decimals
+    vat_class: str
+    barcode: str  # '' if not programmed
+
+
+def plu_name(ascii_name):
+    """The name of a PLU from the ascii product name; '|' would be a line feed at the device."""
+    return ascii_name.replace('|', '/')[:PLU_NAME_SYMBOLS]
+
+
+def plu_barcode(barcode):
+    """The barcode a PLU can have: only EAN13."""
+    return barcode if barcode and len(barcode) == PLU_BARCODE_SYMBOLS and barcode.isdigit() else ''
+
+
+def assign_numbers(product_ids, numbers, capacity):
+    """{product id: PLU number} of product_ids: the product keeps its number of numbers ({product id: PLU
+    number} at the device); the others get the lowest free numbers from 1 to capacity, in the order of
+    product_ids, while there are free numbers."""
+    wanted = set(product_ids)
+    res = {product_id: number for product_id, number in numbers.items()
+           if product_id in wanted and 1 <= number <= capacity}
+    used = set(res.values())
+    free = (number for number in range(1, capacity + 1) if number not in used)
+    for product_id in product_ids:
+        if product_id not in res:
+            number = next(free, None)
+            if number is None:
+                break
+            res[product_id] = number
+    return res
+
+
+def plu_commands(number, old, new, department=0):
+    """[(FP method name, arguments)] that change the PLU number from old (a PluState or None if unknown)
+    to new; only what is different is programmed."""
+    commands = []
+    if old is None or old.name != new.name or old.vat_class != new.vat_class:
+        commands.append(("ProgPLUgeneral", (number, new.name, new.price, PLU_PROGRAMMED_PRICE, new.vat_class,
+                                            department, 0, 0)))
+    elif old.price != new.price:
+        commands.append(("ProgPLUprice", (number, new.price, PLU_PROGRAMMED_PRICE, 0, 0)))
+    if new.barcode and (old is None or old.barcode != new.barcode):
+        commands.append(("ProgPLUbarcode", (number, new.barcode)))
+    return commands
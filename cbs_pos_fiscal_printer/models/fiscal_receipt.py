@@ -0,0 +1,175 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""The receipt plan: what is printed for a pos order, as plain python data.
+
+It is built from the database (pos.order._cbs_receipt_plan) before the conversation with the fiscal device,
+so that the device does not wait for the ORM; render() makes it the device commands of the document, sent by
+the conversation as they are (pos.order._cbs_emit_document). It is also kept as json in the receipt journal
+(cbs.fiscal.receipt.journal), to end a receipt left open at the device.
+"""
+import json
+import logging
+from typing import NamedTuple
+
+_logger = logging.getLogger(__name__)
+
+
+class ReceiptLine(NamedTuple):
+    texts: tuple  # sanitized text lines printed before the sale; all the text of the line at a non fiscal receipt
+    name: str  # name of the sale at a fiscal receipt (last line of the product name)
+    vat_class: str  # tremol VAT class
+    price_unit: float
+    qty: float
+    price_subtotal_incl: float
+    is_sale: bool  # not a line of a return
+    plu: int = 0  # sold by this PLU number of the fiscal device database, not by name/price/VAT class
+
+
+class ReceiptPayment(NamedTuple):
+    amount: float
+    is_cash: bool
+
+
+class ReceiptPlan(NamedTuple):
+    order_id: int
+    fiscal: bool  # a fiscal receipt, else a non fiscal one
+    show_amounts: bool  # at a non fiscal receipt: the prices, the total and the payments are printed
+    operator_password: str
+    print_type: object  # third argument of OpenReceipt/OpenNonFiscalReceipt
+    cash_drawer_open: bool
+    return_line_ids: tuple
+    lines: tuple  # of ReceiptLine, in printing order
+    amount_total: float
+    payments: tuple  # of ReceiptPayment
+    footer: tuple  # sanitized text lines
+    barcode: str  # printed as text; as barcode also if print_barcode
+    print_barcode: bool
+
+    @property
+    def cash_payments(self):
+        return tuple(payment for payment in self.payments if payment.is_cash)
+
+    @property
+    def non_cash_payments(self):
+        return tuple(payment for payment in self.payments if not payment.is_cash)
+
+    @property
+    def cash_amount(self):
+        return sum(payment.amount for payment in self.cash_payments)
+
+    @property
+    def non_cash_amount(self):
+        return sum(payment.amount for payment in self.non_cash_payments)
+
+    @property
+    def payment_commands(self):
+        """(command, args) of the payments of a fiscal receipt, in printing order: the cash payments in one
+        Payment of type 0, then a Payment of type 1 for each non cash one."""
+        res = []
+        if self.cash_payments and self.cash_amount >= 0.01:
+            res.append(('Payment', (0, self.cash_amount)))
+        res.extend(('Payment', (1, payment.amount)) for payment in self.non_cash_payments if payment.amount > 0.01)
+        return tuple(res)
+
+    def to_json(self):
+        return json.dumps(self)
+
+    @classmethod
+    def from_json(cls, text):
+        plan = cls(*json.loads(text))
+        return plan._replace(return_line_ids=tuple(plan.return_line_ids), footer=tuple(plan.footer),
+                             lines=tuple(ReceiptLine(tuple(line[0]), *line[1:]) for line in plan.lines),
+                             payments=tuple(ReceiptPayment(*payment) for payment in plan.payments))
+
+
+def render(plan):
+    """The FP commands (command, args) that print the receipt plan, from opening to closing of the receipt;
+    computed without the device, once per document."""
+    ops = []
+    # opening a fiscal receipt or nor fiscal
+    if plan.fiscal:
+        ops.append(('OpenReceipt', (1, plan.operator_password, plan.print_type)))
+    else:
+        # for fiscal printer must be "0000", for fiscal cascher must be "0" (operator 1 password)
+        # fp.OpenNonFiscalReceipt(1, "0", 0)  # OperPass
+        # fp.OpenNonFiscalReceipt(1, "0000", 0)
+        ops.append(('OpenNonFiscalReceipt', (1, plan.operator_password, plan.print_type)))
+
+    if not plan.fiscal:
+        # ******************** NON fiscal bill *************************
+        if plan.return_line_ids:
+            ops.append(('PrintText', (f"RETUR AL: {list(plan.return_line_ids)}",)))
+        for line in plan.lines:
+            # we just write some info like a recipt
+            ops.extend(('PrintText', (text,)) for text in line.texts)
+            if plan.show_amounts:
+                ops.append(('PrintText',
+                            (f"{line.qty:0.1f}X{line.price_unit:0.2f}X tax={line.price_subtotal_incl:0.2f}",)))
+        if plan.show_amounts:
+            # the amount is important only when you want to print nonfiscal receipt or negative
+            # when we print consume we do not want
+            ops.append(('PrintText', (f"TOTAL: {plan.amount_total:0.2f}",)))
+            for payment in plan.payments:
+                if payment.is_cash:
+                    ops.append(('PrintText', (f"PLATA prin casa: {payment.amount:0.2f}lei",)))
+                    if plan.cash_drawer_open:
+                        ops.append(('CashDrawerOpen', ()))
+                else:
+                    ops.append(('PrintText', (f"PLATA NU prin casa: {payment.amount:0.2f}lei",)))
+    else:
+        # ******************** fiscal bill *************************
+        # ******** here the amount is at least 0.01
+        for line in plan.lines:
+            ops.extend(('PrintText', (text,)) for text in line.texts)
+            # choose the VAT at tremol fiscal printer
+            # vat 'A' - VAT Class A 19, 'B' - VAT Class B 9, 'C' - VAT Class C 5, 'D' - VAT Class D 0,
+            # 'E' - VAT Class E 0, 'F' - Alte taxe 0
+            # the efective sale line
+            if line.plu:
+                # the device has the name, the price and the VAT class of the article
+                ops.append(('SellPLUFromFD_DB', ('+', line.plu, line.qty)))
+            elif line.is_sale and (line.price_unit * line.qty > 0):
+                # 0.01  =  unit price including vat, 1 = quantity
+                ops.append(('SellPLUwithSpecifiedVAT', (line.name, line.vat_class, line.price_unit, line.qty)))
+            else:  # is STORNO ( some + values and some - values with sum > 0.01) or is DISCOUNT
+                # the fiscal printer will write a storno before; you are not allowd to have less than 0.01
+                # first time the + lines than the - ones, here we are the -, where given qty must be>1 and price <0
+                _logger.debug("storno %r %s %s %s", line.name, line.vat_class, line.price_unit, line.qty)
+                if line.price_unit < 0:  # is discount
+                    ops.append(('StornoPLU', (line.name, line.vat_class, line.price_unit, line.qty)))
+                else:  # is strono  qty<0       here we need to change the - form qty to price unit
+                    ops.append(('StornoPLU', (line.name, line.vat_class, (-1) * line.price_unit, line.qty * (-1))))
+        # print cash payments
+        cash_payments = plan.cash_payments
+        cash_payment_amount = plan.cash_amount
+        if len(cash_payments) > 1:
+            # the fiscal pirnter does only know the amont that was paid ( not also the rest)
+            ops.extend(('PrintText', (f"Numerar:{cash_payment.amount}",)) for cash_payment in cash_payments)
+        if cash_payments:
+            if cash_payment_amount < 0.01:
+                _logger.error("fiscal printer should give erorr because is a negative amount"
+                              f"{plan.order_id=} {cash_payments=} {cash_payment_amount=}")
+            elif plan.cash_drawer_open:
+                ops.append(('CashDrawerOpen', ()))
+        # OptionPaymentType: 0 cash, 1 card  bank or what is defined,
+        # 2 thichete 4 bonuri 5 voucher  6 credit 7 moderne 8 aletele 9 euro
+        ops.extend(plan.payment_commands)
+
+    # print footer text for fiscal or not fiscal
+    ops.extend(('PrintText', (f_line,)) for f_line in plan.footer)
+
+    # barcode
+    if plan.print_barcode:
+        # 0 UPC A, 1 UPC E, 2 EAN 13, 3 EAN 8, 4 CODE 39, 5 ITF, 6 CODABAR, H CODE 93, I CODE 128
+        ops.append(('PrintBarcode', ("4", len(plan.barcode), plan.barcode)))  # 4=CODE 39 thre resta re not working
+    ops.append(('PrintText', (plan.barcode,)))
+
+    ops.append(('CloseReceipt', ()) if plan.fiscal else ('CloseNonFiscalReceipt', ()))
+    return ops
+
+
+def emit(fp, ops):
+    """Sends the rendered commands to the FP fp."""
+    for command, args in ops:
+        getattr(fp, command)(*args)
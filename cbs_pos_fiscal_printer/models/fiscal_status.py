@@ -0,0 +1,43 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""The status of a fiscal device (ReadStatus) as the values of its cbs.fiscal.device.status row.
+
+The heartbeat reads it in the background; a receipt is refused at once while the device is in an 'error'
+or 'unreachable' state, without waiting for the timeouts of the connection or the error of the device.
+"""
+
+# field of cbs.fiscal.device.status: (attribute of FP.__StatusRes__, level, printed message)
+# a flag of level 'error' stops the receipts; 'warning' is only shown
+STATUS_FLAGS = {
+    'no_paper': ('Printer_not_ready_or_no_paper', 'error', "Printer not ready or no paper"),
+    'overheated': ('Printer_not_ready_or_overheated', 'error', "Printer not ready or overheated"),
+    'blocked_24h': ('Blocking_after_24_hours', 'error', "Blocked after 24 hours without Z report"),
+    'fm_full': ('FM_full', 'error', "Fiscal memory full"),
+    'fm_error': ('FM_error', 'error', "Fiscal memory error"),
+    'ej_full': ('EJ_full', 'error', "Electronic journal full"),
+    'near_paper_end': ('Near_Paper_end', 'warning', "Near paper end"),
+    'opened_fiscal_receipt': ('Opened_Fiscal_Receipt', 'warning', "Opened fiscal receipt"),
+    'opened_non_fiscal_receipt': ('Opened_Non_fiscal_Receipt', 'warning', "Opened non fiscal receipt"),
+    'fm_near_full': ('FM_near_full', 'warning', "Fiscal memory near full"),
+    'ej_near_full': ('EJ_near_full', 'warning', "Electronic journal near full"),
+}
+
+# states that stop the receipts
+BLOCKING_STATES = ('error', 'unreachable')
+
+
+def device_status(status):
+    """Values of cbs.fiscal.device.status from the __StatusRes__ of ReadStatus: the flags, the state
+    (the worst level of the set flags, else 'ok') and the messages of the set flags."""
+    vals = {field: bool(getattr(status, attr)) for field, (attr, _level, _message) in STATUS_FLAGS.items()}
+    levels = [STATUS_FLAGS[field][1] for field, value in vals.items() if value]
+    vals['state'] = 'error' if 'error' in levels else 'warning' if levels else 'ok'
+    vals['message'] = "; ".join(STATUS_FLAGS[field][2] for field, value in vals.items()
+                                if field in STATUS_FLAGS and value) or False
+    return vals
+
+
+def failed_status(state, message):
+    """Values of cbs.fiscal.device.status when the status was not read: the flags are not known."""
+    return dict({field: False for field in STATUS_FLAGS}, state=state, message=message)
@@ -0,0 +1,43 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""The ascii text printed on the receipts, memoized per worker process.
+
+The same product names and footers are printed again and again; their transliteration (unidecode) and
+splitting in printer lines is done once and kept in bounded LRU caches. The key is the text itself, so a
+cached value is never wrong; clear() only frees the entries of texts that are not printed anymore (renamed
+products, other line width).
+"""
+from functools import lru_cache
+
+from unidecode import unidecode
+
+TEXT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def ascii_text(text):
+    """The text with ascii symbols only: unidecode('François 北亰') == 'Francois Bei Jing '."""
+    return unidecode(text)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def printer_lines(text, width):
+    """The ascii lines of text split every width symbols; a tuple shared by the callers."""
+    return tuple(unidecode(text[i:i + width]) for i in range(0, len(text), width))
+
+
+def clear():
+    ascii_text.cache_clear()
+    printer_lines.cache_clear()
+
+
+def stats():
+    """{cache name: {'hits', 'misses', 'size', 'hit_rate'}} since the start of the process or the last clear()."""
+    res = {}
+    for function in (ascii_text, printer_lines):
+        info = function.cache_info()
+        calls = info.hits + info.misses
+        res[function.__name__] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize,
+                                  'hit_rate': info.hits / calls if calls else 0.0}
+    return res
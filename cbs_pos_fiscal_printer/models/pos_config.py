@@ -1,18 +1,51 @@
 # Copyright 2023 cbssolutions.ro
 # License OPL-1.0 or later (Odoo Proprietary License)
 # (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import psycopg2
 import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
 from .FP_core import ServerException, SErrorType
-from .FP import FP, Enums
+from .FP import FP, __LastAndTotalReceiptNumRes__ as LastAndTotalReceiptNum
+from . import FP_metrics, FP_registry, fiscal_arbiter, fiscal_journal, fiscal_plu, fiscal_status, fiscal_text
+from .cbs_pos_tax_vat_class import TREMOL_VAT_CLASSES
+from .fiscal_receipt import ReceiptPlan
 from urllib.parse import urlparse
 import logging
 import traceback
 
 
-from odoo import api, fields, models, tools, _
+from odoo import api, fields, models, registry, tools, _
 from odoo.exceptions import ValidationError, UserError
 _logger = logging.getLogger(__name__)
 
+# PLUs programmed in one use of the fiscal device; the receipts wait only for one chunk
+PLU_SYNC_CHUNK = 50
+# fiscal devices checked at the same time by the heartbeat
+HEARTBEAT_THREADS = 8
+# namespace of the postgres advisory locks taken by the workers printing through a ZfpLab server shared by
+# several fiscal devices (fiscal_arbiter)
+SERVER_LOCK_NAMESPACE = 7303
+# the fields of the ZfpLab server and fiscal device of a pos config (_cbs_fiscal_server_devices)
+FISCAL_DEVICE_FIELDS = {'active', 'cbs_fiscal_printer_server_ip', 'cbs_fiscal_printer_ip', 'cbs_fiscal_printer_port',
+                        'cbs_fiscal_printer_password', 'cbs_fiscal_printer_serial_port',
+                        'cbs_fiscal_printer_serial_speed'}
+
+# after these errors the server or the device must be verified again
+HANDSHAKE_ERROR_CODES = (SErrorType.ServerConnectionError, SErrorType.ServerResponseMissing,
+                         SErrorType.ServerDefsMismatch, SErrorType.ServMismatchBetweenDefinitionAndFPResult,
+                         SErrorType.ServSockConnectionFailed, SErrorType.ServTCPAuth,
+                         SErrorType.ServWrongTcpConnSettings, SErrorType.ServWrongSerialPortConnSettings,
+                         SErrorType.ClientSettingsNotInitialized)
+
+
+class FiscalDeviceOffline(ValidationError):
+    """The ZFP server or the fiscal device can not print now (unreachable, no paper, blocked); the print jobs
+    wait for the heartbeat to see it back."""
+
 
 class PosConfig(models.Model):
     _inherit = ['pos.config', 'mail.thread']
@@ -38,6 +71,28 @@ class PosConfig(models.Model):
                                                      help='Serial speed for port where the fiscal device is '
                                                      'connected to the server.')
 
+    cbs_fiscal_server_connect_timeout = fields.Float(
+        default=2, help="Seconds to wait for opening the connection to the ZFP server.")
+    cbs_fiscal_server_read_timeout = fields.Float(
+        default=30, help="Seconds to wait for the ZFP server answer to a command (the printing of it).")
+
+    cbs_fiscal_handshake_ttl = fields.Integer(
+        default=300, help="Seconds a verified connection ZFP server/fiscal device is trusted without verifying it "
+        "again before a print. 0 verifies it at every print. Is verified again also after a connection error.")
+    cbs_fiscal_status_ttl = fields.Integer(
+        default=120, help="Seconds the status of the fiscal device read by the heartbeat (cron, button Check status) "
+        "is trusted: while it is unreachable, without paper or blocked, the receipts fail at once instead of after "
+        "the connection timeouts. 0 always asks the device.")
+    cbs_slow_receipt_ms = fields.Integer(
+        default=3000, string="Slow receipt ms", help="A receipt printed in more milliseconds is kept in the slow "
+        "receipts, with the time of each request to the ZFP server. 0 keeps none.")
+    cbs_fiscal_status_ids = fields.One2many('cbs.fiscal.device.status', 'config_id', string="Fiscal device status",
+                                            readonly=True)
+    cbs_print_job_max_attempts = fields.Integer(
+        default=3, help="How many times the POS print job of a receipt is tried before being left in error.")
+    cbs_print_job_retry_delay = fields.Integer(
+        default=5, help="Seconds to wait before the first retry of a failed print job; doubled at each retry.")
+
     cbs_operator_password = fields.Char(default='0', help="Is the parameter OperPass that is default '0' for fiscal "
                                         "casher and '0000' for fiscal printers. We are using the operator 1.")
     cbs_print_non_fiscal_receipt = fields.Boolean(default=1, help='All receipts will be non fiscal.')
@@ -56,170 +111,604 @@ class PosConfig(models.Model):
     cbs_fiscal_printer_line_symbols = fields.Integer(default=32, help="Max nr of characters per printed line. "
                                                      "Used to split on more lines for example the product name.")
     cbs_receipt_product_name_max_lines = fields.Integer(default=3, help="Max lines what a long product name can have.")
+    cbs_print_text_max_symbols = fields.Integer(
+        default=0, help="Max symbols the fiscal device accepts in one text command; it wraps a longer text at "
+        "cbs_fiscal_printer_line_symbols. Consecutive text lines of a receipt are sent together in commands of up "
+        "to this many symbols. 0 sends each line in its own command.")
+    cbs_fiscal_receipt_print_type = fields.Selection(
+        [('0', 'Step by step'), ('2', 'Postponed'), ('4', 'Buffered')], default='0', required=True,
+        help="How the fiscal device prints a fiscal receipt: step by step prints each line when it is received; "
+        "postponed and buffered keep the lines in the device until the receipt is closed, so an error of a line "
+        "cancels the receipt before printing anything and the device does not wait the printing of each line.")
+    cbs_non_fiscal_postponed_print = fields.Boolean(
+        help="The non fiscal receipts are printed when they are closed, as one document (postponed printing), "
+        "not line by line as the commands arrive.")
 
     cbs_no_vat_class = fields.Selection(
-        [('A', 'A'), ('B', 'B'), ('C', 'C'), ('D', 'D'), ('E', 'E'), ('F', 'F')], require=1,
+        TREMOL_VAT_CLASSES, require=1,
         help='If you sell without vat, what vat to put from tremol VAT rates.', default="E")
-    cbs_odoo_tax_id_to_tremol_vat_json = fields.Char(
-        default='{}', help='A json mapping the id of tax to tremol vat class '
-        'like for example {"3":"A", "30":"B"} will map the tax with id=3 from odoo '
-        'to VAT rateA from tremol that is usualy 19.00; If mapping does not match will take the configured A VAT rate.')
+    cbs_tax_vat_class_ids = fields.One2many(
+        'cbs.pos.tax.vat.class', 'config_id', string="Tax VAT classes", copy=True,
+        help='The tremol VAT class of the lines by their first odoo tax, like the tax of 19% to VAT class A that is '
+        'usualy 19.00. A line with a tax that is not here takes the VAT class A.')
+    cbs_fiscal_device_serial = fields.Char(readonly=True, help="Serial number of the fiscal device, read at the "
+                                           "handshake; stored on the printed pos orders.")
+    cbs_sell_by_plu = fields.Boolean(
+        help="The products of the pos are programmed as articles (PLU) in the fiscal device database (cron and "
+        "button Sync PLU) and the fiscal receipts sell them by PLU number. A line with a product not yet "
+        "programmed or with another price/VAT class than the programmed one is sold by its text.")
+    cbs_plu_count = fields.Integer(default=1000, help="How many PLUs the fiscal device database has.")
+    cbs_plu_department = fields.Integer(help="Department (BelongToDepNum) of the programmed PLUs.")
+    cbs_plu_ids = fields.One2many('cbs.fiscal.plu', 'config_id', string="Fiscal device PLUs", readonly=True)
 
 # existing fileds just for tracking
     receipt_header = fields.Text(tracking=1, default="")
     receipt_footer = fields.Text(tracking=1, default="")
 
-    def cbs_test_print_at_fiscal_server(self):
-        if not self.cbs_fiscal_printer_server_ip:
-            raise ValidationError("You do not have configured in pos config the cbs_fiscal_printer_server_ip."
-                                  " Support at dev@cbssolutions.ro.")
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        if any(FISCAL_DEVICE_FIELDS.intersection(vals) for vals in vals_list):
+            self.clear_caches()  # _cbs_fiscal_server_devices
+        return records
+
+    def write(self, vals):
+        if 'cbs_fiscal_printer_line_symbols' in vals:
+            fiscal_text.clear()  # the printer lines of the old width are not printed anymore
+        res = super().write(vals)
+        if FISCAL_DEVICE_FIELDS.intersection(vals):
+            self.clear_caches()  # _cbs_fiscal_server_devices
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.clear_caches()  # _cbs_fiscal_server_devices
+        return res
+
+    @tools.ormcache('self.id')
+    def _cbs_tax_vat_classes(self):
+        """{account.tax id: tremol VAT class} of cbs_tax_vat_class_ids; cached, cleared when the rows change.
+        Do not modify the returned dict."""
+        return {row.tax_id.id: row.vat_class for row in self.cbs_tax_vat_class_ids}
+
+    def _cbs_vat_classes_of_lines(self, lines):
+        """{pos.order.line id: tremol VAT class} of the lines, by their first tax."""
+        self.ensure_one()
+        tax_vat_classes = self._cbs_tax_vat_classes()
+        res = {}
+        for line in lines:
+            taxes = line.tax_ids
+            res[line.id] = tax_vat_classes.get(taxes[:1].id, 'A') if taxes else self.cbs_no_vat_class
+        return res
+
+    def _cbs_plu_numbers(self):
+        """{product id: (PLU number, price, VAT class)} of the products that the fiscal receipts can sell by
+        PLU number."""
+        self.ensure_one()
+        if not self.cbs_sell_by_plu:
+            return {}
+        rows = self.env['cbs.fiscal.plu'].search_read([('config_id', '=', self.id)],
+                                                      ['product_id', 'plu_number', 'price', 'vat_class'])
+        return {row['product_id'][0]: (row['plu_number'], row['price'], row['vat_class']) for row in rows}
+
+    def _cbs_plu_product_state(self, product):
+        "fiscal_plu.PluState that the PLU of product must have"
+        taxes = product.taxes_id.filtered(lambda t: t.company_id == self.company_id)
+        vat_class = self._cbs_tax_vat_classes().get(taxes[:1].id, 'A') if taxes else self.cbs_no_vat_class
+        return fiscal_plu.PluState(name=fiscal_plu.plu_name(fiscal_text.ascii_text(product.name)),
+                                   price=round(product.lst_price, 2), vat_class=vat_class,
+                                   barcode=fiscal_plu.plu_barcode(product.barcode))
+
+    def cbs_plu_sync(self):
+        "button Sync PLU"
+        for config in self:
+            if not config.cbs_sell_by_plu:
+                raise ValidationError(f"{config.name}: sell by PLU is not enabled.")
+            config._cbs_plu_sync()
+
+    @api.model
+    def _cron_plu_sync(self):
+        for config in self.search([('cbs_sell_by_plu', '=', True), ('cbs_fiscal_printer_server_ip', '!=', False)]):
+            try:
+                config._cbs_plu_sync(commit=True)
+            except Exception:
+                self.env.cr.rollback()
+                _logger.exception("PLU sync of pos.config %s", config.id)
+
+    def _cbs_plu_sync(self, commit=False):
+        """Programs at the fiscal device the PLUs of the products available in the pos that are new or
+        changed since the last sync (compared with cbs_plu_ids); the device is used in chunks of
+        PLU_SYNC_CHUNK PLUs, so the receipts are printed between them. Returns the number of PLUs programmed."""
+        self.ensure_one()
+        products = self.env['product.product'].search([('available_in_pos', '=', True), ('sale_ok', '=', True)],
+                                                      order='id')
+        rows = self.env['cbs.fiscal.plu'].search([('config_id', '=', self.id)])
+        row_of_product = {row.product_id.id: row for row in rows}
+        numbers = fiscal_plu.assign_numbers(products.ids, {row.product_id.id: row.plu_number for row in rows},
+                                            self.cbs_plu_count)
+        # products not in the pos anymore: their numbers are free, the device data is overwritten when reused
+        rows.filtered(lambda r: numbers.get(r.product_id.id) != r.plu_number).unlink()
+        todo = []
+        for product in products:
+            number = numbers.get(product.id)
+            if not number:
+                continue  # the device database is full; sold by text
+            row = row_of_product.get(product.id)
+            old = row._cbs_state() if row and row.exists() else None
+            new = self._cbs_plu_product_state(product)
+            commands = fiscal_plu.plu_commands(number, old, new, self.cbs_plu_department)
+            if commands:
+                todo.append((product, number, new, commands))
+        done = 0
+        for chunk in tools.split_every(PLU_SYNC_CHUNK, todo):
+            with self._cbs_fiscal_printer() as fp:
+                for product, number, new, commands in chunk:
+                    try:
+                        for method, args in commands:
+                            getattr(fp, method)(*args)
+                    except ServerException as ex:
+                        if ex.code in HANDSHAKE_ERROR_CODES:
+                            raise
+                        _logger.warning("PLU %s of product %s not programmed: %s", number, product.id, ex)
+                        continue  # sold by text until the next sync
+                    vals = {'name': new.name, 'price': new.price, 'vat_class': new.vat_class,
+                            'barcode': new.barcode, 'sync_date': fields.Datetime.now()}
+                    row = row_of_product.get(product.id)
+                    if row and row.exists():
+                        row.write(vals)
+                    else:
+                        self.env['cbs.fiscal.plu'].create(dict(vals, config_id=self.id, product_id=product.id,
+                                                               plu_number=number))
+                    done += 1
+            if commit:
+                self.env.cr.commit()
+        _logger.info("pos.config %s: %s PLUs programmed at the fiscal device", self.id, done)
+        return done
+
+    def cbs_fiscal_status(self):
+        "used from pos: the last status of the fiscal device, as read by the heartbeat; the device is not asked"
+        self.ensure_one()
+        status = self.env['cbs.fiscal.device.status'].sudo().search([('config_id', '=', self.id)])
+        return status.cbs_read() if status else {}
+
+    def _cbs_fiscal_status_check(self):
+        """Raises ValidationError if the status of the fiscal device read in the last cbs_fiscal_status_ttl
+        seconds stops the receipts (unreachable, no paper, blocked...)."""
+        self.ensure_one()
+        if self.cbs_fiscal_status_ttl <= 0:
+            return
+        status = self.env['cbs.fiscal.device.status'].sudo().search([
+            ('config_id', '=', self.id), ('state', 'in', fiscal_status.BLOCKING_STATES),
+            ('checked_at', '>=', fields.Datetime.now() - timedelta(seconds=self.cbs_fiscal_status_ttl))])
+        if status:
+            raise FiscalDeviceOffline(
+                f"The fiscal device of {self.name} is {status.state} since {status.checked_at}: {status.message}. "
+                "After fixing it press Check status in the pos config (or wait for the next check). "
+                "Support at dev@cbssolutions.ro.")
+
+    def cbs_heartbeat(self):
+        "button Check status"
+        for config in self:
+            config._cbs_heartbeat()
+
+    @api.model
+    def _cron_heartbeat(self):
+        """Checks the fiscal devices of the pos configs with an open session, up to HEARTBEAT_THREADS in
+        parallel."""
+        sessions = self.env['pos.session'].search([('state', 'in', ('opening_control', 'opened'))])
+        configs = sessions.config_id.filtered('cbs_fiscal_printer_server_ip')
+        if len(configs) <= 1 or getattr(threading.current_thread(), 'testing', False):
+            for config in configs:
+                config._cbs_heartbeat()
+            return
+        dbname, uid, context = self.env.cr.dbname, self.env.uid, self.env.context
+        with ThreadPoolExecutor(max_workers=min(HEARTBEAT_THREADS, len(configs)),
+                                thread_name_prefix="cbs_fiscal_heartbeat") as executor:
+            list(executor.map(lambda config_id: self._cbs_heartbeat_thread(dbname, uid, context, config_id),
+                              configs.ids))
+
+    @api.model
+    def _cbs_heartbeat_thread(self, dbname, uid, context, config_id):
+        with registry(dbname).cursor() as cr:
+            env = api.Environment(cr, uid, context)
+            env[self._name].browse(config_id)._cbs_heartbeat()
+
+    def _cbs_heartbeat(self):
+        """Reads the status of the fiscal device into its cbs.fiscal.device.status. It goes through the FP
+        client of the device like a receipt, so it also makes the handshake when it is due and leaves an open
+        pooled connection to the server: the next receipt of this worker finds both ready. A device (or a
+        shared ZFP server) printing now is not waited for. Returns the status, if read."""
+        self.ensure_one()
+        try:
+            client = FP_registry.get_client(self._cbs_fiscal_server_address(), self._cbs_fiscal_device())
+            if self._cbs_fiscal_server_shared():
+                self._cbs_fiscal_server_lock(timeout=0)
+            # the locks are reentrant: _cbs_fiscal_printer takes them again in this thread
+            with client.use(timeout=0), self._cbs_fiscal_printer() as fp:
+                status = fp.ReadStatus()
+                vals = fiscal_status.device_status(status)
+                # a receipt interrupted while the device was away is ended before the next one
+                self._cbs_journal_recover(fp, status)
+        except FP_registry.DeviceBusyError:
+            return self.env['cbs.fiscal.device.status']  # a receipt is printing: the device works
+        except Exception as ex:
+            self._cbs_fiscal_error(ex)
+            state = 'error' if isinstance(ex, ServerException) and ex.code not in HANDSHAKE_ERROR_CODES \
+                else 'unreachable'
+            _logger.info("pos.config %s: fiscal device %s: %s", self.id, state, ex)
+            vals = fiscal_status.failed_status(state, str(ex.args[0] if len(ex.args) == 1 else ex))
+        status = self.env['cbs.fiscal.device.status'].sudo().cbs_set(self, vals)
+        if status.state not in fiscal_status.BLOCKING_STATES:
+            self.env['cbs.fiscal.print.job'].sudo().cbs_drain(self)
+        return status
+
+    def _cbs_journal_recover(self, fp, status=None):
+        """Ends the receipts of this config left interrupted in the journal (not closed or cancelled), from
+        their last known step (fiscal_journal.recovery_commands); fp is the FP of the device, used by this
+        thread, status its ReadStatus if just read. A fiscal receipt found closed gets its numbers and its
+        waiting print jobs are done. Returns the orders of the receipts ended as closed."""
+        self.ensure_one()
+        journal = self.env['cbs.fiscal.receipt.journal'].sudo()
+        entries = journal.cbs_open_entries(self)
+        closed = self.env['pos.order']
+        if not entries:
+            return closed
+        status = status or fp.ReadStatus()
+        counters = fp.ReadLastAndTotalReceiptNum()
+        for entry, next_entry in zip(entries, entries[1:] + [None]):
+            plan = ReceiptPlan.from_json(entry['plan'])
+            order = self.env['pos.order'].browse(entry['order_id'])
+            message = f"recovered from {entry['step']}"
+            if next_entry:
+                # the device printed after it: only the counters tell what happened
+                commands, after_total = [], next_entry['before_total_counter']
+            else:
+                commands = fiscal_journal.recovery_commands(
+                    entry['step'], entry['payments_done'], plan.payment_commands, status.Opened_Fiscal_Receipt,
+                    status.Opened_Non_fiscal_Receipt)
+                message += self._cbs_journal_send(fp, commands)
+                if commands:
+                    counters = fp.ReadLastAndTotalReceiptNum()
+                after_total = counters.TotalReceiptCounter
+            if entry['fiscal']:
+                done = after_total > entry['before_total_counter']
+            else:
+                done = entry['step'] != 'planned' or bool(commands)
+            if done and entry['fiscal'] and order:
+                if next_entry:
+                    message += "; the receipt number is not known"
+                else:
+                    before = LastAndTotalReceiptNum(entry['before_receipt_num'], entry['before_total_counter'])
+                    order.write(order._cbs_fiscal_receipt_printed(plan, before, counters))
+                for job in self.env['cbs.fiscal.print.job'].sudo().search([('order_id', '=', order.id),
+                                                                           ('state', '=', 'pending')]):
+                    job._cbs_set_result({'ok_printed_pos_order_id': (order.id, order.name, plan.barcode)})
+            _logger.warning("pos.config %s: receipt of pos.order %s %s, %s", self.id, order.id,
+                            'closed' if done else 'cancelled', message)
+            journal.browse(entry['id']).cbs_step(step='closed' if done else 'cancelled', message=message,
+                                                 recovered=True)
+            if done:
+                closed |= order
+        return closed
+
+    @staticmethod
+    def _cbs_journal_send(fp, commands):
+        "sends the recovery commands; returns what to add to the journal message"
+        for command, args in commands:
+            try:
+                getattr(fp, command)(*args)
+            except ServerException as ex:
+                if command != 'CancelReceipt' or ex.code in HANDSHAKE_ERROR_CODES:
+                    raise
+                # a payment was done (by a receipt not in the journal): it can only be closed
+                fp.CashPayCloseReceipt()
+                return f"; not cancelled ({ex}), closed with the rest paid in cash: verify it"
+        return f"; sent {', '.join(command for command, _args in commands)}" if commands else ""
+
+    def _cbs_fiscal_error(self, ex):
+        """To call with the exceptions of the fiscal printing; forgets the handshake of the device, and the device
+        connected to the server for all the workers, if the error is about the connection with the server or the
+        device."""
+        if isinstance(ex, ServerException) and ex.code in HANDSHAKE_ERROR_CODES:
+            FP_registry.invalidate(self._cbs_fiscal_server_address(), self._cbs_fiscal_device())
+            self.env['cbs.fiscal.server.device'].sudo().cbs_forget(self._cbs_fiscal_server_address())
+
+    def _cbs_fiscal_server_address(self):
+        "(hostname, port) of ZFP server"
         cbs_fiscal_printer_server_ip = self.cbs_fiscal_printer_server_ip
         if "//" not in cbs_fiscal_printer_server_ip:
             cbs_fiscal_printer_server_ip = f"//{cbs_fiscal_printer_server_ip}"  # wihout // is not spliting
         url = urlparse(cbs_fiscal_printer_server_ip)
-        hostname = url.hostname
-        port = url.port
-        if not port:
-            port = 4444
+        return url.hostname, url.port or 4444
+
+    def _cbs_fiscal_device(self):
+        "key of the fiscal device in the ZFP server: ('tcp', ip, port, password) or ('serial', port, speed)"
+        if self.cbs_fiscal_printer_ip:
+            return ('tcp', self.cbs_fiscal_printer_ip, self.cbs_fiscal_printer_port,
+                    self.cbs_fiscal_printer_password or None)
+        if self.cbs_fiscal_printer_serial_port:
+            return ('serial', self.cbs_fiscal_printer_serial_port, self.cbs_fiscal_printer_serial_speed)
+        raise ValidationError(
+            "You did not configure ip or port for fiscal printer. "
+            "Support at dev@cbssolutions.ro.")
+
+    @api.model
+    @tools.ormcache('server')
+    def _cbs_fiscal_server_devices(self, server):
+        """frozenset of (pos config id, fiscal device) of the pos configs printing through the ZfpLab server
+        (hostname, port); cached, cleared when the server or device of a pos config changes."""
+        devices = set()
+        for config in self.sudo().search([('cbs_fiscal_printer_server_ip', '!=', False)]):
+            try:
+                if config._cbs_fiscal_server_address() == server:
+                    devices.add((config.id, config._cbs_fiscal_device()))
+            except ValidationError:
+                continue  # no device configured
+        return frozenset(devices)
+
+    def _cbs_fiscal_server_shared(self):
+        "the ZFP server of this config works also with the fiscal device of another pos config"
+        device = self._cbs_fiscal_device()
+        return any(config_id != self.id and other != device
+                   for config_id, other in self._cbs_fiscal_server_devices(self._cbs_fiscal_server_address()))
+
+    def _cbs_fiscal_server_lock(self, timeout=FP_registry.DEVICE_LOCK_TIMEOUT):
+        """Waits for the workers printing through the ZFP server of this config, taking it until the end of
+        the transaction: the server works with one device at a time. Raises FP_registry.DeviceBusyError after
+        timeout seconds."""
+        key = fiscal_arbiter.server_key(self._cbs_fiscal_server_address())
+        deadline = time.monotonic() + timeout
+        while True:
+            self.env.cr.execute("SELECT pg_try_advisory_xact_lock(%s, %s)", (SERVER_LOCK_NAMESPACE, key))
+            if self.env.cr.fetchone()[0]:
+                return
+            if time.monotonic() >= deadline:
+                raise FP_registry.DeviceBusyError(
+                    f"The ZfpLab server {self.cbs_fiscal_printer_server_ip} is used by another worker for more "
+                    f"than {timeout} seconds.")
+            time.sleep(0.1)
+
+    @contextmanager
+    def _cbs_fiscal_printer(self, force_handshake=False):
+        """Yields a FP connected to the fiscal device of this config. The FP is the one of the device in
+        FP_registry, so until the end of the block the other prints at the same device or ZFP server (from any
+        pos config) wait, while other servers print in parallel.
+        The handshake (server reachable, server connected to the device, same definitions version, device
+        reachable) is done only if the device has no verified one in the last cbs_fiscal_handshake_ttl
+        seconds; it is forgotten after a connection error. A server shared with the devices of other pos
+        configs is also taken from the other workers (until the end of the transaction) and, before each use,
+        asked for its device: another pos config can have connected it to its own. Raises ValidationError if
+        something is not ok."""
+        self.ensure_one()
+        if not self.cbs_fiscal_printer_server_ip:
+            raise ValidationError("You do not have configured in pos config the cbs_fiscal_printer_server_ip."
+                                  " Support at dev@cbssolutions.ro.")
+        client = FP_registry.get_client(self._cbs_fiscal_server_address(), self._cbs_fiscal_device())
+        shared = self._cbs_fiscal_server_shared()
+        # the requests are measured; inside a measured receipt the receipt stores them
+        with FP_metrics.recording() as samples:
+            try:
+                if shared:
+                    self._cbs_fiscal_server_lock()
+                with client.use() as fp:
+                    fp.serverSetTimeouts(self.cbs_fiscal_server_connect_timeout, self.cbs_fiscal_server_read_timeout)
+                    if force_handshake or not client.is_verified(self.cbs_fiscal_handshake_ttl):
+                        client.invalidate()
+                        self._cbs_fiscal_handshake(fp, force=force_handshake or shared)
+                        client.set_verified()
+                    elif shared:
+                        self._cbs_fiscal_device_connect(fp, shared=False)
+                    try:
+                        yield fp
+                    except Exception as ex:
+                        self._cbs_fiscal_error(ex)
+                        raise
+            except FP_registry.DeviceBusyError as ex:
+                raise ValidationError(f"{ex} Support at dev@cbssolutions.ro.")
+            finally:
+                self._cbs_fiscal_metrics_save(samples)
+
+    def _cbs_fiscal_metrics_save(self, samples, order=None, duration_ms=0):
+        """Adds the FP_metrics samples to cbs.fiscal.command.stat and, if the receipt of order took more than
+        cbs_slow_receipt_ms, keeps it in cbs.fiscal.slow.receipt. Never fails the print: in a transaction
+        already in error they are only logged."""
+        if not samples:
+            return
+        try:
+            with self.env.cr.savepoint():
+                self.env['cbs.fiscal.command.stat'].sudo().cbs_add(self, samples)
+                if order and 0 < self.cbs_slow_receipt_ms <= duration_ms:
+                    _logger.warning("slow fiscal receipt of pos.order %s: %.0f ms\n%s", order.id, duration_ms,
+                                    FP_metrics.breakdown(samples))
+                    self.env['cbs.fiscal.slow.receipt'].sudo().cbs_add(order, duration_ms, samples)
+        except psycopg2.Error as ex:
+            _logger.warning("pos.config %s: fiscal command timings not saved (%s):\n%s", self.id, ex,
+                            FP_metrics.breakdown(samples))
+
+    def _cbs_fiscal_handshake(self, fp, force=False):
+        """verifies the server and the device of fp (force: asking the server for its device, see
+        _cbs_fiscal_device_connect); raises ValidationError if something is not ok, FiscalDeviceOffline if one
+        of them is not reachable"""
+        hostname, port = self._cbs_fiscal_server_address()
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(2)
         result = sock.connect_ex((hostname, port))
-        if result == 0:
-            pass  # port is open
-        else:
-            raise ValidationError(
+        sock.close()
+        if result != 0:
+            raise FiscalDeviceOffline(
                 f"The Driver/Print Server with cbs_fiscal_printer_server_ip="
                 f"{self.cbs_fiscal_printer_server_ip} {hostname=} {port=} is not reachable. "
                 "Support at dev@cbssolutions.ro."
                 )
+        # here is the connection of the ZFPLABserver with fiscal device
+        self._cbs_fiscal_device_connect(fp, shared=not force)
+        if not fp.isCompatible():
+            raise ValidationError("Server definitions and client code have different versions!")
+        # test server can reach ip/port of fiscal device
         if self.cbs_fiscal_printer_ip:
-            settings_param = (self.cbs_fiscal_printer_ip, self.cbs_fiscal_printer_port,
-                              self.cbs_fiscal_printer_password)
-        elif self.cbs_fiscal_printer_serial_port:
-            settings_param = (self.cbs_fiscal_printer_serial_port,
-                              self.cbs_fiscal_printer_serial_speed)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(2)
+            result = sock.connect_ex((self.cbs_fiscal_printer_ip, self.cbs_fiscal_printer_port))
+            sock.close()
+            if result != 0:
+                raise FiscalDeviceOffline(
+                    "The Driver/Fiscal Pritner Server can not connect to Fiscal Device with ip="
+                    f"{self.cbs_fiscal_printer_ip} on port:{self.cbs_fiscal_printer_port}."
+                    " If the fiscal printer is on, and it has internet, and the route from server is ok, "
+                    "and is not a fiscal printer, it  must be in Sale Menu to show 0.00 (Mode/Reg oper/0/Total)."
+                    " Support at dev@cbssolutions.ro."
+                    )
+        serial = fp.ReadSerialNum()
+        if serial and not self.cbs_fiscal_device_serial:
+            self._cbs_fiscal_device_serial_set(serial, fp.ReadLastAndTotalReceiptNum().TotalReceiptCounter)
         else:
-            raise ValidationError(
-                "You did not configure ip or port for fiscal printer. "
-                "Support at dev@cbssolutions.ro.")
+            self._cbs_fiscal_device_serial_set(serial)
+
+    def _cbs_fiscal_device_serial_set(self, serial, total_counter=None):
+        """Stores the serial number read from the device. Read the first time, with the TotalReceiptCounter of
+        the device: it is also set on the fiscal receipts printed before by this device, so that their sequence
+        (cbs.fiscal.receipt.sequence.issue) goes on with it. These are the last receipts of the config, back from
+        total_counter while their counters go down: a higher counter before them is of a replaced device."""
+        if not serial or serial == self.cbs_fiscal_device_serial:
+            return
+        if not self.cbs_fiscal_device_serial and total_counter is not None:
+            self.env['pos.order'].flush_model(['cbs_fiscal_device_serial', 'cbs_fiscal_total_counter'])
+            self.env.cr.execute("""
+                SELECT o.id, o.cbs_fiscal_total_counter
+                  FROM pos_order o
+                  JOIN pos_session s ON s.id = o.session_id
+                 WHERE s.config_id = %s
+                   AND coalesce(o.cbs_fiscal_device_serial, '') = '' AND o.cbs_fiscal_total_counter IS NOT NULL
+                 ORDER BY o.id DESC
+            """, (self.id,))
+            order_ids, last = [], total_counter
+            for order_id, counter in self.env.cr.fetchall():
+                if counter > last:
+                    break
+                order_ids.append(order_id)
+                last = counter
+            if order_ids:
+                self.env.cr.execute("UPDATE pos_order SET cbs_fiscal_device_serial = %s WHERE id IN %s",
+                                    (serial, tuple(order_ids)))
+                self.env['pos.order'].invalidate_model(['cbs_fiscal_device_serial'])
+        self.sudo().cbs_fiscal_device_serial = serial
+
+    def _cbs_fiscal_device_connect(self, fp, shared=True):
+        """Connects the ZFP server to the fiscal device of this config if it is not connected to it already:
+        sending the device settings makes the server reconnect to the device, interrupting the other pos configs
+        printing at it. With shared, a connection found by any worker in the last cbs_fiscal_handshake_ttl
+        seconds (cbs.fiscal.server.device) is trusted without asking the server."""
+        server, device = self._cbs_fiscal_server_address(), self._cbs_fiscal_device()
+        server_devices = self.env['cbs.fiscal.server.device'].sudo()
+        if shared and server_devices.cbs_is_connected(server, device, self.cbs_fiscal_handshake_ttl):
+            return
+        FP_registry.connect_device(fp, device)
+        server_devices.cbs_set(server, device, self)
+
+    def cbs_test_print_at_fiscal_server(self):
+        ex_open_non_fiscal_receipt, ex_close_non_fiscal = '', ''
         try:
-            ex_open_non_fiscal_receipt, ex_close_non_fiscal = '', ''
-            # here is the connection of the ZFPLABserver with fiscal device
-            fp = FP()
-            column_position = self.cbs_fiscal_printer_server_ip.find(":")
-            cbs_fiscal_printer_server_ip_ip = self.cbs_fiscal_printer_server_ip[:column_position]
-            if column_position != -1:
-                cbs_fiscal_printer_server_ip_port = int(self.cbs_fiscal_printer_server_ip[column_position+1:])
-            else:
-                cbs_fiscal_printer_server_ip_port = 4444
-            fp.serverSetSettings(cbs_fiscal_printer_server_ip_ip, cbs_fiscal_printer_server_ip_port)
-            fp.serverSetDeviceTcpSettings(*settings_param)
-            if not fp.isCompatible():
-                raise ValidationError("Server definitions and client code have different versions!")
-            # test server can reach ip/port of fiscal device
-            if self.cbs_fiscal_printer_ip:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2)
-                result = sock.connect_ex((self.cbs_fiscal_printer_ip, self.cbs_fiscal_printer_port))
-                if result == 0:
-                    pass  # exist connection between ZFPLABserver and Fiscal Device
-                else:
-                    raise ValidationError(
-                        "The Driver/Fiscal Pritner Server can not connect to Fiscal Device with ip="
-                        f"{self.cbs_fiscal_printer_ip} on port:{self.cbs_fiscal_printer_port}."
-                        " If the fiscal printer is on, and it has internet, and the route from server is ok, "
-                        "and is not a fiscal printer, it  must be in Sale Menu to show 0.00 (Mode/Reg oper/0/Total)."
-                        " Support at dev@cbssolutions.ro."
-                        )
-            try:
-                # opening a nor fiscal receipt
-                fp.OpenNonFiscalReceipt(1, self.cbs_operator_password, 0)  # last parameter 0 step by step printint, 1 postponed printing
-            except Exception as ex1:
-                ex_open_non_fiscal_receipt = ex1
-                try:  # if it was blocked and showing STL
-                    fp.CancelReceipt()   # comand i
-                    raise ValidationError(f'Bon fiscal anterior ramas deschiis {ex1=}. L-am inchis. '
-                                          'Mai printeaza o data.')
-                except Exception as ex2:
-                    ex_close_non_fiscal = ex2
-                    # no fiscal recipt was left open
-                    # we can only be in case of a opened non fiscal receipt and we are closing it
-                    fp.CloseNonFiscalReceipt()
-                    raise ValidationError(f"We closed a non fiscal recipt that was open. Before_error:{ex2}")
-            fp.PrintText("SUPPORT: https://cbssolutions.ro")
-            fp.CloseNonFiscalReceipt()
-            if self.cbs_cut_after_print:
-                fp.PaperFeed()
-                fp.CutPaper()
+            with self._cbs_fiscal_printer(force_handshake=True) as fp:
+                try:
+                    # opening a nor fiscal receipt
+                    fp.OpenNonFiscalReceipt(1, self.cbs_operator_password, 0)  # last parameter 0 step by step printint, 1 postponed printing
+                except Exception as ex1:
+                    ex_open_non_fiscal_receipt = ex1
+                    try:  # if it was blocked and showing STL
+                        fp.CancelReceipt()   # comand i
+                        raise ValidationError(f'Bon fiscal anterior ramas deschiis {ex1=}. L-am inchis. '
+                                              'Mai printeaza o data.')
+                    except Exception as ex2:
+                        ex_close_non_fiscal = ex2
+                        # no fiscal recipt was left open
+                        # we can only be in case of a opened non fiscal receipt and we are closing it
+                        fp.CloseNonFiscalReceipt()
+                        raise ValidationError(f"We closed a non fiscal recipt that was open. Before_error:{ex2}")
+                fp.PrintText("SUPPORT: https://cbssolutions.ro")
+                fp.CloseNonFiscalReceipt()
+                if self.cbs_cut_after_print:
+                    fp.PaperFeed()
+                    fp.CutPaper()
             _logger.warning('!!!!!!!!!!!Fiscal Printer test succeded. !!!!!!!!!!!Support at dev@cbssolutions.ro!!!!!')
         except Exception as ex3:
+            self._cbs_fiscal_error(ex3)
             raise ValidationError(f"{ex_open_non_fiscal_receipt=}\n{ex_close_non_fiscal=}\n{ex3=}\n\n{traceback.format_exc()=}")
 
     def cbs_report_z(self):
         self.cbs_report_x(OptionZeroing='Z')
 
     def cbs_report_x(self, OptionZeroing='X'):
-        if not self.cbs_fiscal_printer_server_ip:
-            raise ValidationError("You do not have configured in pos config the cbs_fiscal_printer_server_ip."
-                                  " Support at dev@cbssolutions.ro.")
-        cbs_fiscal_printer_server_ip = self.cbs_fiscal_printer_server_ip
-        if "//" not in cbs_fiscal_printer_server_ip:
-            cbs_fiscal_printer_server_ip = f"//{cbs_fiscal_printer_server_ip}"  # wihout // is not spliting
-        url = urlparse(cbs_fiscal_printer_server_ip)
-        hostname = url.hostname
-        port = url.port
-        if not port:
-            port = 4444
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex((hostname, port))
-        if result == 0:
-            pass  # port is open
-        else:
-            raise ValidationError(
-                f"The Driver/Print Server with cbs_fiscal_printer_server_ip="
-                f"{self.cbs_fiscal_printer_server_ip} {hostname=} {port=} is not reachable. "
-                "Support at dev@cbssolutions.ro."
-                )
-        if self.cbs_fiscal_printer_ip:
-            settings_param = (self.cbs_fiscal_printer_ip, self.cbs_fiscal_printer_port,
-                              self.cbs_fiscal_printer_password)
-        elif self.cbs_fiscal_printer_serial_port:
-            settings_param = (self.cbs_fiscal_printer_serial_port,
-                              self.cbs_fiscal_printer_serial_speed)
-        else:
-            raise ValidationError(
-                "You did not configure ip or port for fiscal printer. "
-                "Support at dev@cbssolutions.ro.")
         try:
-            # here is the connection of the ZFPLABserver with fiscal device
-            fp = FP()
-            fp.serverSetSettings(hostname, port)
-            fp.serverSetDeviceTcpSettings(*settings_param)
-            if not fp.isCompatible():
-                raise ValidationError("Server definitions and client code have different versions!")
-            # test server can reach ip/port of fiscal device
-            if self.cbs_fiscal_printer_ip:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2)
-                result = sock.connect_ex((self.cbs_fiscal_printer_ip, self.cbs_fiscal_printer_port))
-                if result == 0:
-                    pass  # exist connection between ZFPLABserver and Fiscal Device
-                else:
-                    raise ValidationError(
-                        "The Driver/Fiscal Pritner Server can not connect to Fiscal Device with ip="
-                        f"{self.cbs_fiscal_printer_ip} on port:{self.cbs_fiscal_printer_port}."
-                        " If the fiscal printer is on, and it has internet, and the route from server is ok, "
-                        "and is not a fiscal printer, it  must be in Sale Menu to show 0.00 (Mode/Reg oper/0/Total)."
-                        " Support at dev@cbssolutions.ro."
-                        )
+            self._cbs_daily_report(OptionZeroing)
+            _logger.warning('!!!!!!!!!!!Fiscal Printer test succeded. !!!!!!!!!!!Support at dev@cbssolutions.ro!!!!!')
+        except Exception as ex:
+            self._cbs_fiscal_error(ex)
+            raise ValidationError(ex)
+
+    def cbs_reports_z(self):
+        "action of the selected pos configs: Z report at all their fiscal devices, in parallel"
+        return self.env['cbs.fiscal.report.run'].cbs_run(self, 'Z').action_view()
+
+    def cbs_reports_x(self):
+        "action of the selected pos configs: X report at all their fiscal devices, in parallel"
+        return self.env['cbs.fiscal.report.run'].cbs_run(self, 'X').action_view()
+
+    def _cbs_read_daily_amounts(self, fp):
+        "amounts of the day at the fiscal device, as values of a cbs.fiscal.counter.snapshot"
+        received = fp.ReadDailyReceivedSalesAmounts()
+        by_vat = fp.ReadDailyAmountsByVAT()
+        return {
+            'amount_cash': received.AmountPayment0,
+            'amount_non_cash': sum(getattr(received, f'AmountPayment{i}') for i in range(1, 10)),
+            'amount_vat_a': by_vat.SaleAmountVATGrA,
+            'amount_vat_b': by_vat.SaleAmountVATGrB,
+            'amount_vat_c': by_vat.SaleAmountVATGrC,
+            'amount_vat_d': by_vat.SaleAmountVATGrD,
+            'amount_vat_e': by_vat.SaleAmountVATGrE,
+            'amount_vat_f': by_vat.SaleAmountAlteTaxeF,
+        }
+
+    def _cbs_daily_report(self, OptionZeroing):
+        """Prints the daily report (X or Z) and returns the counters of the device after it, as values of a
+        cbs.fiscal.report.run.line."""
+        self.ensure_one()
+        with self._cbs_fiscal_printer() as fp:
+            try:
+                # the amounts of the day, before a Z report zeroes them
+                amounts = self._cbs_read_daily_amounts(fp)
+            except ServerException as ex:
+                self._cbs_fiscal_error(ex)
+                _logger.warning("pos.config %s: daily amounts not read before the daily report: %s", self.id, ex)
+                amounts = {}
             try:
                 fp.PrintDailyReport(OptionZeroing=OptionZeroing)
             except Exception as ex:
+                self._cbs_fiscal_error(ex)
                 raise ValidationError(f"Error for report={OptionZeroing}; {ex=}; suport at dev@cbssolutions.ro.")
             if self.cbs_cut_after_print:
                 fp.PaperFeed()
                 fp.CutPaper()
-            _logger.warning('!!!!!!!!!!!Fiscal Printer test succeded. !!!!!!!!!!!Support at dev@cbssolutions.ro!!!!!')
-        except Exception as ex:
-            raise ValidationError(ex)
+            try:
+                info = fp.ReadLastDailyReportInfo()
+                counters = fp.ReadDailyCounters()
+                # a Z report ends the 24 hours blocking: the receipts must not wait for the heartbeat
+                self.env['cbs.fiscal.device.status'].sudo().cbs_set(self, fiscal_status.device_status(fp.ReadStatus()))
+            except ServerException as ex:
+                # the report is printed; only the counters are missing
+                self._cbs_fiscal_error(ex)
+                _logger.warning("pos.config %s: counters not read after the daily report: %s", self.id, ex)
+                info = counters = None
+        source = 'z_report' if OptionZeroing == 'Z' else 'x_report'
+        if not info:
+            self.env['cbs.fiscal.counter.snapshot'].cbs_add(self, source, **amounts)
+            return {}
+        self.env['cbs.fiscal.counter.snapshot'].cbs_add(
+            self, source, last_z_report_num=int(info.LastZDailyReportNum), **amounts)
+        return {
+            'last_z_report_num': int(info.LastZDailyReportNum),
+            'last_z_report_date': info.LastZDailyReportDate and info.LastZDailyReportDate.date(),
+            'last_report_num_from_reset': int(counters.LastReportNumFromReset),
+            'num_last_fm_block': int(counters.NumLastFMBlock),
+            'num_ej': int(counters.NumEJ),
+            'last_fm_block_date': counters.DateTime,
+        }
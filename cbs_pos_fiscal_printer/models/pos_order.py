@@ -1,16 +1,17 @@
 # Copyright 2023 cbssolutions.ro
 # License OPL-1.0 or later (Odoo Proprietary License)
 # (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
-import socket
+import time
 import traceback
 from .FP_core import ServerException, SErrorType
-from .FP import FP, Enums
+from .FP import FP
+from . import FP_metrics, fiscal_receipt, fiscal_text
+from .fiscal_receipt import ReceiptLine, ReceiptPayment, ReceiptPlan
+from .pos_config import FiscalDeviceOffline, HANDSHAKE_ERROR_CODES
 from datetime import datetime
 import json
-from unidecode import unidecode
 import logging
 
-from urllib.parse import urlparse
 from odoo import api, fields, models, tools, _
 from odoo.exceptions import ValidationError, UserError
 _logger = logging.getLogger(__name__)
@@ -90,13 +91,42 @@ class PosOrder(models.Model):
     cbs_fiscal_receipt_number = fields.Char(help="number that was printed by fiscal printer on recipt", readonly=1)
     cbs_ReadLastAndTotalReceiptNum = fields.Char(readonly=1, help="taken when printing form fiscal device; Total receipt number")
     cbs_before_ReadLastAndTotalReceiptNum = fields.Char(readonly=1, help="taken before printing form fiscal device")
+    cbs_fiscal_receipt_num = fields.Integer(readonly=1, help="LastReceiptNum of the fiscal device after printing.")
+    cbs_fiscal_total_counter = fields.Integer(readonly=1, help="TotalReceiptCounter of the fiscal device after "
+                                              "printing; increases by 1 at each fiscal receipt of the device.")
+    cbs_fiscal_device_serial = fields.Char(readonly=1, help="Serial number of the fiscal device that printed it.")
     cbs_cash_payment = fields.Float(readonly=1, help="Only at printed recipts, total paid with cash.")
     cbs_non_cash_payment = fields.Float(readonly=1, help="Only at printed recipts, total paid without cash.")
 
+    def init(self):
+        super().init()
+        # receipt sequence of a fiscal device (cbs.fiscal.receipt.sequence.issue)
+        tools.create_index(self.env.cr, 'pos_order_cbs_fiscal_device_counter_index', self._table,
+                           ['cbs_fiscal_device_serial', 'cbs_fiscal_total_counter'],
+                           where='cbs_fiscal_total_counter IS NOT NULL')
+        # receipts of an exported electronic journal (cbs.fiscal.ej.receipt)
+        tools.create_index(self.env.cr, 'pos_order_cbs_fiscal_device_receipt_index', self._table,
+                           ['cbs_fiscal_device_serial', 'cbs_fiscal_receipt_num'],
+                           where='cbs_fiscal_receipt_num IS NOT NULL')
+
     def sanitise_txt_for_fiscal_print(self, txt):
-        ascii_txt = unidecode(txt)  # unaccent unidecode('北亰') 'Bei Jing 'unidecode('François') 'Francois'
+        ascii_txt = fiscal_text.ascii_text(txt)  # unaccent unidecode('北亰') 'Bei Jing 'unidecode('François') 'Francois'
         return ascii_txt
 
+    def cbs_enqueue_fiscal_print(self, *a):
+        """used from pos: the receipt is printed by the print job dispatcher of the printer, so the pos
+        request ends at once; the pos polls cbs.fiscal.print.job.cbs_job_status with the returned id"""
+        if not self.config_id.cbs_fiscal_printer_server_ip:
+            return {}
+        if len(self) != 1:
+            return {'error': f"CBS: We can only print one fiscal receipt; but received {self=}"}
+        try:
+            self.config_id._cbs_fiscal_status_check()
+        except FiscalDeviceOffline:
+            # spooled: printed when the heartbeat sees the device back
+            return {'job_id': self.env['cbs.fiscal.print.job'].sudo().cbs_enqueue(self, waiting_device=True).id}
+        return {'job_id': self.env['cbs.fiscal.print.job'].sudo().cbs_enqueue(self).id}
+
     def cbs_print_at_fiscal_server_backend(self, *a):
         "used from backend like from pos, but will raise error"
         res = self.cbs_print_at_fiscal_server(a)
@@ -104,7 +134,106 @@ class PosOrder(models.Model):
         if error:
             raise ValidationError(error)
 
+    def _cbs_receipt_plan(self, fiscal):
+        """The receipt of this order as a fiscal_receipt.ReceiptPlan, read before opening the receipt at the
+        fiscal device; the records are read with the same few queries whatever the number of lines."""
+        self.ensure_one()
+        config = self.config_id
+        has_negative_amount = self.amount_total <= 0.01
+        line_len = config.cbs_fiscal_printer_line_symbols if config.cbs_fiscal_printer_line_symbols > 30 else 30
+        max_lines = config.cbs_receipt_product_name_max_lines if config.cbs_receipt_product_name_max_lines > 1 else 1
+        show_amounts = config.cbs_print_non_fiscal_receipt or has_negative_amount
+        # read once for all the lines and payments what is used below, not record by record
+        lines = self.lines
+        lines.mapped('refunded_orderline_id')
+        lines.mapped('product_id.name')
+        lines.mapped('tax_ids')
+        self.payment_ids.mapped('payment_method_id.journal_id.type')
+
+        is_return = lines.filtered(lambda r: r.refunded_orderline_id)
+        is_sale = lines - is_return
+        if fiscal:
+            # storno must have same VAT type as lines; storno lines must be the last ones
+            order_lines = [x for x in is_sale]
+            order_lines.extend([x for x in is_return])
+            if config.cbs_no_zero_value_on_fiscal_receipt:
+                order_lines = [x for x in order_lines if abs(x.price_unit) >= 0.01 and abs(x.qty) >= 0.01]
+            vat_classes = config._cbs_vat_classes_of_lines(order_lines)
+            plu_numbers = config._cbs_plu_numbers()
+        else:
+            order_lines = list(lines)
+            vat_classes = {}
+            plu_numbers = {}
+        plan_lines = []
+        for line in order_lines:
+            # we can have more lines of product name, we are going to wirte this, and last one like a product
+            to_print_for_product = line.product_id.text_list_for_pos_fiscal_recipt()
+            prod_name = to_print_for_product[0]
+            if not (fiscal or show_amounts):
+                prod_name = f"{line.qty:0.1f}X {prod_name}"
+            # split and sanitized once per product name and line width, not at every receipt
+            texts = list(fiscal_text.printer_lines(prod_name, line_len)[:max_lines])
+            texts.extend(self.sanitise_txt_for_fiscal_print(text) for text in to_print_for_product[1:])
+            if fiscal:
+                # the sale has the last line, not sanitized
+                name = (to_print_for_product[-1] if len(to_print_for_product) > 1
+                        else split_product_name_in_printer_lines(prod_name, line_len)[:max_lines][-1])
+                texts = texts[:-1]
+            else:
+                name = ''
+            # sold by PLU number if the device has the product with the same price and VAT class; the device
+            # prints its PLU name, so only the other texts of the product are printed
+            plu_number, plu_price, plu_vat_class = plu_numbers.get(line.product_id.id, (0, 0, ''))
+            if not (plu_number and line in is_sale and line.qty > 0 and plu_price == round(line.price_unit, 2)
+                    and plu_vat_class == vat_classes[line.id]):
+                plu_number = 0
+            elif fiscal:
+                texts = [self.sanitise_txt_for_fiscal_print(text) for text in to_print_for_product[1:]]
+            plan_lines.append(ReceiptLine(
+                texts=tuple(texts),
+                name=name,
+                vat_class=vat_classes.get(line.id),
+                price_unit=line.price_unit,
+                qty=line.qty,
+                price_subtotal_incl=line.price_subtotal_incl,
+                is_sale=line in is_sale,
+                plu=plu_number))
+
+        footer = fiscal_text.printer_lines(config.receipt_footer, line_len) if config.receipt_footer else ()
+        return ReceiptPlan(
+            order_id=self.id,
+            fiscal=fiscal,
+            show_amounts=show_amounts,
+            operator_password=config.cbs_operator_password,
+            print_type=(config.cbs_fiscal_receipt_print_type if fiscal
+                        else 1 if config.cbs_non_fiscal_postponed_print else 0),
+            cash_drawer_open=config.cbs_cash_drawer_open,
+            return_line_ids=tuple(is_return.ids),
+            lines=tuple(plan_lines),
+            amount_total=self.amount_total,
+            payments=tuple(ReceiptPayment(amount=payment.amount,
+                                          is_cash=payment.payment_method_id.journal_id.type == 'cash')
+                           for payment in self.payment_ids),
+            footer=footer,
+            barcode=self.pos_reference.split()[-1],
+            print_barcode=config.cbs_barcode_to_print)
+
+    @staticmethod
+    def _cbs_print_receipt_plan(fp, plan):
+        """Sends to the fiscal device the commands of the receipt plan, from opening to closing of the receipt."""
+        fiscal_receipt.emit(fp, fiscal_receipt.render(plan))
+
     def cbs_print_at_fiscal_server(self, *a):
+        """Prints the receipt; the requests sent to the ZFP server are measured (cbs.fiscal.command.stat)
+        and a receipt slower than cbs_slow_receipt_ms of its config is kept with them (cbs.fiscal.slow.receipt)."""
+        start = time.perf_counter()
+        with FP_metrics.recording() as samples:
+            res = self._cbs_print_at_fiscal_server(*a)
+        if samples:  # None inside an outer recording, measured with it
+            self.config_id._cbs_fiscal_metrics_save(samples, self, (time.perf_counter() - start) * 1000)
+        return res
+
+    def _cbs_print_at_fiscal_server(self, *a):
         force_nonfiscal = self._context.get('force_nonfiscal')  # will have a non fiscal receipt
         if self.config_id.cbs_print_non_fiscal_receipt:
             force_nonfiscal = True
@@ -117,11 +246,12 @@ class PosOrder(models.Model):
             return {}
         if len(self) != 1:
             return {'error': f"CBS: We can only print one fiscal receipt; but received {self=}"}
-        # test not th have refound and sale in same recipt
-        is_return = self.lines.filtered(lambda r: r.refunded_orderline_id)
-        is_sale = self.lines.filtered(lambda r: not r.refunded_orderline_id)
+        try:
+            # the device known as unreachable or blocked: no waiting for the timeouts
+            self.config_id._cbs_fiscal_status_check()
+        except ValidationError as ex:
+            return {'error': f"CBS: {ex.args[0]}", 'offline': isinstance(ex, FiscalDeviceOffline)}
         # if self.amount_total is negative must be a is_return
-        # storno must have same VAT type as lines; storno lines must be the last ones
         # if we have self.amount_total, we can have storno lines on fiscal receipt
         has_negative_amount = self.amount_total <= 0.01
 
@@ -130,263 +260,96 @@ class PosOrder(models.Model):
         #    return {'error': "Nu poti avea si linii de vanzare si de retur in acelsi bon. Prima data faceti retur cu "
         #            "liniile necesare apoi faceti alt bon cu ce se vinde."}
 
-        if not self.config_id.cbs_fiscal_printer_server_ip:
-            return {'error': "CBS: You do not have configured in pos config the cbs_fiscal_printer_server_ip."
-                    " Support at dev@cbssolutions.ro."
-                    }
-        cbs_fiscal_printer_server_ip = self.config_id.cbs_fiscal_printer_server_ip
-        if "//" not in cbs_fiscal_printer_server_ip:
-            cbs_fiscal_printer_server_ip = f"//{cbs_fiscal_printer_server_ip}"  # wihout // is not spliting
-        url = urlparse(cbs_fiscal_printer_server_ip)
-        hostname = url.hostname
-        port = url.port
-        if not port:
-            port = 4444
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex((hostname, port))
-        if result == 0:
-            pass  # port is open
-        else:
-            return {'error': f"CBS: The Driver/Print Server with cbs_fiscal_printer_server_ip="
-                    f"{self.config_id.cbs_fiscal_printer_server_ip} {hostname=} {port=} is not reachable. "
-                    "Support at dev@cbssolutions.ro."}
+        # everything printed is read from the database and rendered before talking to the fiscal device
+        plan = self._cbs_receipt_plan(not (force_nonfiscal or has_negative_amount))
+        ops = fiscal_receipt.render(plan)
+        copy = copy_ops = None
+        if plan.fiscal and self.config_id.cbs_after_fiscal_receipt_print_non_fiscal:
+            # the non fiscal copy printed after the fiscal receipt, in the same conversation with the device
+            copy = self._cbs_receipt_plan(False)
+            copy_ops = fiscal_receipt.render(copy)
 
-        if self.config_id.cbs_fiscal_printer_ip:
-            settings_param = (self.config_id.cbs_fiscal_printer_ip, self.config_id.cbs_fiscal_printer_port,
-                              self.config_id.cbs_fiscal_printer_password)
-        elif self.config_id.cbs_fiscal_printer_serial_port:
-            settings_param = (self.config_id.cbs_fiscal_printer_serial_port,
-                              self.config_id.cbs_fiscal_printer_serial_speed)
-        else:
-            return {'error': "CBS: You did not configure ip or port for fiscal printer. "
-                    "Support at dev@cbssolutions.ro."}
-        ex1, ex2, ex3 = '', '', ''
         try:
-            fp = FP()
-            # here is the connection of the ZFPLABserver with fiscal device
-            fp.serverSetSettings(hostname, port)
-            fp.serverSetDeviceTcpSettings(*settings_param)
-            if not fp.isCompatible():
-                return {'error': "CBS: Server definitions and client code have different versions!"}
-            # test server can reach ip/port of fiscal device
-            if self.config_id.cbs_fiscal_printer_ip:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2)
-                result = sock.connect_ex((self.config_id.cbs_fiscal_printer_ip, self.config_id.cbs_fiscal_printer_port))
-                if result == 0:
-                    pass  # exist connection between ZFPLABserver and Fiscal Device
-                else:
-                    return {'error': "CBS: The ZFPLABserver can not connect to Fiscal Device with ip="
-                            f"{self.config_id.cbs_fiscal_printer_ip} on port:{self.config_id.cbs_fiscal_printer_port}."
-                            " If the fiscal printer is on, and it has internet, and the route from server is ok, and"
-                            " is not a fiscal printer, it  must be in Sale Menu to show 0.00 (Mode/Reg oper/0/Total)."
-                            "Support at dev@cbssolutions.ro."
-                            }
-            # from here is comunicating with the fiscal device
-            before = fp.ReadLastAndTotalReceiptNum()
-            b_last_nr = str(before.LastReceiptNum)
-            b_last_total = str(before.TotalReceiptCounter)
-
-            try:
-                # opening a fiscal receipt or nor fiscal
-                if has_negative_amount or force_nonfiscal:
-                    # for fiscal printer must be "0000", for fiscal cascher must be "0" (operator 1 password)
-                    # fp.OpenNonFiscalReceipt(1, "0", 0)  # OperPass
-                    # fp.OpenNonFiscalReceipt(1, "0000", 0) 
-                    fp.OpenNonFiscalReceipt(1, self.config_id.cbs_operator_password, 0)
-                else:
-                    fp.OpenReceipt(1, self.config_id.cbs_operator_password, 0)
-            except Exception as ex:
-                ex1 = ex
-                try:  # if it was blocked and showing STL
-                    fp.CancelReceipt()   # comand i
-                    return {'error': f'CBS: Bon fiscal anterior ramas deschiis {ex=}. L-am inchis. Mai printeaza o data.'}
-                except Exception as ex:
-                    ex2 = ex
-                    # no fiscal recipt was left open; or we are in payment
-                    try:
-                        fp.CashPayCloseReceipt()  # if i'm in payment I can not cancel it with normal cancel
-                    except Exception as ex:
-                        ex3 = ex
-                        # we can only be in case of a opened non fiscal receipt and we are closing it
-                        fp.CloseNonFiscalReceipt()
-                    return {'error': f"CBS: We closed a non fiscal recipt that was open.\n{ex1=}\n{ex2=}\n{ex3=}"}
-
-            # cash payment:
-            cash_payments = self.payment_ids.filtered(lambda r: r.payment_method_id.journal_id.type == 'cash')
-            non_cash_payments = self.payment_ids.filtered(lambda r: r.payment_method_id.journal_id.type != 'cash')
-            cash_payment_amount = sum(cash_payments.mapped("amount"))
-            non_cash_payment_amount = sum(non_cash_payments.mapped("amount"))
-
-            if force_nonfiscal or has_negative_amount:
-                # ******************** NON fiscal bill *************************
-                if is_return:
-                    fp.PrintText(f"RETUR AL: {is_return.ids}")
-                for line in self.lines:
-                    # we just write some info like a recipt
-                    to_print_for_product = line.product_id.text_list_for_pos_fiscal_recipt()
-                    prod_name = to_print_for_product[0]
-                    if not (self.config_id.cbs_print_non_fiscal_receipt or has_negative_amount):
-                        prod_name = f"{line.qty:0.1f}X {prod_name}"
-                    all_prod_list = split_product_name_in_printer_lines(
-                        prod_name, self.config_id.cbs_fiscal_printer_line_symbols if
-                        self.config_id.cbs_fiscal_printer_line_symbols > 30 else 30)
-                    prod_list = all_prod_list[:(self.config_id.cbs_receipt_product_name_max_lines if
-                                                self.config_id.cbs_receipt_product_name_max_lines > 1 else 1)]
-                    prod_list.extend(to_print_for_product[1:])
-                    if len(prod_list) > 1:
-                        for name in prod_list[:-1]:
-                            fp.PrintText(f"{self.sanitise_txt_for_fiscal_print(name)}")
-                    fp.PrintText(f"{self.sanitise_txt_for_fiscal_print(prod_list[-1])}")
-                    if self.config_id.cbs_print_non_fiscal_receipt or has_negative_amount:
-                        fp.PrintText(f"{line.qty:0.1f}X{line.price_unit:0.2f}X tax={line.price_subtotal_incl:0.2f}")
-                if self.config_id.cbs_print_non_fiscal_receipt or has_negative_amount:
-                    # the amount is important only when you want to print nonfiscal receipt or negative
-                    # when we print consume we do not want
-                    fp.PrintText(f"TOTAL: {self.amount_total:0.2f}")
-                    for payment in self.payment_ids:
-                        if payment.payment_method_id.journal_id.type == 'cash':
-                            fp.PrintText(f"PLATA prin casa: {payment.amount:0.2f}lei")
-                            if self.config_id.cbs_cash_drawer_open:
-                                fp.CashDrawerOpen()
-                        else:
-                            fp.PrintText(f"PLATA NU prin casa: {payment.amount:0.2f}lei")
-            else:
-                # ******************** fiscal bill *************************
-                # ******** here the amount is at least 0.01
-                first_sale_lines_after_storno = [x for x in is_sale]
-                first_sale_lines_after_storno.extend([x for x in is_return])
-                for line in first_sale_lines_after_storno:
-                    if (self.config_id.cbs_no_zero_value_on_fiscal_receipt and
-                            (abs(line.price_unit) < 0.01 or abs(line.qty) < 0.01)):
-                        continue  # we do not print 0 line
-                    # we can have more lines of product name, we are going to wirte this, and last one like a product
-                    to_print_for_product = line.product_id.text_list_for_pos_fiscal_recipt()
-                    prod_name = to_print_for_product[0]
-                    all_prod_list = split_product_name_in_printer_lines(
-                        prod_name, self.config_id.cbs_fiscal_printer_line_symbols if
-                        self.config_id.cbs_fiscal_printer_line_symbols > 30 else 30)
-                    prod_list = all_prod_list[:(self.config_id.cbs_receipt_product_name_max_lines if
-                                                self.config_id.cbs_receipt_product_name_max_lines > 1 else 1)]
-                    prod_list.extend(to_print_for_product[1:])
-                    if len(prod_list) > 1:
-                        for name in prod_list[:-1]:
-                            fp.PrintText(f"{self.sanitise_txt_for_fiscal_print(name)}")
-# choose the VAT at tremol fiscal printer
-# vat 'A' - VAT Class A 19, 'B' - VAT Class B 9, 'C' - VAT Class C 5, 'D' - VAT Class D 0, 'E' - VAT Class E 0, 'F' - Alte taxe 0              
-# Enums.OptionVATClass.VAT_Class_A = 'A'
-                    line_tremol_VATrate = self.config_id.cbs_no_vat_class
-                    if line.tax_ids:
-                        cbs_odoo_tax_id_to_tremol_vat_json = json.loads(self.config_id.cbs_odoo_tax_id_to_tremol_vat_json)
-                        line_tremol_VATrate = cbs_odoo_tax_id_to_tremol_vat_json.get(line.tax_ids[0].id, 'A')
-                    # the efective sale line
-                    if (line in is_sale) and (line.price_unit*line.qty > 0):
-                        # fp.SellPLUwithSpecifiedVAT("Article", Enums.OptionVATClass.VAT_Class_A, 0.01, 1)
-                        # 0.01  =  unit price including vat
-                        # 1 = quantity
-                        fp.SellPLUwithSpecifiedVAT(prod_list[-1],
-                                                   line_tremol_VATrate, line.price_unit,
-                                                   line.qty)
-                    else:  # is STORNO STORNO ( some + values and some - values with sum > 0.01) #    line in is_return
-                        # or is DISCOUNT
-                        # the fiscal printer will write a storno before
-                        # *******************   I must put storno *************************************
-                        # StornoPLU(NamePLU=,OptionVATClass=,Price=,Quantity=,DiscAddP=,DiscAddV=,DiscNamed=,Category=,NamePLUextension=,AdditionalNamePLU=)                
-                        # you are not allowd to have less than 0.01
-                        # first time the + lines than the - ones, here we are the -, where given qty must be>1 and price <0
-                        _logger.info(f"\n\n\n {prod_list[-1]=},{line_tremol_VATrate=}, {(-1) * line.price_unit=},{line.qty * (-1)=}")
-                        if line.price_unit < 0:  # is discount
-                            fp.StornoPLU(prod_list[-1],
-                                    line_tremol_VATrate, line.price_unit,
-                                    line.qty)
-                        else:  # is strono  qty<0       here we need to change the - form qty to price unit
-                            fp.StornoPLU(prod_list[-1],
-                                    line_tremol_VATrate, (-1) * line.price_unit,
-                                    line.qty * (-1))
-                    pass
-                # print cash payments
-                if len(cash_payments) > 1:
-                    # the fiscal pirnter does only know the amont that was paid ( not also the rest)
-                    for cash_payment in cash_payments:
-                        fp.PrintText(f"Numerar:{cash_payment.amount}")
-                if cash_payments:
-                    if cash_payment_amount < 0.01:
-                        _logger.error("fiscal printer should give erorr because is a negative amount"
-                                      f"{self=} {cash_payments=} {cash_payment_amount=}")
-                    else:
-                        OptionPaymentType = 0
-                        if self.config_id.cbs_cash_drawer_open:
-                            fp.CashDrawerOpen()
-                        fp.Payment(OptionPaymentType, cash_payment_amount)
-                for payment in non_cash_payments:
-                    # OptionPaymentType: 2 thichete 4 bonuri 5 voucher  6 credit 7 moderne 8 aletele 9 euro
-                    if payment.amount > 0.01:
-                        OptionPaymentType = 1  # card  bank or what is defined
-                        fp.Payment(OptionPaymentType, payment.amount)
-
-            # print footer text for fiscal or not fiscal
-            if self.config_id.receipt_footer:
-                footer_line = split_product_name_in_printer_lines(
-                    self.config_id.receipt_footer, self.config_id.cbs_fiscal_printer_line_symbols
-                    if self.config_id.cbs_fiscal_printer_line_symbols > 30 else 30)
-            else:
-                footer_line = []
-            for f_line in footer_line:
-                fp.PrintText(self.sanitise_txt_for_fiscal_print(f_line))
-
-            # barcode
-            barcode_to_print = self.pos_reference.split()[-1]
-            if self.config_id.cbs_barcode_to_print:
-                fp.PrintBarcode("4", len(barcode_to_print), barcode_to_print)  # 4=CODE 39 thre resta re not working
-#  - '0' - UPC A
-#  - '1' - UPC E
-#  - '2' - EAN 13
-#  - '3' - EAN 8
-#  - '4' - CODE 39
-#  - '5' - ITF
-#  - '6' - CODABAR
-#  - 'H' - CODE 93
-#  - 'I' - CODE 128
-#            fp.CashPayCloseReceipt()
-#            fp.PaperFeed()
-# z                 fp.PrintDailyReport(Enums.OptionZeroing.Zeroing)
-#                     print("fp.RawWrite GS I")
-#                     fp.RawWrite(bytearray([0x1D, 0x49]))
-#                     LF = bytearray([0x0A]).decode('utf-8')
-#                     print("fp.RawRead")
-#                     RES_ARR = fp.RawRead(0, LF)
-#                     GS_INFO = RES_ARR.decode('utf-8').replace(LF, "")
-#                     print("GS info: " + str(GS_INFO))
-            fp.PrintText(barcode_to_print)
+            # connected ZFPLABserver with the fiscal device (handshake cached per device); the other
+            # receipts for this device wait until this one is printed
+            with self.config_id._cbs_fiscal_printer() as fp:
+                # from here is comunicating with the fiscal device
+                # a receipt interrupted before (error, killed worker) is ended first
+                if self in self.config_id._cbs_journal_recover(fp) and plan.fiscal:
+                    return {'ok_printed_pos_order_id': (self.id, self.name, plan.barcode)}
+                before = fp.ReadLastAndTotalReceiptNum()
+                res = self._cbs_emit_document(fp, plan, ops, before)
+                if res:
+                    return res
 
-            if force_nonfiscal or has_negative_amount:
-                fp.CloseNonFiscalReceipt()
-            else:
-                fp.CloseReceipt()
+                if plan.fiscal:
+                    this_receipt = fp.ReadLastAndTotalReceiptNum()
+                    self.write(self._cbs_fiscal_receipt_printed(plan, before, this_receipt))
+                    if copy:
+                        # we are going to print also the non fiscal receipt; its error does not undo the fiscal one
+                        try:
+                            fp.PaperFeed()
+                            fp.PaperFeed()
+                            res = self._cbs_emit_document(fp, copy, copy_ops, this_receipt)
+                        except Exception as ex:
+                            res = {'error': handle_exception(ex)}
+                        if res:
+                            _logger.warning("pos.order %s: the non fiscal copy was not printed: %s",
+                                            self.id, res.get('error'))
 
-            to_write = {'cbs_cash_payment': cash_payment_amount, 'cbs_non_cash_payment': non_cash_payment_amount}
-            if not(force_nonfiscal or has_negative_amount):
-                this_receipt = fp.ReadLastAndTotalReceiptNum()
-                last_nr = str(this_receipt.LastReceiptNum)
-                last_total = str(this_receipt.TotalReceiptCounter)
-                to_write.update({'cbs_fiscal_receipt_number': last_nr,
-                                "cbs_before_ReadLastAndTotalReceiptNum": json.dumps(
-                                    {"last_nr": b_last_nr, "last_total": b_last_total}),
-                                'cbs_ReadLastAndTotalReceiptNum': json.dumps({"last_nr": last_nr, "last_total": last_total})})
-                if self.config_id.cbs_after_fiscal_receipt_print_non_fiscal:
-                    # we are going to print also the non fiscal receipt
-                    fp.PaperFeed()
+                if self.config_id.cbs_cut_after_print:
                     fp.PaperFeed()
-                    self.with_context(force_nonfiscal=True).cbs_print_at_fiscal_server(a)
-                self.write(to_write)
-
-            if self.config_id.cbs_cut_after_print:
-                fp.PaperFeed()
-                fp.CutPaper()
-            _logger.info(f'ok_printed_pos_order_id: ({self.id=}, {self.name=}, {barcode_to_print=})')
-            return {'ok_printed_pos_order_id': (self.id, self.name, barcode_to_print)}
+                    fp.CutPaper()
+                _logger.info(f'ok_printed_pos_order_id: ({self.id=}, {self.name=}, {plan.barcode=})')
+                return {'ok_printed_pos_order_id': (self.id, self.name, plan.barcode)}
+        except ValidationError as ex:
+            return {'error': f"CBS: {ex.args[0]}", 'offline': isinstance(ex, FiscalDeviceOffline)}
         except Exception as ex:
-            error = f'CBS: error at fiscal_printer: {ex1=}\n{ex2=}\n{ex3=}\n{handle_exception(ex)}\n' + f"{traceback.format_exc()=}"[:300]
+            error = f'CBS: error at fiscal_printer: {handle_exception(ex)}\n' + f"{traceback.format_exc()=}"[:300]
             _logger.error(error)
-            return {'error': error}
+            return {'error': error,
+                    'offline': isinstance(ex, ServerException) and ex.code in HANDSHAKE_ERROR_CODES}
+
+    def _cbs_emit_document(self, fp, plan, ops, before):
+        """Sends to fp the commands ops rendered from plan (fiscal_receipt.render), journaled; before is the
+        ReadLastAndTotalReceiptNum of the device before it. Returns None if printed, else the answer of
+        cbs_print_at_fiscal_server."""
+        entry = self.env['cbs.fiscal.receipt.journal'].sudo().cbs_plan(self.config_id, self, plan, before)
+        try:
+            # the whole receipt, from opening to closing, is sent to the server in one request
+            # and the consecutive text lines are packed in as few commands as the device allows
+            with fp.batch() as batch, fp.text_block(self.config_id.cbs_fiscal_printer_line_symbols,
+                                                    self.config_id.cbs_print_text_max_symbols):
+                fiscal_receipt.emit(fp, ops)
+        except ServerException as ex:
+            # the commands before the failed one were executed; unknown after a connection error
+            executed = None if ex.batch_index is None else \
+                [name for name, _command in batch.commands[:ex.batch_index]]
+            step = entry.cbs_step(executed, message=str(ex))
+            if ex.code in HANDSHAKE_ERROR_CODES:
+                raise  # ended when the device is reachable again
+            if self in self.config_id._cbs_journal_recover(fp) and plan.fiscal:
+                return {'ok_printed_pos_order_id': (self.id, self.name, plan.barcode)}
+            return {'error': f"CBS: The receipt was not printed; it was {step or 'sent'} at the fiscal "
+                    f"device. {handle_exception(ex)}"}
+        entry.cbs_step(step='closed')
+        return None
+
+    def _cbs_fiscal_receipt_printed(self, plan, before, this_receipt):
+        """Values of the order printed as a fiscal receipt; before and this_receipt are the
+        ReadLastAndTotalReceiptNum of the device before and after the receipt. Adds the counter snapshot."""
+        self.env['cbs.fiscal.counter.snapshot'].cbs_add(
+            self.config_id, 'receipt', session=self.session_id, order_id=self.id,
+            last_receipt_num=this_receipt.LastReceiptNum,
+            total_receipt_counter=this_receipt.TotalReceiptCounter)
+        last_nr = str(this_receipt.LastReceiptNum)
+        last_total = str(this_receipt.TotalReceiptCounter)
+        return {'cbs_cash_payment': plan.cash_amount,
+                'cbs_non_cash_payment': plan.non_cash_amount,
+                'cbs_fiscal_receipt_number': last_nr,
+                'cbs_fiscal_receipt_num': this_receipt.LastReceiptNum,
+                'cbs_fiscal_total_counter': this_receipt.TotalReceiptCounter,
+                'cbs_fiscal_device_serial': self.config_id.cbs_fiscal_device_serial,
+                "cbs_before_ReadLastAndTotalReceiptNum": json.dumps(
+                    {"last_nr": str(before.LastReceiptNum), "last_total": str(before.TotalReceiptCounter)}),
+                'cbs_ReadLastAndTotalReceiptNum': json.dumps({"last_nr": last_nr, "last_total": last_total})}
@@ -3,10 +3,26 @@
 # (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
 from odoo import models, fields
 
+from . import fiscal_text
+
+
+class ProductTemplate(models.Model):
+    _inherit = ['product.template']
+
+    def write(self, vals):
+        if 'name' in vals:
+            fiscal_text.clear()  # the printer lines of the old names are not printed anymore
+        return super().write(vals)
+
 
 class ProductProduct(models.Model):
     _inherit = ['product.product']
 
+    def write(self, vals):
+        if 'name' in vals:
+            fiscal_text.clear()  # the printer lines of the old names are not printed anymore
+        return super().write(vals)
+
     def text_list_for_pos_fiscal_recipt(self):
         """ function to be inherited if you extend it and need also other info
         each text from list is going to be trunckated in conformity with fiscal printer
@@ -29,29 +29,71 @@ odoo.define('cbs_pos_fiscal_printer.CBS_Print_fiscal_device', function (require)
                 return
             }
             
-             let self = this;
-             let x = this.rpc({
+            // the server only queues the receipt; the printing is done by the print job dispatcher
+            // of the printer, so we are polling the job and not keeping a server worker busy
+            try {
+                const value = await this.rpc({
                     model: 'pos.order',
-                    method: 'cbs_print_at_fiscal_server',
+                    method: 'cbs_enqueue_fiscal_print',
                     args: [[order_server_id], orderName],
-                }).then((value) => {
-                    if (value.error) {
-                        this.showPopup('ErrorPopup', {
-                            title: this.env._t('Returned error from print function from server:'),
-                            body: this.env._t(value.error),
-                        });
-                    } else {
-                      //  alert('done'+value); // here all is ok, the recipt was printed
-                        this.currentOrder._printed = true;
-                        }
-                }).catch((error)=> {
+                });
+                if (value.error) {
+                    this.showPopup('ErrorPopup', {
+                        title: this.env._t('Returned error from print function from server:'),
+                        body: this.env._t(value.error),
+                    });
+                    return;
+                }
+                if (!value.job_id) {
+                    return;  // no fiscal printer configured
+                }
+                const job = await this._cbsWaitFiscalPrintJob(value.job_id);
+                if (job.state === 'done') {
+                  //  alert('done'+value); // here all is ok, the recipt was printed
+                    this.currentOrder._printed = true;
+                } else if (job.waiting_device) {
+                    this.showPopup('ErrorPopup', {
+                        title: this.env._t('Fiscal printer offline'),
+                        body: this.env._t('The receipt is queued; it is printed when the fiscal printer is back') +
+                            `${job.error ? ' (' + job.error + ')' : ''}.`,
+                    });
+                } else if (job.state === 'error') {
+                    this.showPopup('ErrorPopup', {
+                        title: this.env._t('Returned error from print function from server:'),
+                        body: this.env._t(job.error),
+                    });
+                } else {
                     this.showPopup('ErrorPopup', {
-                        title: 'Error from server at print:',
-                        body: error.message +';'+ error.message.data.message,
+                        title: this.env._t('Receipt not printed yet'),
+                        body: this.env._t('The receipt is still waiting for the fiscal printer ') +
+                            `(${job.state}${job.error ? ': ' + job.error : ''}).`,
                     });
+                }
+            } catch (error) {
+                this.showPopup('ErrorPopup', {
+                    title: 'Error from server at print:',
+                    body: error.message +';'+ (error.message.data ? error.message.data.message : ''),
                 });
+            }
 
         };
+
+        async _cbsWaitFiscalPrintJob(jobId) {
+            // polls the print job until it is done, in error or waiting for the device; gives up after ~2 minutes
+            let job = {state: 'pending'};
+            for (let i = 0; i < 240; i++) {
+                await new Promise((resolve) => setTimeout(resolve, 500));
+                job = await this.rpc({
+                    model: 'cbs.fiscal.print.job',
+                    method: 'cbs_job_status',
+                    args: [[jobId]],
+                }, {shadow: true});
+                if (job.state === 'done' || job.state === 'error' || job.waiting_device) {
+                    break;
+                }
+            }
+            return job;
+        };
     }
 //             async printReceipt() {
 //                 alert("will print receipt");
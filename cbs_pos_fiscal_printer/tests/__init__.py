@@ -0,0 +1,21 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from . import test_fp_transport
+from . import test_fp_registry
+from . import test_fp_codec
+from . import test_fp_module
+from . import test_tax_vat_class
+from . import test_receipt_plan
+from . import test_fiscal_text
+from . import test_fiscal_plu
+from . import test_report_run
+from . import test_fiscal_status
+from . import test_fp_metrics
+from . import test_fiscal_journal
+from . import test_fiscal_receipt
+from . import test_fiscal_bench
+from . import test_fiscal_ej
+from . import test_fiscal_ej_export
+from . import test_fiscal_arbiter
+from . import test_fp_async
@@ -0,0 +1,145 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import threading
+from unittest.mock import patch
+
+from odoo.tests import common, tagged
+
+from ..models import FP_registry, fiscal_arbiter
+from .test_fp_transport import FPServerCase, print_sample_receipt
+from .zfplab_mock import DEFAULT_DEVICE_SETTINGS
+
+NR_REGISTERS = 4
+NR_RECEIPTS = 5
+NR_LINES = 3
+
+
+def dispatch(queue, batch_max=fiscal_arbiter.DEVICE_BATCH_MAX):
+    """The devices of the jobs of queue [(job, device)] in the order the dispatcher prints them (one pos
+    config per device, all jobs ready)."""
+    queue, device, served, printed = list(queue), None, 0, []
+    while queue:
+        heads = [(job, job_device) for job, job_device in queue
+                 if job == min(other for other, other_device in queue if other_device == job_device)]
+        job, job_device = heads[fiscal_arbiter.next_job(heads, device, served, batch_max)]
+        served = served + 1 if job_device == device else 1
+        device = job_device
+        queue.remove((job, job_device))
+        printed.append(job_device)
+    return printed
+
+
+def switches(printed):
+    return sum(1 for i, device in enumerate(printed) if i == 0 or printed[i - 1] != device)
+
+
+class TestFiscalArbiter(common.BaseCase):
+
+    def test_server_key(self):
+        key = fiscal_arbiter.server_key(("192.168.1.10", 4444))
+        self.assertEqual(key, fiscal_arbiter.server_key(("192.168.1.10", 4444)))
+        self.assertNotEqual(key, fiscal_arbiter.server_key(("192.168.1.10", 4445)))
+        self.assertTrue(0 <= key < 2 ** 31)
+
+    def test_next_job(self):
+        heads = [(1, "A"), (2, "B"), (3, "A")]
+        self.assertIsNone(fiscal_arbiter.next_job([], "A", 0))
+        self.assertEqual(fiscal_arbiter.next_job(heads, None, 0), 0)
+        self.assertEqual(fiscal_arbiter.next_job(heads, "B", 1), 1)
+        # the batch of B is done: the oldest job of another device
+        self.assertEqual(fiscal_arbiter.next_job(heads, "B", 2, batch_max=2), 0)
+        # nobody else waits: B goes on
+        self.assertEqual(fiscal_arbiter.next_job([(2, "B")], "B", 2, batch_max=2), 0)
+
+    def test_dispatch_batches_devices(self):
+        # the receipts of 4 registers arriving interleaved: one switch per device instead of one per receipt
+        queue = [(job, "ABCD"[job % 4]) for job in range(40)]
+        printed = dispatch(queue)
+        self.assertEqual(switches(printed), 4)
+        self.assertEqual(sorted(printed), sorted(device for _job, device in queue))
+        # a busy device does not keep the server more than batch_max receipts while the others wait
+        self.assertEqual(dispatch(queue, batch_max=5)[:6], ["A"] * 5 + ["B"])
+
+
+class TestSharedServer(FPServerCase):
+    """NR_REGISTERS registers printing at the same time at their own devices, all through one ZfpLab server
+    that serves one client at a time."""
+
+    def setUp(self):
+        super().setUp()
+        FP_registry.clear()
+        self.addCleanup(FP_registry.clear)
+        self.server.exclusive = True
+        self.server.latency = 0.002
+        self.addCleanup(setattr, self.server, "exclusive", False)
+        self.addCleanup(setattr, self.server, "latency", 0.0)
+        self.addCleanup(setattr, self.server, "device_settings", dict(DEFAULT_DEVICE_SETTINGS))
+
+    def _print(self, client, errors):
+        try:
+            for _i in range(NR_RECEIPTS):
+                with client.use() as fp:
+                    FP_registry.connect_device(fp, client.device)
+                    print_sample_receipt(fp, NR_LINES)
+        except Exception as ex:
+            errors.append(ex)
+
+    def test_registers_share_server(self):
+        errors = []
+        server = ("127.0.0.1", self.server.port)
+        devices = [("tcp", f"10.0.0.{i + 1}", 8000, None) for i in range(NR_REGISTERS)]
+        threads = [threading.Thread(target=self._print, args=(FP_registry.get_client(server, device), errors))
+                   for device in devices]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual((self.server.busy_answers, self.server.max_in_flight), (0, 1))
+        # each receipt at the device of its register
+        for _tcp, ip, port, _password in devices:
+            self.assertEqual(self.server.closed_on.count(f"{ip}:{port}"), NR_RECEIPTS)
+
+
+@tagged("post_install", "-at_install")
+class TestDispatchServers(common.TransactionCase):
+
+    def test_server_getting_jobs_meanwhile(self):
+        # a ZfpLab server getting its first jobs while the dispatcher of another one drains its queue is served
+        # in the same run of the cron
+        jobs = self.env["cbs.fiscal.print.job"]
+        pending, dispatched = [{1: {}}], []
+
+        def dispatch_server(_self, server_key):
+            dispatched.append(server_key)
+            pending[0] = {2: {}} if server_key == 1 else {}
+
+        with patch.object(type(jobs), "_cbs_pending_servers", lambda _self: pending[0]), \
+                patch.object(type(jobs), "_cbs_dispatch_server", dispatch_server):
+            jobs._cron_dispatch()
+        self.assertEqual(dispatched, [1, 2])
+
+
+@tagged("post_install", "-at_install")
+class TestEnqueue(common.TransactionCase):
+
+    def test_enqueue_same_receipt_at_once(self):
+        # another request enqueued the receipt between the search and the insert: its job is returned
+        jobs = self.env["cbs.fiscal.print.job"]
+        config = self.env["pos.config"].create({"name": "CBS register"})
+        session = self.env["pos.session"].create({"config_id": config.id})
+        order = self.env["pos.order"].create({
+            "session_id": session.id, "pricelist_id": config.pricelist_id.id, "amount_tax": 0,
+            "amount_total": 1, "amount_paid": 1, "amount_return": 0, "pos_reference": "Order 00001-001-0001"})
+        job = jobs.cbs_enqueue(order)
+        search, searches = type(jobs).search, []
+
+        def search_after_other_request(model, domain, *args, **kwargs):
+            searches.append(domain)
+            return model.browse() if len(searches) == 1 else search(model, domain, *args, **kwargs)
+
+        with patch.object(type(jobs), "search", search_after_other_request):
+            self.assertEqual(jobs.cbs_enqueue(order), job)
+        self.assertEqual(len(searches), 2)
+        self.assertEqual(jobs.search_count([("pos_reference", "=", order.pos_reference)]), 1)
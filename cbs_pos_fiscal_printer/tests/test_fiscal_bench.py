@@ -0,0 +1,224 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""The print path of typical receipts against the mock ZfpLab server: the round trips of each order shape are
+checked by the standard tests; the throughput and the latency percentiles are logged by the benchmark
+(odoo-bin --test-tags cbs_fiscal_bench)."""
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+
+from odoo.tests import tagged
+
+from ..models import FP_registry, fiscal_receipt
+from ..models.FP import FP
+from ..models.FP_async import AsyncFP
+from ..models.FP_core import ServerException
+from ..models.fiscal_receipt import ReceiptLine, ReceiptPayment, ReceiptPlan
+from .test_fp_async import print_sample_receipt as async_print_sample_receipt
+from .test_fp_transport import FPServerCase, print_sample_receipt
+from .zfplab_mock import DEFAULT_DEVICE_SETTINGS, ZfpLabMockServer
+
+_logger = logging.getLogger(__name__)
+
+LINE_SYMBOLS = 32
+MAX_TEXT_SYMBOLS = 0  # default of cbs_print_text_max_symbols: no packing
+
+
+def sample_plan(nr_lines, nr_storno=0, payments=None):
+    """A fiscal receipt plan of nr_lines sales (two text lines each) followed by nr_storno storno lines,
+    paid in cash if no payments [(amount, is_cash)] are given."""
+    lines = [ReceiptLine((f"Product with a long name nr {i}", "from the kitchen"), f"Product {i}", "A", 10.5, 1,
+                         10.5, True) for i in range(nr_lines)]
+    lines += [ReceiptLine((f"Returned product {i}",), f"Returned {i}", "A", 10.5, -1, -10.5, False)
+              for i in range(nr_storno)]
+    amount_total = 10.5 * (nr_lines - nr_storno)
+    return ReceiptPlan(
+        order_id=1, fiscal=True, show_amounts=False, operator_password="0000", print_type="0",
+        cash_drawer_open=False, return_line_ids=tuple(range(nr_storno)), lines=tuple(lines),
+        amount_total=amount_total,
+        payments=tuple(ReceiptPayment(amount, is_cash) for amount, is_cash in payments or [(amount_total, True)]),
+        footer=("Thank you",), barcode="00001-001-0001", print_barcode=False)
+
+
+# order shapes: name, plan
+SHAPES = [
+    ("1 line", sample_plan(1)),
+    ("10 lines", sample_plan(10)),
+    ("50 lines", sample_plan(50)),
+    ("storno", sample_plan(10, nr_storno=3)),
+    ("mixed payments", sample_plan(10, payments=[(50, True), (5, True), (30, False), (20, False)])),
+]
+
+
+def print_plan(fp, plan):
+    """What pos.order._cbs_print_at_fiscal_server sends to the device for a fiscal receipt plan: the counters,
+    the receipt in one batch, the counters again."""
+    fp.ReadLastAndTotalReceiptNum()
+    ops = fiscal_receipt.render(plan)
+    with fp.batch(), fp.text_block(LINE_SYMBOLS, MAX_TEXT_SYMBOLS):
+        fiscal_receipt.emit(fp, ops)
+    return fp.ReadLastAndTotalReceiptNum()
+
+
+def percentile(durations, q):
+    "q percentile of the sorted durations"
+    return durations[min(len(durations) - 1, int(len(durations) * q))]
+
+
+class TestFiscalReceiptShapes(FPServerCase):
+
+    def test_round_trips(self):
+        # whatever the shape, a receipt costs 3 requests on one connection
+        fp = self.new_fp()
+        for name, plan in SHAPES:
+            self.server.reset_stats()
+            print_plan(fp, plan)
+            commands = self.server.commands
+            self.assertEqual(self.server.requests, 3, name)
+            self.assertEqual(commands.count("Payment"), len(plan.payment_commands), name)
+            self.assertEqual(commands.count("StornoPLU"), len(plan.return_line_ids), name)
+            self.assertEqual(commands[-2], "CloseReceipt", name)
+        self.assertLessEqual(self.server.connections, 1)
+
+    def test_device_error(self):
+        # a receipt failing at the device stops at the failed command
+        self.server.errors = {"Payment": (0x30, 0x32)}
+        fp = self.new_fp()
+        with self.assertRaises(ServerException) as catcher:
+            print_plan(fp, SHAPES[4][1])
+        self.assertEqual(catcher.exception.command_name, "Payment")
+        self.assertNotIn("CloseReceipt", self.server.commands)
+
+
+@tagged("-standard", "cbs_fiscal_bench")
+class BenchFiscalReceipt(FPServerCase):
+    """odoo-bin --test-tags cbs_fiscal_bench; results are logged."""
+
+    def _bench(self, plan, nr_receipts):
+        fp = self.new_fp()
+        self.server.reset_stats()
+        durations = []
+        start = time.perf_counter()
+        for _i in range(nr_receipts):
+            receipt_start = time.perf_counter()
+            print_plan(fp, plan)
+            durations.append(time.perf_counter() - receipt_start)
+        total = time.perf_counter() - start
+        durations.sort()
+        return {
+            "receipts_per_s": round(nr_receipts / total, 1),
+            "p50_ms": round(percentile(durations, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(durations, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(durations, 0.99) * 1000, 2),
+            "round_trips_per_receipt": self.server.requests / nr_receipts,
+        }
+
+    def test_bench_shapes(self):
+        results = {name: self._bench(plan, 100) for name, plan in SHAPES}
+        for name, res in results.items():
+            _logger.info("fiscal receipt %s: %s", name, res)
+            self.assertEqual(res["round_trips_per_receipt"], 3, name)
+
+    def test_bench_shapes_device_latency(self):
+        """a device answering each request in 5 ms: the round trips, not the lines, make the time"""
+        self.server.latency = 0.005
+        self.addCleanup(setattr, self.server, "latency", 0.0)
+        results = {name: self._bench(plan, 20) for name, plan in SHAPES}
+        for name, res in results.items():
+            _logger.info("fiscal receipt %s, 5 ms device latency: %s", name, res)
+        self.assertLess(results["50 lines"]["p50_ms"], 3 * results["1 line"]["p50_ms"])
+
+    def test_bench_device_reconnects(self):
+        """the device reconnections in one hour of 4 registers printing at the same device of one ZfpLab server,
+        each making its handshake every 300 s (cbs_fiscal_handshake_ttl), before and after comparing the
+        device settings with the ones of the server"""
+        device = ("tcp", "127.0.0.1", 8000, "aA12345")
+        handshakes = 4 * 3600 // 300
+        fp = self.new_fp()
+        self.addCleanup(setattr, self.server, "device_settings", dict(DEFAULT_DEVICE_SETTINGS))
+        self.server.reset_stats()
+        for _i in range(handshakes):
+            fp.serverSetDeviceTcpSettings(*device[1:])
+        before = self.server.device_connects
+        self.server.device_settings = dict(DEFAULT_DEVICE_SETTINGS)
+        self.server.reset_stats()
+        for _i in range(handshakes):
+            FP_registry.connect_device(fp, device)
+        after = self.server.device_connects
+        _logger.info("device reconnections per hour, 4 registers: %s sending the settings, %s comparing them",
+                     before, after)
+        self.assertEqual((before, after), (handshakes, 1))
+
+    def test_bench_shared_server(self):
+        """4 registers printing at their own devices through one ZfpLab server serving one client at a time:
+        each register with its own client (before) and with the clients of the server taking turns (after)"""
+        self.server.exclusive = True
+        self.server.latency = 0.002
+        self.addCleanup(setattr, self.server, "exclusive", False)
+        self.addCleanup(setattr, self.server, "latency", 0.0)
+        self.addCleanup(setattr, self.server, "device_settings", dict(DEFAULT_DEVICE_SETTINGS))
+        self.addCleanup(FP_registry.clear)
+        devices = [("tcp", f"10.0.0.{i + 1}", 8000, None) for i in range(4)]
+        plan = SHAPES[1][1]
+
+        def run(uses):
+            errors = []
+
+            def register(use, device):
+                for _i in range(10):
+                    try:
+                        with use() as fp:
+                            FP_registry.connect_device(fp, device)
+                            print_plan(fp, plan)
+                    except ServerException as ex:
+                        errors.append(ex)
+            self.server.reset_stats()
+            start = time.perf_counter()
+            threads = [threading.Thread(target=register, args=(use, device)) for use, device in zip(uses, devices)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            return {"receipts_per_s": round((40 - len(errors)) / (time.perf_counter() - start), 1),
+                    "failed_receipts": len(errors), "busy_answers": self.server.busy_answers,
+                    "device_switches": self.server.device_connects}
+
+        server = ("127.0.0.1", self.server.port)
+        after = run([FP_registry.get_client(server, device).use for device in devices])
+        # last: the failed batches make the clients of the server stop sending batches
+        before = run([lambda fp=self.new_fp(): contextlib.nullcontext(fp) for _device in devices])
+        _logger.info("4 registers sharing one ZfpLab server: before %s, after %s", before, after)
+        self.assertEqual((after["failed_receipts"], after["busy_answers"]), (0, 0))
+
+    def test_bench_async_devices(self):
+        """50 devices, each answering a request in 2 ms, printing 5 receipts of 3 lines from one thread: one FP
+        per device in turn (before) and one AsyncFP per device in one event loop (after)"""
+        servers = [ZfpLabMockServer().start() for _i in range(50)]
+        for server in servers:
+            server.latency = 0.002
+            self.addCleanup(server.stop)
+        start = time.perf_counter()
+        for server in servers:
+            fp = FP()
+            fp.serverSetSettings("127.0.0.1", server.port)
+            for _i in range(5):
+                print_sample_receipt(fp, 3)
+        before = round(250 / (time.perf_counter() - start), 1)
+
+        async def device(server):
+            async with AsyncFP("127.0.0.1", server.port) as fp:
+                for _i in range(5):
+                    await async_print_sample_receipt(fp, 3)
+
+        async def run():
+            await asyncio.gather(*(device(server) for server in servers))
+        start = time.perf_counter()
+        asyncio.run(run())
+        after = round(250 / (time.perf_counter() - start), 1)
+        _logger.info("50 devices from one thread, receipts per second: %s one after another, %s in one event loop",
+                     before, after)
+        self.assertEqual(sum(server.max_in_flight for server in servers), 50)
+        self.assertGreater(after, before)
@@ -0,0 +1,44 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from ..models import fiscal_ej
+from .test_fp_transport import FPServerCase
+
+EJ_LINES = [
+    "BON FISCAL 0011".encode(fiscal_ej.ENCODING),
+    "Apa                 2.00 A".encode(fiscal_ej.ENCODING),
+    "BON FISCAL 0012\r\n".encode(fiscal_ej.ENCODING),
+    "Pâine               3.00 A".encode(fiscal_ej.ENCODING),
+    "RAPORT Z 0040".encode(fiscal_ej.ENCODING),
+    "BON FISCAL 0001".encode(fiscal_ej.ENCODING),
+]
+
+
+class TestFiscalEj(FPServerCase):
+
+    def tearDown(self):
+        self.server.raw_lines = []
+        super().tearDown()
+
+    def test_z_ranges(self):
+        self.assertEqual(list(fiscal_ej.z_ranges(1, 25, 10)), [(1, 10), (11, 20), (21, 25)])
+        self.assertEqual(list(fiscal_ej.z_ranges(5, 5, 0)), [(5, 5)])
+        self.assertEqual(list(fiscal_ej.z_ranges(6, 5, 10)), [])
+
+    def test_index_receipts(self):
+        lines = [fiscal_ej.decode(raw) for raw in EJ_LINES]
+        self.assertEqual(list(fiscal_ej.index_receipts(lines, 41)), [(40, 11, 0), (40, 12, 2), (41, 1, 5)])
+
+    def test_read_report(self):
+        # the lines come one RawRead each, up to the end line
+        self.server.raw_lines = EJ_LINES + [fiscal_ej.REPORT_END.encode(), b"not read"]
+        lines = list(fiscal_ej.read_report(self.new_fp(), "ej", 40, 41))
+        self.assertEqual(lines[2:4], ["BON FISCAL 0012", "Pâine               3.00 A"])
+        self.assertEqual(len(lines), len(EJ_LINES))
+        self.assertEqual(self.server.commands, ["ReadEJByZReportNum"] + ["RawRead"] * (len(EJ_LINES) + 1))
+        self.assertEqual(self.server.raw_lines, [b"not read"])
+
+    def test_read_report_empty(self):
+        # an empty read ends the report too
+        self.assertEqual(list(fiscal_ej.read_report(self.new_fp(), "fm", 1, 2)), [])
+        self.assertEqual(self.server.commands, ["ReadDetailedFMReportByZNum", "RawRead"])
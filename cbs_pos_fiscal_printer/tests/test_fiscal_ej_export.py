@@ -0,0 +1,76 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import gzip
+
+from odoo.tests import common, tagged
+
+from ..models import FP_registry, FP_transport
+from .zfplab_mock import ZfpLabMockServer
+
+
+@tagged("post_install", "-at_install")
+class TestFiscalEjExport(common.TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ZfpLabMockServer().start()
+        cls.addClassCleanup(cls.server.stop)
+        cls.server.responses["ReadLastDailyReportInfo"] = [
+            ("LastZDailyReportDate", "DateTime", "07-05-2023 00:00:00"),
+            ("LastZDailyReportNum", "Number", "41"), ("LastRAMResetNum", "Number", "0")]
+        cls.addClassCleanup(FP_transport.clear_pools)
+        cls.addClassCleanup(FP_registry.clear)
+        cls.config = cls.env["pos.config"].create({
+            "name": "CBS register",
+            "cbs_fiscal_printer_server_ip": f"127.0.0.1:{cls.server.port}",
+            "cbs_fiscal_printer_ip": "127.0.0.1",
+            "cbs_fiscal_printer_port": cls.server.port,
+        })
+
+    def tearDown(self):
+        self.server.raw_lines = []
+        super().tearDown()
+
+    def test_ej_export(self):
+        export = self.env["cbs.fiscal.ej.export"].create({"config_id": self.config.id, "z_from": 40, "z_chunk": 1})
+        self.server.raw_lines = [b"BON FISCAL 0011", b"RAPORT Z 0040", b"@"]
+        export._cbs_export_chunk()
+        self.assertEqual((export.state, export.z_to, export.last_z_done, export.line_count), ("running", 41, 40, 2))
+        self.assertIn("ReadEJByZReportNum", self.server.commands)
+        # a request interrupted after writing: its lines are dropped by the next one
+        with open(export.file_path, "ab") as file:
+            file.write(b"interrupted")
+        self.server.raw_lines = [b"BON FISCAL 0001", b"BON FISCAL 0002", b"@"]
+        export._cbs_export_chunk()
+        self.assertEqual((export.state, export.last_z_done, export.receipt_count), ("done", 41, 3))
+        with gzip.open(export.file_path, "rt", encoding="utf-8") as file:
+            self.assertEqual(file.read().splitlines(),
+                             ["BON FISCAL 0011", "RAPORT Z 0040", "BON FISCAL 0001", "BON FISCAL 0002"])
+        # the Z report line of the last day is not read: its receipts belong to it all the same
+        self.assertEqual([(receipt.z_num, receipt.receipt_num, receipt.line_no) for receipt in export.receipt_ids],
+                         [(40, 11, 0), (41, 1, 2), (41, 2, 3)])
+
+    def test_link_orders_by_day(self):
+        # one session spanning two fiscal days, both with a receipt 1: each is linked to the order of its day
+        config = self.config
+        session = self.env["pos.session"].create({"config_id": config.id})
+        snapshots = self.env["cbs.fiscal.counter.snapshot"]
+
+        def receipt(receipt_num):
+            order = self.env["pos.order"].create({
+                "session_id": session.id, "pricelist_id": config.pricelist_id.id, "amount_tax": 0,
+                "amount_total": 1, "amount_paid": 1, "amount_return": 0, "cbs_fiscal_receipt_num": receipt_num})
+            snapshots.cbs_add(config, "receipt", session=session, order_id=order.id, last_receipt_num=receipt_num)
+            return order
+
+        first_day = receipt(1)
+        snapshots.cbs_add(config, "z_report", session=session, last_z_report_num=40)
+        second_day = receipt(1)
+        snapshots.cbs_add(config, "z_report", session=session, last_z_report_num=41)
+        export = self.env["cbs.fiscal.ej.export"].create({"config_id": config.id, "z_from": 40, "z_chunk": 2})
+        self.server.raw_lines = [b"BON FISCAL 0001", b"RAPORT Z 0040", b"BON FISCAL 0001", b"RAPORT Z 0041", b"@"]
+        export._cbs_export_chunk()
+        self.assertEqual([(receipt.z_num, receipt.order_id) for receipt in export.receipt_ids],
+                         [(40, first_day), (41, second_day)])
@@ -0,0 +1,46 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo.tests import common
+
+from ..models import fiscal_journal
+from ..models.fiscal_receipt import ReceiptLine, ReceiptPayment, ReceiptPlan
+
+PLAN = ReceiptPlan(
+    order_id=7, fiscal=True, show_amounts=True, operator_password="0000", print_type="0",
+    cash_drawer_open=False, return_line_ids=(3,),
+    lines=(ReceiptLine(("Apa", "plata"), "plata", "B", 2.5, 2.0, 5.0, True, 4),),
+    amount_total=5.0, payments=(ReceiptPayment(2.0, True), ReceiptPayment(3.0, False)),
+    footer=("Thank you",), barcode="Order 00001-001-0001", print_barcode=False)
+
+
+class TestFiscalJournal(common.BaseCase):
+
+    def test_step_of(self):
+        receipt = ["OpenReceipt", "SellPLUwithSpecifiedVAT", "Payment", "Payment", "CloseReceipt"]
+        self.assertEqual(fiscal_journal.step_of([]), "planned")
+        self.assertEqual(fiscal_journal.step_of(receipt[:1]), "opened")
+        self.assertEqual(fiscal_journal.step_of(receipt[:2]), "lines_sent")
+        self.assertEqual(fiscal_journal.step_of(receipt[:3]), "paid")
+        self.assertEqual(fiscal_journal.step_of(receipt), "closed")
+        self.assertEqual(fiscal_journal.payments_done(receipt[:4]), 2)
+        self.assertEqual(fiscal_journal.step_of(["OpenNonFiscalReceipt", "PrintNonFiscalText"]), "lines_sent")
+
+    def test_recovery_commands(self):
+        payments = PLAN.payment_commands
+        self.assertEqual(payments, (("Payment", (0, 2.0)), ("Payment", (1, 3.0))))
+        # the device has no opened receipt: it was closed or never opened
+        self.assertEqual(fiscal_journal.recovery_commands("lines_sent", 0, payments, False, False), [])
+        self.assertEqual(fiscal_journal.recovery_commands("lines_sent", 0, payments, True, False),
+                         [("CancelReceipt", ())])
+        self.assertEqual(fiscal_journal.recovery_commands("paid", 1, payments, True, False),
+                         [("Payment", (1, 3.0)), ("CloseReceipt", ())])
+        self.assertEqual(fiscal_journal.recovery_commands("opened", 0, (), False, True),
+                         [("CloseNonFiscalReceipt", ())])
+
+    def test_plan_json(self):
+        plan = ReceiptPlan.from_json(PLAN.to_json())
+        self.assertEqual(plan, PLAN)
+        self.assertIsInstance(plan.lines[0], ReceiptLine)
+        self.assertIsInstance(plan.payments[1], ReceiptPayment)
+        self.assertEqual(plan.non_cash_amount, 3.0)
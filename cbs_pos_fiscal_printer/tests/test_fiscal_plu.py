@@ -0,0 +1,43 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo.tests import common
+
+from ..models import fiscal_plu
+from ..models.fiscal_plu import PluState
+from .test_fp_codec import RecordingFP
+
+
+class TestFiscalPlu(common.BaseCase):
+
+    def test_assign_numbers(self):
+        # 10 keeps its number, 11 lost its product, the new ones take the lowest free numbers
+        numbers = fiscal_plu.assign_numbers([10, 12, 13, 14], {10: 2, 11: 1}, 3)
+        self.assertEqual(numbers, {10: 2, 12: 1, 13: 3})
+        # a number over the capacity is given again
+        self.assertEqual(fiscal_plu.assign_numbers([10, 12], {10: 5, 12: 1}, 2), {10: 2, 12: 1})
+
+    def test_plu_commands(self):
+        new = PluState("Cafea", 7.5, "A", "5941234567890")
+        self.assertEqual([name for name, _args in fiscal_plu.plu_commands(1, None, new)],
+                         ["ProgPLUgeneral", "ProgPLUbarcode"])
+        self.assertEqual(fiscal_plu.plu_commands(1, new, new), [])
+        self.assertEqual(fiscal_plu.plu_commands(1, new, new._replace(price=8.0)),
+                         [("ProgPLUprice", (1, 8.0, "0", 0, 0))])
+        self.assertEqual([name for name, _args in fiscal_plu.plu_commands(1, new, new._replace(vat_class="B"))],
+                         ["ProgPLUgeneral"])
+        self.assertEqual(fiscal_plu.plu_commands(1, new, new._replace(barcode="5941234567891")),
+                         [("ProgPLUbarcode", (1, "5941234567891"))])
+
+    def test_commands_are_fp_calls(self):
+        fp = RecordingFP()
+        for method, args in fiscal_plu.plu_commands(7, None, PluState("Ceai", 5, "B", "5941234567890"), 1):
+            getattr(fp, method)(*args)
+        fp.SellPLUFromFD_DB("+", 7, 2)
+        self.assertEqual([name for name, _args in fp.calls], ["ProgPLUgeneral", "ProgPLUbarcode", "SellPLUFromFD_DB"])
+
+    def test_name_and_barcode(self):
+        self.assertEqual(fiscal_plu.plu_name("A|B" + "x" * 40), "A/B" + "x" * 31)
+        self.assertEqual(fiscal_plu.plu_barcode("5941234567890"), "5941234567890")
+        self.assertEqual(fiscal_plu.plu_barcode("ABC123"), "")
+        self.assertEqual(fiscal_plu.plu_barcode(False), "")
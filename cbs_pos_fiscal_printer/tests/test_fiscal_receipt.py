@@ -0,0 +1,44 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo.tests import common
+
+from ..models import fiscal_receipt
+from .test_fiscal_journal import PLAN
+from .test_fp_codec import RecordingFP
+
+
+class TestFiscalReceipt(common.BaseCase):
+
+    def test_render_fiscal(self):
+        ops = fiscal_receipt.render(PLAN)
+        self.assertEqual([command for command, _args in ops],
+                         ["OpenReceipt", "PrintText", "PrintText", "SellPLUFromFD_DB", "Payment", "Payment",
+                          "PrintText", "PrintText", "CloseReceipt"])
+        self.assertEqual(ops[3], ("SellPLUFromFD_DB", ("+", 4, 2.0)))
+        self.assertEqual(ops[-2], ("PrintText", (PLAN.barcode,)))
+
+    def test_render_non_fiscal_copy(self):
+        copy = PLAN._replace(fiscal=False, print_type=0)
+        ops = fiscal_receipt.render(copy)
+        self.assertEqual(ops[0], ("OpenNonFiscalReceipt", (1, "0000", 0)))
+        self.assertEqual(ops[1], ("PrintText", ("RETUR AL: [3]",)))
+        self.assertIn(("PrintText", ("TOTAL: 5.00",)), ops)
+        self.assertIn(("PrintText", ("PLATA NU prin casa: 3.00lei",)), ops)
+        self.assertEqual(ops[-1], ("CloseNonFiscalReceipt", ()))
+        self.assertNotIn("Payment", [command for command, _args in ops])
+
+    def test_emit(self):
+        # emitting the rendered commands sends what the device conversation sent before
+        rendered, direct = RecordingFP(), RecordingFP()
+        fiscal_receipt.emit(rendered, fiscal_receipt.render(PLAN))
+        direct.OpenReceipt(1, "0000", "0")
+        direct.PrintText("Apa")
+        direct.PrintText("plata")
+        direct.SellPLUFromFD_DB("+", 4, 2.0)
+        direct.Payment(0, 2.0)
+        direct.Payment(1, 3.0)
+        direct.PrintText("Thank you")
+        direct.PrintText(PLAN.barcode)
+        direct.CloseReceipt()
+        self.assertEqual(rendered.calls, direct.calls)
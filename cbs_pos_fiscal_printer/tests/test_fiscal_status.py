@@ -0,0 +1,39 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from ..models import fiscal_status
+from .test_fp_transport import FPServerCase
+from .zfplab_mock import FP_STATUS_NAMES
+
+
+class TestFiscalStatus(FPServerCase):
+
+    def _status(self, *set_names):
+        self.server.responses["ReadStatus"] = [(name, "Status", "1" if name in set_names else "0")
+                                               for name in FP_STATUS_NAMES]
+        return fiscal_status.device_status(self.new_fp().ReadStatus())
+
+    def tearDown(self):
+        self.server.responses["ReadStatus"] = [(name, "Status", "0") for name in FP_STATUS_NAMES]
+        super().tearDown()
+
+    def test_ok(self):
+        vals = self._status("FM_fiscalized", "Decimal_point")
+        self.assertEqual((vals["state"], vals["message"]), ("ok", False))
+        self.assertFalse(any(vals[field] for field in fiscal_status.STATUS_FLAGS))
+
+    def test_warning(self):
+        vals = self._status("Near_Paper_end", "Opened_Fiscal_Receipt")
+        self.assertEqual(vals["state"], "warning")
+        self.assertEqual(vals["message"], "Near paper end; Opened fiscal receipt")
+        self.assertTrue(vals["near_paper_end"])
+
+    def test_error(self):
+        vals = self._status("Near_Paper_end", "Blocking_after_24_hours")
+        self.assertEqual(vals["state"], "error")
+        self.assertTrue(vals["blocked_24h"])
+        self.assertIn(vals["state"], fiscal_status.BLOCKING_STATES)
+
+    def test_failed(self):
+        vals = fiscal_status.failed_status("unreachable", "no route")
+        self.assertEqual((vals["state"], vals["message"], vals["no_paper"]), ("unreachable", "no route", False))
@@ -0,0 +1,36 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from unidecode import unidecode
+
+from odoo.tests import common
+
+from ..models import fiscal_text
+
+
+class TestFiscalText(common.BaseCase):
+
+    def setUp(self):
+        super().setUp()
+        fiscal_text.clear()
+        self.addCleanup(fiscal_text.clear)
+
+    def test_printer_lines(self):
+        name = "Cafea François cu lapte și frișcă 北亰"
+        lines = fiscal_text.printer_lines(name, 10)
+        self.assertEqual(lines, tuple(unidecode(name[i:i + 10]) for i in range(0, len(name), 10)))
+        self.assertIs(fiscal_text.printer_lines(name, 10), lines)
+        self.assertEqual(len(fiscal_text.printer_lines(name, 30)), 2)
+        self.assertEqual(fiscal_text.printer_lines("", 30), ())
+        self.assertEqual(fiscal_text.ascii_text("François"), "Francois")
+
+    def test_stats_and_clear(self):
+        for _i in range(3):
+            fiscal_text.printer_lines("Product 1", 32)
+        fiscal_text.printer_lines("Product 1", 40)
+        stats = fiscal_text.stats()["printer_lines"]
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 2, 2))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        fiscal_text.clear()
+        self.assertEqual(fiscal_text.stats()["printer_lines"]["size"], 0)
+        self.assertEqual(fiscal_text.stats()["ascii_text"]["hit_rate"], 0.0)
@@ -0,0 +1,96 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import asyncio
+
+from ..models.FP_async import AsyncFP
+from ..models.FP_core import ServerException, SErrorType
+from .test_fp_transport import FPServerCase
+
+
+async def print_sample_receipt(fp, nr_lines):
+    """The commands that cbs_print_at_fiscal_server sends for a fiscal receipt of nr_lines, awaited."""
+    await fp.ReadLastAndTotalReceiptNum()
+    await fp.OpenReceipt(1, "0", 0)
+    for i in range(nr_lines):
+        await fp.PrintText(f"Product with a long name nr {i}")
+        await fp.SellPLUwithSpecifiedVAT(f"Product {i}", "A", 10.5, 1)
+    await fp.Payment(0, 10.5 * nr_lines)
+    await fp.CloseReceipt()
+    return await fp.ReadLastAndTotalReceiptNum()
+
+
+class TestAsyncFP(FPServerCase):
+
+    def new_async_fp(self, **kwargs):
+        return AsyncFP("127.0.0.1", self.server.port, **kwargs)
+
+    def run_async(self, fp, coroutine_function):
+        """Runs coroutine_function(fp) in a new event loop, closing the connections of fp."""
+        async def run():
+            async with fp:
+                return await coroutine_function(fp)
+        return asyncio.run(run())
+
+    def test_same_answers_as_fp(self):
+        self.server.responses["ReadGPRS_Signal"] = [("Signal", "Text", "80")]
+
+        async def run(fp):
+            return (await fp.ReadLastAndTotalReceiptNum(), await fp.ReadSerialNum(), await fp.ReadStatus(),
+                    await fp.ReadGPRS_Signal(), await fp.CashDrawerOpen())
+        counters, serial, status, signal, nothing = self.run_async(self.new_async_fp(), run)
+        sync_fp = self.new_fp()
+        self.assertEqual((counters.LastReceiptNum, counters.TotalReceiptCounter),
+                         (sync_fp.ReadLastAndTotalReceiptNum().LastReceiptNum, 1234))
+        self.assertEqual(serial, sync_fp.ReadSerialNum())
+        self.assertEqual(type(status), type(sync_fp.ReadStatus()))
+        self.assertEqual((signal, nothing), ("80", None))
+
+    def test_receipt_uses_one_connection(self):
+        counters = self.run_async(self.new_async_fp(), lambda fp: print_sample_receipt(fp, 10))
+        self.assertEqual(counters.LastReceiptNum, 12)
+        self.assertEqual(self.server.commands[1:4], ["OpenReceipt", "PrintText", "SellPLUwithSpecifiedVAT"])
+        self.assertEqual((self.server.requests, self.server.connections), (25, 1))
+
+    def test_device_error(self):
+        self.server.errors = {"Payment": (0x30, 0x32)}
+        with self.assertRaises(ServerException) as err:
+            self.run_async(self.new_async_fp(), lambda fp: fp.Payment(0, 10.5))
+        self.assertEqual((err.exception.code, err.exception.ste1, err.exception.ste2), (40, 0x30, 0x32))
+
+    def test_timeout(self):
+        self.server.latency = 0.3
+        self.addCleanup(setattr, self.server, "latency", 0.0)
+        with self.assertRaises(ServerException) as err:
+            self.run_async(self.new_async_fp(read_timeout=0.05), lambda fp: fp.ReadSerialNum())
+        self.assertEqual(err.exception.code, SErrorType.ServerConnectionError)
+
+    def test_no_resend_after_sending(self):
+        # the server executes the command and closes the connection without answering: it is not sent again
+        self.addCleanup(setattr, self.server, "drop_answers", 0)
+
+        async def run(fp):
+            await fp.ReadSerialNum()
+            self.server.drop_answers = 1
+            with self.assertRaises(ServerException) as err:
+                await fp.PrintText("printed once")
+            self.assertEqual(err.exception.code, SErrorType.ServerConnectionError)
+            return await fp.ReadSerialNum()
+        self.assertEqual(self.run_async(self.new_async_fp(), run), "ZK000001")
+        self.assertEqual(self.server.commands.count("PrintText"), 1)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_connection_error(self):
+        with self.assertRaises(ServerException) as err:
+            self.run_async(AsyncFP("127.0.0.1", 1, connect_timeout=0.5), lambda fp: fp.PrintText("nothing"))
+        self.assertEqual(err.exception.code, SErrorType.ServerConnectionError)
+
+    def test_concurrency_per_device(self):
+        # concurrent commands of one device wait for each other, on one connection
+        self.server.latency = 0.01
+        self.addCleanup(setattr, self.server, "latency", 0.0)
+
+        async def run(fp):
+            return await asyncio.gather(*(fp.ReadSerialNum() for _i in range(5)))
+        self.assertEqual(self.run_async(self.new_async_fp(), run), ["ZK000001"] * 5)
+        self.assertEqual((self.server.max_in_flight, self.server.connections), (1, 1))
@@ -0,0 +1,197 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import base64
+import logging
+import time
+import xml.etree.ElementTree as XML
+from datetime import datetime
+from enum import Enum
+
+from odoo.tests import common, tagged
+
+from ..models import FP_codec
+from ..models.FP import FP, Enums
+
+_logger = logging.getLogger(__name__)
+
+
+def legacy_encode(command_name, arguments):
+    """FP_core.do() encoder before FP_codec, the reference of the encoded bytes."""
+    count = len(arguments)
+    if count > 0 and count % 2 == 1:
+        raise Exception("Invalid number of arguments!")
+    root = XML.fromstringlist("<Command></Command>")
+    root.set("Name", command_name)
+    if count > 0:
+        args = XML.SubElement(root, "Args")
+        for aaa in range(0, count, 2):
+            if arguments[aaa] is None or arguments[aaa+1] is None:
+                continue
+            arg = XML.SubElement(args, "Arg")
+            arg.set("Name", arguments[aaa])
+            val = arguments[aaa + 1]
+            if isinstance(val, str):
+                arg.set("Value", val)
+            elif isinstance(val, Enum):
+                arg.set("Value", val.value)
+            elif isinstance(val, datetime):
+                arg.set("Value", val.strftime(FP_codec.FP_DATETIME_FORMAT))
+            elif isinstance(val, bytearray):
+                arg.set("Value", base64.b64encode(val).decode("utf-8"))
+            else:
+                arg.set("Value", str(val))
+    return XML.tostring(root)
+
+
+def legacy_decode(res_root):
+    """FP_core.__analyzeResponse before FP_codec, the reference of the decoded results."""
+    props = res_root.findall("Res")
+    result_obj = []
+    ppp = 0
+    for ppp in range(0, len(props)):
+        prop = props[ppp]
+        typ = prop.get("Type")
+        name = prop.get("Name")
+        value = prop.get("Value")
+        if name == "Reserve" or typ == "Reserve" or typ == "OptionHardcoded":
+            continue
+        if typ == "Text":
+            result_obj.append(value)
+        elif typ == "Number":
+            result_obj.append(int(value))
+        elif typ == "Decimal":
+            result_obj.append(float(value))
+        elif typ == "Option":
+            result_obj.append(value)
+        elif typ == "DateTime":
+            result_obj.append(datetime.strptime(value, FP_codec.FP_DATETIME_FORMAT))
+        elif typ == "Base64":
+            result_obj.append(base64.b64decode(value))
+        elif typ == "Decimal_with_format":
+            result_obj.append(float(value))
+        elif typ == "Decimal_plus_80h":
+            result_obj.append(float(value))
+        elif typ == "Status":
+            if value == "1":
+                result_obj.append(True)
+            else:
+                result_obj.append(False)
+        elif typ == "Null":
+            result_obj.append(None)
+        elif ppp == 0 and value == "@":
+            result_obj.append(None)
+        else:  # unknown typ => string
+            result_obj.append(value)
+        ppp += 1
+    if ppp == 0:
+        return None
+    elif ppp == 1:
+        return result_obj[0]
+    else:
+        return result_obj
+
+
+class RecordingFP(FP):
+    """Records the arguments FP gives to do() instead of sending them."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def do(self, command_name, *arguments):
+        self.calls.append((command_name, arguments))
+
+
+TEXTS = ["Product 1", "", "Cafe & Ceai <mare> \"dublu\" 'x'", "François 北亰 €", "100%s %d %%",
+         "line\nbreak", "tab\there", "cr\rhere", "   spaces   "]
+
+
+def sample_calls():
+    fp = RecordingFP()
+    for text in TEXTS:
+        fp.PrintText(text)
+        fp.SellPLUwithSpecifiedVAT(text, "A", 10.5, 2)
+        fp.SellPLUwithSpecifiedVAT(text, Enums.OptionVATClass.VAT_Class_B, -3, None, -10, None, None, 1.5)
+        fp.StornoPLU(text, "C", 0.01, 1.234, DiscAddV=2, NamePLUextension="x&y")
+    for amount in (0, 1, 10.5, 1e-7, 123456789.123):
+        fp.Payment(Enums.OptionPaymentType.Payment_0, amount)
+        fp.Payment("1", amount)
+    fp.OpenReceipt(1, "0", 0)
+    fp.OpenNonFiscalReceipt(1, "0000", 0)
+    fp.CloseReceipt()
+    fp.CloseNonFiscalReceipt()
+    fp.calls.append(("ReadLastAndTotalReceiptNum", ()))
+    fp.PaperFeed()
+    fp.CutPaper()
+    fp.PrintDailyReport(OptionZeroing="Z")
+    fp.calls.append(("PrintText", ("Text", None)))
+    fp.calls.append(("SetDateTime", ("DateTime", datetime(2023, 5, 7, 9, 3, 1))))
+    fp.calls.append(("RawWrite", ("Bytes", bytearray(b"\x1dI"))))
+    return fp.calls
+
+
+def sample_answers():
+    def res(*props):
+        root = XML.Element("Res", Code="0")
+        for name, typ, value in props:
+            XML.SubElement(root, "Res", Name=name, Type=typ, Value=value)
+        return root
+    return [
+        res(),
+        res(("LastReceiptNum", "Number", "12"), ("TotalReceiptCounter", "Number", "1234")),
+        res(("SerialNumber", "Text", "ZK000001")),
+        res(("Amount", "Decimal", "10.50"), ("Reserve", "Reserve", "0")),
+        res(("Reserve", "Text", "x")),
+        res(("DateTime", "DateTime", "07-05-2023 09:03:01"), ("Paper", "Status", "1"), ("Lid", "Status", "0")),
+        res(("Data", "Base64", base64.b64encode(b"ej data").decode()), ("N", "Null", ""),
+            ("Opt", "Option", "A"), ("H", "OptionHardcoded", "1"), ("D", "Decimal_with_format", "1.5"),
+            ("P", "Decimal_plus_80h", "2.5"), ("U", "Unknown", "u")),
+        res(("First", "Unknown", "@"), ("Second", "Unknown", "@")),
+    ]
+
+
+class TestFPCodec(common.BaseCase):
+
+    def test_encode_same_bytes(self):
+        for command_name, arguments in sample_calls():
+            self.assertEqual(FP_codec.encode_command(command_name, arguments),
+                             legacy_encode(command_name, arguments), command_name)
+
+    def test_encode_invalid_arguments(self):
+        with self.assertRaises(Exception):
+            FP_codec.encode_command("PrintText", ("Text",))
+
+    def test_decode_same_result(self):
+        for answer in sample_answers():
+            self.assertEqual(FP_codec.decode_result(answer), legacy_decode(answer))
+
+
+@tagged("-standard", "cbs_fiscal_bench")
+class BenchFPCodec(common.BaseCase):
+    """odoo-bin --test-tags cbs_fiscal_bench; results are logged."""
+
+    def _cpu_us(self, function, items, rounds=2000):
+        start = time.process_time()
+        for _i in range(rounds):
+            for item in items:
+                function(*item)
+        return (time.process_time() - start) / rounds / len(items) * 1e6
+
+    def test_bench_encode(self):
+        fp = RecordingFP()
+        fp.PrintText("Product with a long name nr 1")
+        fp.SellPLUwithSpecifiedVAT("Product 1", "A", 10.5, 1)
+        fp.StornoPLU("Product 1", "A", 10.5, 1)
+        fp.Payment(0, 10.5)
+        for command_name, arguments in fp.calls:
+            before = self._cpu_us(legacy_encode, [(command_name, arguments)])
+            after = self._cpu_us(FP_codec.encode_command, [(command_name, arguments)])
+            _logger.info("encode %s: %.2f us before, %.2f us after", command_name, before, after)
+            self.assertLess(after, before)
+
+    def test_bench_decode(self):
+        answers = [(XML.fromstring(b'<Res Code="0"></Res>'),), (sample_answers()[1],), (sample_answers()[6],)]
+        before = self._cpu_us(legacy_decode, answers)
+        after = self._cpu_us(FP_codec.decode_result, answers)
+        _logger.info("decode answer: %.2f us before, %.2f us after", before, after)
@@ -0,0 +1,59 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from ..models import FP_metrics
+from ..models.FP_core import ServerException
+from .test_fp_transport import FPServerCase
+
+
+class TestFPMetrics(FPServerCase):
+
+    def test_not_recording(self):
+        self.new_fp().ReadLastAndTotalReceiptNum()
+        with FP_metrics.recording() as samples:
+            pass
+        self.assertEqual(samples, [])
+
+    def test_commands(self):
+        fp = self.new_fp()
+        with FP_metrics.recording() as samples:
+            fp.ReadLastAndTotalReceiptNum()
+            fp.ReadSerialNum()
+            with FP_metrics.recording() as nested:
+                self.assertIsNone(nested)
+                with fp.batch():
+                    fp.OpenNonFiscalReceipt(1, "0", 0)
+                    fp.PrintText("a")
+                    fp.CloseNonFiscalReceipt()
+        self.assertEqual([(s.command, s.commands, s.error) for s in samples],
+                         [("ReadLastAndTotalReceiptNum", 1, ""), ("ReadSerialNum", 1, ""), ("batch", 3, "")])
+        # the first request opened the connection, the next ones reused it
+        self.assertGreater(samples[0].connect_ms, 0)
+        self.assertEqual(samples[1].connect_ms, 0)
+        self.assertTrue(all(s.bytes_out > 0 and s.bytes_in > 0 and s.ms > 0 for s in samples))
+
+    def test_error(self):
+        self.server.errors["PrintText"] = (0x30, 0x32)
+        with FP_metrics.recording() as samples:
+            with self.assertRaises(ServerException):
+                self.new_fp().PrintText("a")
+        self.assertEqual(samples[0].error, "40:30:32")
+        stats = FP_metrics.aggregate(samples)["PrintText"]
+        self.assertEqual((stats.count, stats.error_count, stats.last_error), (1, 1, "40:30:32"))
+
+    def test_histogram(self):
+        samples = [FP_metrics.Sample("PrintText", ms, 0, 10, 20, "") for ms in (5, 10, 11, 600, 20000)]
+        stats = FP_metrics.aggregate(samples)["PrintText"]
+        self.assertEqual(stats.buckets, [2, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1])
+        self.assertEqual((stats.count, stats.max_ms, stats.bytes_out), (5, 20000, 50))
+        text = FP_metrics.prometheus_text([({"config": 'Shop "1"', "command": "PrintText"}, stats)])
+        self.assertIn('cbs_fiscal_command_ms_bucket{config="Shop \\"1\\"",command="PrintText",le="25"} 3', text)
+        self.assertIn('cbs_fiscal_command_ms_bucket{config="Shop \\"1\\"",command="PrintText",le="+Inf"} 5', text)
+        self.assertIn('cbs_fiscal_command_ms_count{config="Shop \\"1\\"",command="PrintText"} 5', text)
+
+    def test_breakdown(self):
+        samples = [FP_metrics.Sample("ReadStatus", 12.4, 2.2, 50, 900, ""),
+                   FP_metrics.Sample("batch", 3400, 0, 800, 300, "40:30:32", 12)]
+        self.assertEqual(FP_metrics.breakdown(samples),
+                         "ReadStatus: 12 ms (connect 2 ms), 50/900 bytes\n"
+                         "batch(12): 3400 ms, 800/300 bytes, error 40:30:32")
@@ -0,0 +1,69 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import threading
+
+from odoo.tests import common
+
+from ..models import FP as FP_module, FP_more
+from ..models.FP import FP
+from .test_fp_transport import FPServerCase
+
+
+class TestFPModule(common.BaseCase):
+
+    def test_commands_of_fp_more(self):
+        fp = FP()
+        self.assertTrue(callable(fp.ReadGPRS_Signal))
+        self.assertTrue(FP._more_installed)
+        for name in vars(FP_more.FPMore):
+            if not name.startswith("__"):
+                self.assertIs(getattr(FP, name), getattr(FP_more.FPMore, name))
+
+    def test_install_from_threads(self):
+        # threads using a command of FP_more at the same time each find all of them
+        fp_class = type("FPFresh", (), {"_more_installed": False})
+        missing = []
+
+        def use():
+            FP_more.install(fp_class)
+            missing.extend(name for name in vars(FP_more.FPMore)
+                           if not name.startswith("__") and not hasattr(fp_class, name))
+        threads = [threading.Thread(target=use) for _i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(missing, [])
+        self.assertTrue(fp_class._more_installed)
+
+    def test_missing_attribute(self):
+        fp = FP()
+        with self.assertRaises(AttributeError):
+            fp.NoSuchCommand
+        with self.assertRaises(AttributeError):
+            fp._not_set
+        self.assertFalse(hasattr(fp, "NoSuchCommand"))
+
+    def test_enums(self):
+        from ..models.FP import Enums
+        from ..models.FP_enums import Enums as FP_enums_Enums
+        self.assertIs(Enums, FP_enums_Enums)
+        self.assertEqual(Enums.OptionZeroing.Zeroing.value, "Z")
+        with self.assertRaises(AttributeError):
+            FP_module.NoSuchName
+
+    def test_result_slots(self):
+        res = FP_module.__LastAndTotalReceiptNumRes__(12, 1234)
+        self.assertFalse(hasattr(res, "__dict__"))
+        res = FP_more.__DailyAvailableAmountsRes__(*range(10))
+        self.assertFalse(hasattr(res, "__dict__"))
+        self.assertEqual(res.AmountPayment9, 9)
+
+
+class TestFPMoreCommands(FPServerCase):
+
+    def test_command_of_fp_more(self):
+        self.server.responses["ReadGPRS_Signal"] = [("Signal", "Text", "80")]
+        self.assertEqual(self.new_fp().ReadGPRS_Signal(), "80")
+        self.assertEqual(self.server.commands, ["ReadGPRS_Signal"])
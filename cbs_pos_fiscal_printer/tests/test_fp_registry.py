@@ -0,0 +1,134 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import threading
+import time
+
+from odoo.tests import common
+
+from ..models import FP_registry, FP_transport
+from ..models.FP import FP
+from ..models.FP_core import FP_core
+from .test_fp_transport import print_sample_receipt
+from .zfplab_mock import ZfpLabMockServer
+
+NR_PRINTERS = 4
+NR_THREADS_PER_PRINTER = 3
+NR_RECEIPTS_PER_THREAD = 5
+NR_LINES = 3
+COMMANDS_PER_RECEIPT = 2 * NR_LINES + 7  # see print_sample_receipt
+
+
+class TestFPClientState(common.BaseCase):
+
+    def test_server_settings_do_not_accumulate(self):
+        fp = FP()
+        fp.serverSetSettings("http://10.0.0.1", 4444)
+        fp.serverSetSettings("http://10.0.0.2", 4445)
+        self.assertEqual(fp._FP_core__lab_url, "http://10.0.0.2:4445/")
+        fp.serverSetSettings("10.0.0.3", 0)
+        self.assertEqual(fp._FP_core__lab_url, "http://10.0.0.3/")
+
+    def test_instances_do_not_share_state(self):
+        fp1, fp2 = FP(), FP()
+        fp1.serverSetSettings("10.0.0.1", 4444)
+        fp1.serverSetTimeouts(1, 5)
+        self.assertEqual(fp2.serverGetSettings().ipaddress, "localhost")
+        self.assertEqual(fp2._FP_core__read_timeout, FP_transport.DEFAULT_READ_TIMEOUT)
+        self.assertNotIn("_FP_core__lab_url", vars(FP_core))
+
+    def test_registry_key(self):
+        FP_registry.clear()
+        self.addCleanup(FP_registry.clear)
+        device = ("tcp", "192.168.1.68", 8000, "aA12345")
+        client = FP_registry.get_client(("127.0.0.1", 4444), device)
+        self.assertIs(FP_registry.get_client(("127.0.0.1", 4444), device), client)
+        self.assertIsNot(FP_registry.get_client(("127.0.0.1", 4444), ("serial", "COM3", 115200)), client)
+        self.assertIsNot(FP_registry.get_client(("127.0.0.2", 4444), device), client)
+        # the devices of one server are used one after the other
+        self.assertIs(FP_registry.get_client(("127.0.0.1", 4444), ("serial", "COM3", 115200)).lock, client.lock)
+        self.assertIsNot(FP_registry.get_client(("127.0.0.2", 4444), device).lock, client.lock)
+        client.set_verified()
+        self.assertTrue(client.is_verified(300))
+        self.assertFalse(client.is_verified(0))
+        FP_registry.invalidate(("127.0.0.1", 4444), device)
+        self.assertFalse(client.is_verified(300))
+
+    def test_device_busy(self):
+        client = FP_registry.FPClient(("127.0.0.1", 4444), ("serial", "COM3", 115200))
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with client.use():
+                acquired.set()
+                release.wait(5)
+        thread = threading.Thread(target=hold)
+        thread.start()
+        acquired.wait(5)
+        try:
+            with self.assertRaises(FP_registry.DeviceBusyError):
+                with client.use(timeout=0.05):
+                    pass
+        finally:
+            release.set()
+            thread.join()
+        with client.use(timeout=0.05) as fp:
+            self.assertIs(fp, client.fp)
+
+
+class TestFPRegistryStress(common.BaseCase):
+    """Several threads print at each of several simulated printers (one ZfpLab server each)."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.servers = [ZfpLabMockServer().start() for _i in range(NR_PRINTERS)]
+        for server in cls.servers:
+            server.latency = 0.002
+            cls.addClassCleanup(server.stop)
+        cls.addClassCleanup(FP_transport.clear_pools)
+
+    def setUp(self):
+        super().setUp()
+        FP_registry.clear()
+        self.addCleanup(FP_registry.clear)
+        for server in self.servers:
+            server.reset_stats()
+
+    def _print(self, client, errors):
+        try:
+            for _i in range(NR_RECEIPTS_PER_THREAD):
+                with client.use() as fp:
+                    print_sample_receipt(fp, NR_LINES)
+        except Exception as ex:
+            errors.append(ex)
+
+    def test_concurrent_printers(self):
+        errors = []
+        threads = []
+        for server in self.servers:
+            device = ("tcp", "127.0.0.1", 8000, None)
+            for _i in range(NR_THREADS_PER_PRINTER):
+                client = FP_registry.get_client(("127.0.0.1", server.port), device)
+                threads.append(threading.Thread(target=self._print, args=(client, errors)))
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duration = time.perf_counter() - start
+        self.assertEqual(errors, [])
+        nr_receipts = NR_THREADS_PER_PRINTER * NR_RECEIPTS_PER_THREAD
+        one_printer = nr_receipts * COMMANDS_PER_RECEIPT * self.servers[0].latency
+        for server in self.servers:
+            # the commands of a printer are serialized, the receipts are not interleaved
+            self.assertEqual(server.max_in_flight, 1)
+            self.assertEqual(server.commands.count("OpenReceipt"), nr_receipts)
+            self.assertEqual(len(server.commands), nr_receipts * COMMANDS_PER_RECEIPT)
+            expected = ["ReadLastAndTotalReceiptNum", "OpenReceipt"]
+            for i in range(0, len(server.commands), COMMANDS_PER_RECEIPT):
+                self.assertEqual(server.commands[i:i + 2], expected)
+                self.assertEqual(server.commands[i + COMMANDS_PER_RECEIPT - 2], "CloseReceipt")
+        # the printers print in parallel
+        self.assertLess(duration, one_printer * NR_PRINTERS)
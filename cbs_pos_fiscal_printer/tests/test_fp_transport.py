@@ -0,0 +1,364 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+import logging
+import time
+from unittest.mock import patch
+from urllib.request import Request, urlopen
+
+from odoo.tests import common, tagged
+
+from ..models import FP_metrics, FP_registry, FP_transport
+from ..models.FP import FP
+from ..models.FP_core import FP_core, ServerException, SErrorType, __FPTextBlock__
+from .zfplab_mock import DEFAULT_DEVICE_SETTINGS, ZfpLabMockServer
+
+_logger = logging.getLogger(__name__)
+
+
+def print_sample_receipt_body(fp, nr_lines, print_type=0):
+    """The commands from opening to closing of a fiscal receipt of nr_lines."""
+    fp.OpenReceipt(1, "0", print_type)
+    for i in range(nr_lines):
+        fp.PrintText(f"Product with a long name nr {i}")
+        fp.SellPLUwithSpecifiedVAT(f"Product {i}", "A", 10.5, 1)
+    fp.Payment(0, 10.5 * nr_lines)
+    fp.PrintText("Thank you")
+    fp.PrintText("Order 00001-001-0001")
+    fp.CloseReceipt()
+
+
+def print_sample_receipt(fp, nr_lines):
+    """The commands that cbs_print_at_fiscal_server sends for a fiscal receipt of nr_lines."""
+    fp.ReadLastAndTotalReceiptNum()
+    print_sample_receipt_body(fp, nr_lines)
+    fp.ReadLastAndTotalReceiptNum()
+
+
+def urllib_send(url, body=None, headers=None, connect_timeout=None, read_timeout=None):
+    """The transport used before the connection pool: one TCP connection per command."""
+    req = urlopen(Request(url, data=body, headers=headers or {}), timeout=read_timeout)
+    data = req.read()
+    req.close()
+    return req.code, data
+
+
+class FPServerCase(common.BaseCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ZfpLabMockServer().start()
+        cls.addClassCleanup(cls.server.stop)
+        cls.addClassCleanup(FP_transport.clear_pools)
+
+    def setUp(self):
+        super().setUp()
+        FP_transport.clear_pools()
+        FP_core._batch_support.clear()
+        self.server.reset_stats()
+        self.server.errors = {}
+        self.server.accept_batches = True
+        self.server.batch_error_code = SErrorType.ServDefMissing
+
+    def new_fp(self):
+        fp = FP()
+        fp.serverSetSettings("127.0.0.1", self.server.port)
+        return fp
+
+
+class TestFPTransport(FPServerCase):
+
+    def test_receipt_uses_one_connection(self):
+        fp = self.new_fp()
+        fp.serverSetDeviceTcpSettings("127.0.0.1", 8000, "aA12345")
+        self.assertTrue(fp.isCompatible())
+        print_sample_receipt(fp, 10)
+        self.assertEqual(self.server.requests, 1 + 27)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_reconnect_after_server_dropped_connection(self):
+        fp = self.new_fp()
+        self.assertEqual(fp.ReadLastAndTotalReceiptNum().LastReceiptNum, 12)
+        # the server closes the idle keep-alive sockets (restart, idle timeout)
+        pool = FP_transport.get_pool("127.0.0.1", self.server.port)
+        for conn in pool._idle:
+            conn.sock.shutdown(2)
+        self.assertEqual(fp.ReadLastAndTotalReceiptNum().TotalReceiptCounter, 1234)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_no_resend_after_sending(self):
+        # the server executes the command and closes the connection without answering: it is not sent again
+        fp = self.new_fp()
+        fp.ReadSerialNum()
+        self.server.drop_answers = 1
+        self.addCleanup(setattr, self.server, "drop_answers", 0)
+        with self.assertRaises(ServerException) as err:
+            fp.PrintText("printed once")
+        self.assertEqual(err.exception.code, SErrorType.ServerConnectionError)
+        self.assertEqual(self.server.commands.count("PrintText"), 1)
+        # a GET only reads: it is sent again
+        fp.ReadSerialNum()
+        self.server.drop_answers = 1
+        self.assertTrue(fp.serverGetDeviceSettings().is_working_on_tcp)
+        self.assertEqual(self.server.connections, 3)
+
+    def test_connection_error(self):
+        fp = FP()
+        fp.serverSetSettings("127.0.0.1", 1)
+        fp.serverSetTimeouts(0.5, 0.5)
+        with self.assertRaises(ServerException) as err:
+            fp.PrintText("nothing")
+        self.assertEqual(err.exception.code, SErrorType.ServerConnectionError)
+
+
+class TestFPServerEndpoints(FPServerCase):
+
+    def tearDown(self):
+        self.server.device_settings = dict(DEFAULT_DEVICE_SETTINGS)
+        self.server.found_device = None
+        self.server.removed_clients = []
+        super().tearDown()
+
+    def test_device_settings(self):
+        fp = self.new_fp()
+        fp.serverSetDeviceTcpSettings("10.0.0.5", 8001, "1234")
+        settings = fp.serverGetDeviceSettings()
+        self.assertEqual((settings.is_working_on_tcp, settings.ipaddress, settings.tcp_port, settings.password),
+                         (True, "10.0.0.5", 8001, "1234"))
+        fp.serverSetDeviceSerialSettings("COM3", 9600)
+        settings = fp.serverGetDeviceSettings()
+        self.assertEqual((settings.is_working_on_tcp, settings.serial_port, settings.baud_rate), (False, "COM3", 9600))
+
+    def test_connect_device(self):
+        # the settings are sent only to a server connected to another device
+        fp = self.new_fp()
+        device = ("tcp", "10.0.0.5", 8001, "1234")
+        with FP_metrics.recording() as samples:
+            self.assertTrue(FP_registry.connect_device(fp, device))
+            self.assertFalse(FP_registry.connect_device(fp, device))
+        self.assertEqual([sample.command for sample in samples],
+                         ["serverGetDeviceSettings", "serverSetDeviceSettings", "serverGetDeviceSettings"])
+        self.assertFalse(FP_registry.connect_device(fp, ("tcp", "10.0.0.5", 8001, "1234")))
+        self.assertTrue(FP_registry.connect_device(fp, ("tcp", "10.0.0.5", 8001, None)))
+        self.assertFalse(FP_registry.connect_device(fp, ("tcp", "10.0.0.5", 8001, None)))
+        self.assertTrue(FP_registry.connect_device(fp, ("serial", "COM3", 9600)))
+        self.assertFalse(FP_registry.connect_device(fp, ("serial", "COM3", 9600)))
+        self.assertEqual(self.server.device_connects, 3)
+
+    def test_find_device(self):
+        fp = self.new_fp()
+        self.assertIsNone(fp.serverFindDevice())
+        self.server.found_device = ("COM4", 115200)
+        found = fp.serverFindDevice()
+        self.assertEqual((found.serial_port, found.baud_rate), ("COM4", 115200))
+
+    def test_client_remove(self):
+        fp = self.new_fp()
+        fp.serverCloseDeviceConnection()
+        fp.serverRemoveAllClients()
+        fp.serverRemoveClient("10.0.0.9")
+        self.assertEqual(self.server.removed_clients, [{"who": "me"}, {"who": "all"}, {"ip": "10.0.0.9"}])
+
+
+class TestFPBatch(FPServerCase):
+
+    def _print_batched(self, fp, nr_lines):
+        with fp.batch() as batch:
+            fp.OpenReceipt(1, "0", 0)
+            for i in range(nr_lines):
+                fp.SellPLUwithSpecifiedVAT(f"Product {i}", "A", 10.5, 1)
+            fp.Payment(0, 10.5 * nr_lines)
+            fp.PrintText("Thank you")
+            fp.CloseReceipt()
+            self.assertEqual(self.server.requests, 0)
+        return batch
+
+    def test_receipt_in_one_request(self):
+        batch = self._print_batched(self.new_fp(), 30)
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(len(self.server.commands), 34)
+        self.assertEqual(batch.results, [None] * 34)
+
+    def test_fallback_to_sequential(self):
+        self.server.accept_batches = False
+        fp = self.new_fp()
+        self._print_batched(fp, 3)
+        self.assertEqual(self.server.requests, 1 + 7)
+        self.server.reset_stats()
+        self._print_batched(fp, 3)  # remembered, no more batch attempt
+        self.assertEqual(self.server.requests, 7)
+
+    def test_fallback_on_client_format_error(self):
+        # an older server rejecting the unknown <Commands> root as a bad request
+        self.server.accept_batches = False
+        self.server.batch_error_code = SErrorType.ClientInvalidPostFormat
+        self._print_batched(self.new_fp(), 3)
+        self.assertEqual(self.server.requests, 1 + 7)
+        self.assertEqual(self.server.commands.count("CloseReceipt"), 1)
+
+    def test_server_busy(self):
+        # the server busy with another client executes nothing: the batch fails, the batches go on
+        fp = self.new_fp()
+        self.server.busy = True
+        try:
+            with self.assertRaises(ServerException) as err:
+                self._print_batched(fp, 3)
+        finally:
+            self.server.busy = False
+        self.assertEqual(err.exception.code, SErrorType.ServWaitOtherClientCmdProcessingTimeOut)
+        self.assertEqual((self.server.requests, self.server.commands), (1, []))
+        self.server.reset_stats()
+        self._print_batched(fp, 3)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_error_of_command(self):
+        self.server.errors = {"SellPLUwithSpecifiedVAT": (0x30, 0x32)}
+        for accept_batches in (True, False):
+            self.server.accept_batches = accept_batches
+            FP_core._batch_support.clear()
+            self.server.reset_stats()
+            with self.assertRaises(ServerException) as err:
+                self._print_batched(self.new_fp(), 3)
+            sx = err.exception
+            self.assertTrue(sx.isFiscalPrinterError)
+            self.assertEqual((sx.ste1, sx.ste2), (0x30, 0x32))
+            self.assertEqual((sx.command_name, sx.batch_index), ("SellPLUwithSpecifiedVAT", 1))
+            self.assertNotIn("CloseReceipt", self.server.commands)
+
+    def test_nothing_sent_on_exception(self):
+        fp = self.new_fp()
+        with self.assertRaises(ZeroDivisionError):
+            with fp.batch():
+                fp.OpenReceipt(1, "0", 0)
+                1 / 0
+        self.assertEqual(self.server.requests, 0)
+        fp.PrintText("not queued anymore")
+        self.assertEqual(self.server.requests, 1)
+
+
+class TestFPTextBlock(FPServerCase):
+
+    def test_pack(self):
+        block = __FPTextBlock__(10, 30)
+        self.assertEqual(block.pack(["a", "bb", "ccc", "d"]), ["a         bb        ccc", "d"])
+        # a line longer than the width takes two printed lines
+        self.assertEqual(block.pack(["a" * 12, "b", "c"]), ["a" * 12 + " " * 8 + "b", "c"])
+        self.assertEqual(block.pack(["a" * 35, "b"]), ["a" * 35, "b"])
+        self.assertEqual(block.pack(["a", ""]), ["a         " + " "])
+
+    def test_text_between_other_commands(self):
+        fp = self.new_fp()
+        with fp.batch() as batch, fp.text_block(32, 96):
+            fp.OpenNonFiscalReceipt(1, "0", 0)
+            for i in range(5):
+                fp.PrintText(f"Product {i}")
+                fp.PrintText("1.0X10.00X tax=10.00")
+            fp.CashDrawerOpen()
+            fp.PrintText("TOTAL: 50.00")
+            fp.CloseNonFiscalReceipt()
+        self.assertEqual([name for name, _command in batch.commands],
+                         ["OpenNonFiscalReceipt"] + ["PrintText"] * 4 + ["CashDrawerOpen", "PrintText",
+                                                                        "CloseNonFiscalReceipt"])
+        self.assertEqual(self.server.requests, 1)
+
+    def test_no_packing(self):
+        fp = self.new_fp()
+        with fp.batch() as batch, fp.text_block(32, 0):
+            fp.PrintText("a")
+            fp.PrintText("b")
+        self.assertEqual(len(batch.commands), 2)
+
+    def test_nothing_sent_on_exception(self):
+        fp = self.new_fp()
+        with self.assertRaises(ZeroDivisionError):
+            with fp.text_block(32, 96):
+                fp.PrintText("a")
+                1 / 0
+        self.assertEqual(self.server.requests, 0)
+        fp.PrintText("not queued anymore")
+        self.assertEqual(self.server.requests, 1)
+
+
+class TestFPReceiptPrintType(FPServerCase):
+
+    def _print_failing(self, print_type):
+        """Like cbs_print_at_fiscal_server: a failed line cancels a not step by step receipt."""
+        self.server.errors = {"SellPLUwithSpecifiedVAT": (0x30, 0x32)}
+        self.server.reset_stats()
+        fp = self.new_fp()
+        fp.OpenReceipt(1, "0", print_type)
+        fp.PrintText("Product with a long name")
+        with self.assertRaises(ServerException):
+            fp.SellPLUwithSpecifiedVAT("Product", "A", 10.5, 1)
+        fp.CancelReceipt()
+
+    def test_buffered_error_prints_nothing(self):
+        self._print_failing("4")
+        self.assertEqual(self.server.paper_lines, 0)
+        self._print_failing("0")
+        self.assertEqual(self.server.paper_lines, 1)
+
+    def test_buffered_receipt_printed_at_close(self):
+        fp = self.new_fp()
+        with fp.batch():
+            print_sample_receipt_body(fp, 3, "4")
+        self.assertEqual(self.server.paper_lines, 2 * 3 + 3)
+
+
+@tagged("-standard", "cbs_fiscal_bench")
+class BenchFPTransport(FPServerCase):
+    """odoo-bin --test-tags cbs_fiscal_bench; results are logged."""
+
+    def _bench(self, nr_receipts=50, nr_lines=10):
+        fp = self.new_fp()
+        durations = []
+        self.server.reset_stats()
+        for _i in range(nr_receipts):
+            start = time.perf_counter()
+            print_sample_receipt(fp, nr_lines)
+            durations.append(time.perf_counter() - start)
+        durations.sort()
+        return {
+            "round_trips_per_receipt": self.server.requests / nr_receipts,
+            "connections_per_receipt": self.server.connections / nr_receipts,
+            "p50_ms": durations[len(durations) // 2] * 1000,
+            "p99_ms": durations[int(len(durations) * 0.99) - 1] * 1000,
+        }
+
+    def test_bench_pool_vs_urllib(self):
+        with patch.object(FP_transport, "send", urllib_send):
+            before = self._bench()
+        after = self._bench()
+        _logger.info("fiscal receipt transport, 10 lines: urllib %s; pooled %s", before, after)
+        self.assertLess(after["connections_per_receipt"], before["connections_per_receipt"])
+
+    def test_bench_batch(self):
+        fp = self.new_fp()
+        durations = []
+        for _i in range(50):
+            start = time.perf_counter()
+            with fp.batch():
+                print_sample_receipt_body(fp, 30)
+            durations.append(time.perf_counter() - start)
+        durations.sort()
+        _logger.info("fiscal receipt in one batch, 30 lines: round trips per receipt %s, p50 %.2f ms, p99 %.2f ms",
+                     self.server.requests / 50, durations[25] * 1000, durations[48] * 1000)
+
+    def test_bench_print_type(self):
+        """device held by a 10 lines receipt on a device printing a line in 20 ms"""
+        self.server.line_print_time = 0.02
+        self.addCleanup(setattr, self.server, "line_print_time", 0.0)
+        fp = self.new_fp()
+        timings = {}
+        for print_type in ("0", "4"):
+            durations = []
+            for _i in range(10):
+                start = time.perf_counter()
+                with fp.batch():
+                    print_sample_receipt_body(fp, 10, print_type)
+                durations.append(time.perf_counter() - start)
+            timings[print_type] = sorted(durations)[5] * 1000
+        _logger.info("fiscal receipt of 10 lines, p50: step by step %.1f ms, buffered %.1f ms",
+                     timings["0"], timings["4"])
+        self.assertLess(timings["4"], timings["0"])
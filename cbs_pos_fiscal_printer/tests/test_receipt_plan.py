@@ -0,0 +1,135 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo.tests import tagged
+
+from odoo.addons.point_of_sale.tests.common import TestPoSCommon
+
+from ..models import FP_registry, FP_transport
+from .test_fp_codec import RecordingFP
+from .zfplab_mock import ZfpLabMockServer
+
+
+@tagged("post_install", "-at_install")
+class TestReceiptPlan(TestPoSCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.config = cls.basic_config
+        cls.tax = cls.env["account.tax"].create({"name": "CBS 19", "amount": 19, "price_include": True})
+        cls.config.write({
+            "cbs_fiscal_printer_server_ip": "127.0.0.1:4444",
+            "cbs_print_non_fiscal_receipt": False,
+            "receipt_footer": "Thank you",
+            "cbs_tax_vat_class_ids": [(0, 0, {"tax_id": cls.tax.id, "vat_class": "B"})],
+        })
+        cls.products = [cls.create_product(f"CBS product {i}", cls.categ_basic, 10 + i, tax_ids=cls.tax.ids)
+                        for i in range(20)]
+
+    def _order(self, nr_lines):
+        data = self.create_ui_order_data([(product, 1) for product in self.products[:nr_lines]],
+                                         payments=[(self.cash_pm1, 5), (self.bank_pm1, sum(range(10, 10 + nr_lines)) - 5)])
+        order_id = self.env["pos.order"].create_from_ui([data])[0]["id"]
+        return self.env["pos.order"].browse(order_id)
+
+    def _plan_queries(self, order):
+        self.env.invalidate_all()
+        self.env.registry.clear_caches()
+        count = self.cr.sql_log_count
+        plan = order._cbs_receipt_plan(True)
+        return plan, self.cr.sql_log_count - count
+
+    def test_queries_do_not_depend_on_lines(self):
+        self.open_new_session()
+        plan_1, queries_1 = self._plan_queries(self._order(1))
+        plan_20, queries_20 = self._plan_queries(self._order(20))
+        self.assertEqual(len(plan_1.lines), 1)
+        self.assertEqual(len(plan_20.lines), 20)
+        self.assertEqual(queries_20, queries_1)
+
+    def test_replay_without_queries(self):
+        self.open_new_session()
+        order = self._order(3)
+        plan = order._cbs_receipt_plan(True)
+        self.assertEqual({line.vat_class for line in plan.lines}, {"B"})
+        self.assertEqual(plan.cash_amount, 5)
+        self.assertEqual(plan.footer, ("Thank you",))
+        self.env.invalidate_all()
+        fp = RecordingFP()
+        count = self.cr.sql_log_count
+        order._cbs_print_receipt_plan(fp, plan)
+        self.assertEqual(self.cr.sql_log_count, count)
+        commands = [name for name, _arguments in fp.calls]
+        self.assertEqual(commands[0], "OpenReceipt")
+        self.assertEqual(commands.count("SellPLUwithSpecifiedVAT"), 3)
+        self.assertEqual(commands.count("Payment"), 2)
+        self.assertEqual(commands[-1], "CloseReceipt")
+
+    def test_sell_by_plu(self):
+        self.open_new_session()
+        self.config.cbs_sell_by_plu = True
+        product = self.products[0]
+        self.env["cbs.fiscal.plu"].create({"config_id": self.config.id, "product_id": product.id, "plu_number": 7,
+                                           "name": "CBS product 0", "price": 10, "vat_class": "B"})
+        plan = self._order(2)._cbs_receipt_plan(True)
+        self.assertEqual([line.plu for line in plan.lines], [7, 0])
+        fp = RecordingFP()
+        self.env["pos.order"]._cbs_print_receipt_plan(fp, plan)
+        self.assertIn(("SellPLUFromFD_DB", ("OptionSign", "+", "PLUNum", 7, "Quantity", 1.0, "DiscAddP", None,
+                                            "DiscAddV", None, "DiscNamed", None)), fp.calls)
+        self.assertEqual([name for name, _args in fp.calls].count("SellPLUwithSpecifiedVAT"), 1)
+
+    def test_sequence_issues(self):
+        self.open_new_session()
+        orders = [self._order(1) for _i in range(5)]
+        for order, counter in zip(orders, [10, 11, 11, 14, 15]):
+            order.write({"cbs_fiscal_receipt_num": counter, "cbs_fiscal_total_counter": counter,
+                         "cbs_fiscal_device_serial": "ZK000001"})
+        self.env.flush_all()
+        issues = self.env["cbs.fiscal.receipt.sequence.issue"].search([("device", "=", "ZK000001")])
+        self.assertEqual([(issue.issue, issue.total_counter, issue.missing) for issue in issues],
+                         [("duplicate", 11, 0), ("gap", 14, 2)])
+        self.assertEqual(issues[1].previous_order_id, orders[2])
+
+    def test_sequence_issues_before_serial(self):
+        # the receipts printed before the serial of the device was read are in its sequence, not the ones of
+        # the device it replaced
+        self.open_new_session()
+        replaced = self._order(1)
+        replaced.write({"cbs_fiscal_receipt_num": 500, "cbs_fiscal_total_counter": 500})
+        orders = [self._order(1) for _i in range(4)]
+        for order, counter in zip(orders[:3], [10, 11, 12]):
+            order.write({"cbs_fiscal_receipt_num": counter, "cbs_fiscal_total_counter": counter})
+        self.config._cbs_fiscal_device_serial_set("ZK000001", 12)
+        self.assertEqual({order.cbs_fiscal_device_serial for order in orders[:3]}, {"ZK000001"})
+        self.assertFalse(replaced.cbs_fiscal_device_serial)
+        orders[3].write({"cbs_fiscal_receipt_num": 12, "cbs_fiscal_total_counter": 12,
+                         "cbs_fiscal_device_serial": "ZK000001"})
+        self.env.flush_all()
+        issues = self.env["cbs.fiscal.receipt.sequence.issue"].search([("device", "=", "ZK000001")])
+        self.assertEqual([(issue.issue, issue.total_counter) for issue in issues], [("duplicate", 12)])
+
+    def test_copy_error_keeps_fiscal_receipt(self):
+        # the non fiscal copy failing after the fiscal receipt was closed: the order keeps its fiscal receipt
+        server = ZfpLabMockServer().start()
+        self.addCleanup(server.stop)
+        self.addCleanup(FP_transport.clear_pools)
+        self.addCleanup(FP_registry.clear)
+        # the journal commits on a cursor of its own: the test cursor here
+        self.registry.enter_test_mode(self.cr)
+        self.addCleanup(self.registry.leave_test_mode)
+        self.config.write({
+            "cbs_fiscal_printer_server_ip": f"127.0.0.1:{server.port}",
+            "cbs_fiscal_printer_ip": "127.0.0.1",
+            "cbs_fiscal_printer_port": server.port,
+            "cbs_after_fiscal_receipt_print_non_fiscal": True,
+        })
+        server.errors_after_close = {"PrintText": (0x30, 0x32)}
+        self.open_new_session()
+        order = self._order(2)
+        res = order.cbs_print_at_fiscal_server()
+        self.assertEqual(res, {"ok_printed_pos_order_id": (order.id, order.name, order.pos_reference.split()[-1])})
+        self.assertEqual((order.cbs_fiscal_receipt_num, order.cbs_fiscal_total_counter), (12, 1234))
+        self.assertEqual(server.commands.count("CloseReceipt"), 1)
+        self.assertIn("OpenNonFiscalReceipt", server.commands)
@@ -0,0 +1,211 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo.exceptions import ValidationError
+from odoo.tests import common, tagged
+
+from ..models import FP_registry, FP_transport
+from ..models.FP_core import ServerException, SErrorType
+from ..models.cbs_fiscal_metrics import BUCKET_FIELDS
+from ..models.fiscal_receipt import ReceiptPayment
+from .test_fiscal_journal import PLAN
+from .zfplab_mock import DEFAULT_DEVICE_SETTINGS, FP_STATUS_NAMES, ZfpLabMockServer
+
+
+@tagged("post_install", "-at_install")
+class TestReportRun(common.TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.servers = [ZfpLabMockServer().start() for _i in range(2)]
+        for server in cls.servers:
+            cls.addClassCleanup(server.stop)
+            server.responses["ReadLastDailyReportInfo"] = [
+                ("LastZDailyReportDate", "DateTime", "07-05-2023 00:00:00"),
+                ("LastZDailyReportNum", "Number", "41"), ("LastRAMResetNum", "Number", "0")]
+            server.responses["ReadDailyCounters"] = [
+                ("LastReportNumFromReset", "Number", "41"), ("NumLastFMBlock", "Number", "52"),
+                ("NumEJ", "Number", "1"), ("DateTime", "DateTime", "07-05-2023 23:10:00")]
+            server.responses["ReadDailyReceivedSalesAmounts"] = [
+                (f"AmountPayment{i}", "Decimal", value) for i, value in enumerate(["100.50", "20", *["0"] * 8])]
+            server.responses["ReadDailyAmountsByVAT"] = [
+                (name, "Decimal", "120.50" if name.endswith("A") else "0")
+                for name in ("SaleAmountVATGrA", "SaleAmountVATGrB", "SaleAmountVATGrC", "SaleAmountVATGrD",
+                             "SaleAmountVATGrE", "SaleAmountAlteTaxeF")]
+        cls.addClassCleanup(FP_transport.clear_pools)
+        cls.addClassCleanup(FP_registry.clear)
+        # the device of the config is the port of its mock server, reachable for the handshake
+        cls.configs = cls.env["pos.config"].create([{
+            "name": f"CBS register {port}",
+            "cbs_fiscal_printer_server_ip": f"127.0.0.1:{port}",
+            "cbs_fiscal_printer_ip": "127.0.0.1",
+            "cbs_fiscal_printer_port": port,
+        } for port in [server.port for server in cls.servers] + [1]])
+
+    def test_reports_x(self):
+        run = self.env["cbs.fiscal.report.run"].cbs_run(self.configs, "X")
+        self.assertEqual(run.state, "partial")
+        self.assertEqual(run.line_ids.mapped("state"), ["done", "done", "error"])
+        done = run.line_ids[0]
+        self.assertEqual((done.last_z_report_num, done.num_last_fm_block, done.num_ej), (41, 52, 1))
+        self.assertEqual(str(done.last_z_report_date), "2023-05-07")
+        self.assertTrue(run.line_ids[2].error)
+        for server in self.servers:
+            self.assertIn("PrintDailyReport", server.commands)
+
+    def test_report_snapshot(self):
+        config = self.configs[0]
+        session = self.env["pos.session"].create({"config_id": config.id})
+        self.env["cbs.fiscal.report.run"].cbs_run(config, "Z")
+        snapshot = self.env["cbs.fiscal.counter.snapshot"].search([("config_id", "=", config.id)])
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual((snapshot.source, snapshot.session_id, snapshot.last_z_report_num),
+                         ("z_report", session, 41))
+        self.assertEqual((snapshot.amount_cash, snapshot.amount_non_cash, snapshot.amount_vat_a), (100.5, 20, 120.5))
+        commands = self.servers[0].commands
+        self.assertLess(commands.index("ReadDailyReceivedSalesAmounts"), commands.index("PrintDailyReport"))
+        self.env.flush_all()
+        reconciliation = self.env["cbs.fiscal.day.reconciliation"].search([("config_id", "=", config.id)])
+        self.assertEqual((reconciliation.z_report_num, reconciliation.session_id), (41, session))
+        self.assertEqual((reconciliation.device_cash, reconciliation.odoo_cash, reconciliation.cash_difference),
+                         (100.5, 0, 100.5))
+
+    def test_day_reconciliation(self):
+        # one session spanning two fiscal days: each Z report is compared with the receipts of its own day
+        config = self.configs[0]
+        session = self.env["pos.session"].create({"config_id": config.id})
+        snapshots = self.env["cbs.fiscal.counter.snapshot"]
+
+        def receipt(receipt_num, cash, non_cash):
+            order = self.env["pos.order"].create({
+                "session_id": session.id, "pricelist_id": config.pricelist_id.id, "amount_tax": 0,
+                "amount_total": cash + non_cash, "amount_paid": cash + non_cash, "amount_return": 0,
+                "cbs_fiscal_receipt_num": receipt_num, "cbs_cash_payment": cash, "cbs_non_cash_payment": non_cash})
+            snapshots.cbs_add(config, "receipt", session=session, order_id=order.id, last_receipt_num=receipt_num)
+
+        receipt(1, 100.5, 0)
+        receipt(2, 0, 20)
+        self.env["cbs.fiscal.report.run"].cbs_run(config, "Z")
+        receipt(1, 50, 0)
+        self.env["cbs.fiscal.report.run"].cbs_run(config, "Z")
+        self.env.flush_all()
+        days = self.env["cbs.fiscal.day.reconciliation"].search([("config_id", "=", config.id)], order="id")
+        self.assertEqual(days.mapped("nr_receipts"), [2, 1])
+        self.assertEqual(days.mapped("cash_difference"), [0, 50.5])
+        self.assertEqual(days.mapped("non_cash_difference"), [0, 20])
+        self.assertEqual(days.mapped("missing_receipts"), [0, 0])
+
+    def test_heartbeat(self):
+        ok, _other, unreachable = self.configs
+        self.assertEqual(ok._cbs_heartbeat().state, "ok")
+        self.assertIn("ReadStatus", self.servers[0].commands)
+        self.assertEqual(ok.cbs_fiscal_status()["state"], "ok")
+        ok._cbs_fiscal_status_check()
+        # the next receipt finds the handshake done
+        client = FP_registry.get_client(ok._cbs_fiscal_server_address(), ok._cbs_fiscal_device())
+        self.assertTrue(client.is_verified(ok.cbs_fiscal_handshake_ttl))
+
+        self.assertEqual(unreachable._cbs_heartbeat().state, "unreachable")
+        with self.assertRaises(ValidationError):
+            unreachable._cbs_fiscal_status_check()
+        unreachable.cbs_fiscal_status_ttl = 0
+        unreachable._cbs_fiscal_status_check()
+
+    def test_command_stats(self):
+        config = self.configs[0]
+        config._cbs_heartbeat()
+        config._cbs_heartbeat()
+        stats = self.env["cbs.fiscal.command.stat"].search([("config_id", "=", config.id)])
+        read_status = stats.filtered(lambda stat: stat.command == "ReadStatus")
+        self.assertEqual(read_status.count, 2)
+        self.assertEqual(sum(read_status[name] for name in BUCKET_FIELDS), 2)
+        text = self.env["cbs.fiscal.command.stat"].cbs_prometheus()
+        self.assertIn(f'cbs_fiscal_command_ms_count{{config_id="{config.id}",config="{config.name}",'
+                      'command="ReadStatus"} 2', text)
+        # any number of days, up to all the rows
+        self.assertEqual(self.env["cbs.fiscal.command.stat"].cbs_prometheus(10 ** 9), text)
+
+    def test_journal_recover(self):
+        # the journal commits on a cursor of its own: the test cursor here
+        self.registry.enter_test_mode(self.cr)
+        self.addCleanup(self.registry.leave_test_mode)
+        config, server = self.configs[0], self.servers[0]
+        server.responses["ReadStatus"] = [(name, "Status", "1" if name == "Opened_Fiscal_Receipt" else "0")
+                                          for name in FP_STATUS_NAMES]
+        self.addCleanup(server.responses.update, ReadStatus=[(name, "Status", "0") for name in FP_STATUS_NAMES])
+        journal = self.env["cbs.fiscal.receipt.journal"]
+        plan = PLAN._replace(order_id=False, payments=(ReceiptPayment(5.0, True),))
+        # interrupted before its payment: cancelled by the heartbeat; the counters did not move
+        entry = journal.create({"config_id": config.id, "fiscal": True, "step": "lines_sent",
+                                "before_total_counter": 1234, "plan": plan.to_json()})
+        self.assertEqual(config._cbs_heartbeat().state, "warning")
+        self.assertEqual(server.commands[-2:], ["CancelReceipt", "ReadLastAndTotalReceiptNum"])
+        self.assertEqual((entry.step, entry.recovered), ("cancelled", True))
+        # interrupted after its payment: closed
+        entry = journal.create({"config_id": config.id, "fiscal": True, "step": "paid", "payments_done": 0,
+                                "before_total_counter": 1233, "plan": plan.to_json()})
+        with config._cbs_fiscal_printer() as fp:
+            config._cbs_journal_recover(fp)
+        self.assertEqual(server.commands[-3:], ["Payment", "CloseReceipt", "ReadLastAndTotalReceiptNum"])
+        self.assertEqual(entry.step, "closed")
+        self.assertFalse(journal.cbs_open_entries(config))
+
+    def test_server_device_shared(self):
+        # the connected device is committed on a cursor of its own: the test cursor here
+        self.registry.enter_test_mode(self.cr)
+        self.addCleanup(self.registry.leave_test_mode)
+        config, server = self.configs[0], self.servers[0]
+        self.addCleanup(setattr, server, "device_settings", dict(DEFAULT_DEVICE_SETTINGS))
+        # another register printing at the same device
+        other = self.env["pos.config"].create({
+            "name": "CBS register, same device",
+            "cbs_fiscal_printer_server_ip": config.cbs_fiscal_printer_server_ip,
+            "cbs_fiscal_printer_ip": "127.0.0.1",
+            "cbs_fiscal_printer_port": server.port,
+        })
+        server_devices = self.env["cbs.fiscal.server.device"]
+        server_devices.cbs_forget(config._cbs_fiscal_server_address())
+        fp = FP_registry.get_client(config._cbs_fiscal_server_address(), config._cbs_fiscal_device()).fp
+        server.reset_stats()
+        config._cbs_fiscal_device_connect(fp)
+        self.assertEqual((server.requests, server.device_connects), (2, 1))
+        # found connected by config: not asked again, by any worker
+        other._cbs_fiscal_device_connect(fp)
+        self.assertEqual((server.requests, server.device_connects), (2, 1))
+        # after a connection error the server is asked, but not reconnected to the same device
+        config._cbs_fiscal_error(ServerException("lost", SErrorType.ServerConnectionError))
+        other._cbs_fiscal_device_connect(fp)
+        self.assertEqual((server.requests, server.device_connects), (3, 1))
+        row = server_devices.search([("server", "=", f"127.0.0.1:{server.port}")])
+        self.assertEqual((row.device, row.config_id), (f"tcp 127.0.0.1 {server.port}", other))
+
+    def test_shared_server(self):
+        self.registry.enter_test_mode(self.cr)
+        self.addCleanup(self.registry.leave_test_mode)
+        config, server = self.configs[0], self.servers[0]
+        self.addCleanup(setattr, server, "device_settings", dict(DEFAULT_DEVICE_SETTINGS))
+        self.assertFalse(config._cbs_fiscal_server_shared())
+        # another register printing at another device through the same server
+        other = self.env["pos.config"].create({
+            "name": "CBS register, other device",
+            "cbs_fiscal_printer_server_ip": config.cbs_fiscal_printer_server_ip,
+            "cbs_fiscal_printer_ip": "localhost",
+            "cbs_fiscal_printer_port": server.port,
+        })
+        self.assertTrue(config._cbs_fiscal_server_shared())
+        server.reset_stats()
+        for register in (config, other, config, config):
+            with register._cbs_fiscal_printer() as fp:
+                fp.ReadStatus()
+        # each use asks the server for its device, switched only after the other device
+        self.assertEqual(server.device_connects, 3)
+        self.assertEqual(server.commands.count("ReadStatus"), 4)
+        self.assertEqual(server.device_settings["ip"], "127.0.0.1")
+        # the cached devices of the server follow the changes of the configs
+        other.cbs_fiscal_printer_ip = "127.0.0.1"
+        self.assertFalse(config._cbs_fiscal_server_shared())
+        other.cbs_fiscal_printer_ip = "localhost"
+        self.assertTrue(config._cbs_fiscal_server_shared())
+        other.unlink()
+        self.assertFalse(config._cbs_fiscal_server_shared())
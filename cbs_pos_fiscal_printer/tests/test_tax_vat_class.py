@@ -0,0 +1,35 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+from odoo.tests import common, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestTaxVatClass(common.TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.config = cls.env["pos.config"].create({"name": "CBS fiscal", "cbs_no_vat_class": "E"})
+        cls.tax_19 = cls.env["account.tax"].create({"name": "CBS 19", "amount": 19, "type_tax_use": "sale"})
+        cls.tax_9 = cls.env["account.tax"].create({"name": "CBS 9", "amount": 9, "type_tax_use": "sale"})
+        cls.config.write({"cbs_tax_vat_class_ids": [(0, 0, {"tax_id": cls.tax_9.id, "vat_class": "B"})]})
+
+    def _line(self, taxes):
+        # only what _cbs_vat_classes_of_lines reads of a pos.order.line
+        return self.env["pos.order.line"].new({"tax_ids": [(6, 0, taxes.ids)]})
+
+    def test_vat_classes_of_lines(self):
+        lines = [self._line(self.tax_9), self._line(self.tax_19), self._line(self.env["account.tax"]),
+                 self._line(self.tax_9 | self.tax_19)]
+        classes = self.config._cbs_vat_classes_of_lines(lines)
+        self.assertEqual([classes[line.id] for line in lines], ["B", "A", "E", "B"])
+
+    def test_cache_cleared_on_change(self):
+        self.assertEqual(self.config._cbs_tax_vat_classes(), {self.tax_9.id: "B"})
+        self.config.cbs_tax_vat_class_ids.vat_class = "C"
+        self.assertEqual(self.config._cbs_tax_vat_classes(), {self.tax_9.id: "C"})
+        self.config.write({"cbs_tax_vat_class_ids": [(0, 0, {"tax_id": self.tax_19.id, "vat_class": "A"})]})
+        self.assertEqual(self.config._cbs_tax_vat_classes(), {self.tax_9.id: "C", self.tax_19.id: "A"})
+        self.config.cbs_tax_vat_class_ids.unlink()
+        self.assertEqual(self.config._cbs_tax_vat_classes(), {})
@@ -0,0 +1,271 @@
+# Copyright 2023 cbssolutions.ro
+# License OPL-1.0 or later (Odoo Proprietary License)
+# (https://www.odoo.com/documentation/16.0/legal/licenses.html#odoo-apps).
+"""In-process stand-in for a ZfpLab server, to exercise FP_core without Tremol hardware."""
+import base64
+import threading
+import time
+import xml.etree.ElementTree as XML
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+from ..models.FP import FP, __StatusRes__ as FP_StatusRes
+from ..models.FP_core import SErrorType
+
+FP_STATUS_NAMES = FP_StatusRes.__slots__
+
+# commands that print a line on paper
+PRINTING_COMMANDS = frozenset(("PrintText", "SellPLUwithSpecifiedVAT", "SellPLUFromFD_DB", "StornoPLU", "Payment",
+                               "PrintBarcode"))
+CLOSING_COMMANDS = frozenset(("CloseReceipt", "CloseNonFiscalReceipt", "CashPayCloseReceipt"))
+# print type argument of the opening commands that keeps the lines in the device until the close
+BUFFERED_PRINT_TYPES = {"OpenReceipt": ("OptionFiscalReceiptPrintType", ("2", "4")),
+                        "OpenNonFiscalReceipt": ("OptionNonFiscalPrintType", ("1",))}
+
+# answered by GET /settings until changed by GET /settings(...)
+DEFAULT_DEVICE_SETTINGS = {"tcp": "1", "com": "COM1", "baud": "115200", "ip": "127.0.0.1", "port": "8000",
+                           "password": "", "keepPortOpen": "0"}
+
+# canned answers of the read commands used on the receipt path: list of (Name, Type, Value)
+DEFAULT_RESPONSES = {
+    "ReadLastAndTotalReceiptNum": [("LastReceiptNum", "Number", "12"),
+                                   ("TotalReceiptCounter", "Number", "1234")],
+    "ReadSerialNum": [("SerialNumber", "Text", "ZK000001")],
+    "ReadStatus": [(name, "Status", "0") for name in FP_STATUS_NAMES],
+}
+
+
+def device_name(settings):
+    """'ip:port' or the serial port of the device settings of the server."""
+    return f"{settings['ip']}:{settings['port']}" if settings.get("tcp") == "1" else settings["com"]
+
+
+def parse_path(path):
+    """('settings', {'ip': '10.0.0.5', 'tcp': '1'}) of the GET path '/settings(ip=10.0.0.5,tcp=1)'."""
+    path = unquote(path).lstrip("/")
+    endpoint, _sep, args = path.partition("(")
+    return endpoint, dict(arg.split("=", 1) for arg in args.rstrip(")").split(",") if "=" in arg)
+
+
+class ZfpLabMockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real server
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.stats_lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _answer(self, root):
+        with self.server.stats_lock:
+            drop = self.server.drop_answers > 0
+            self.server.drop_answers -= drop
+        if drop:
+            self.close_connection = True
+            return
+        body = XML.tostring(root)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.stats_lock:
+            self.server.requests += 1
+        endpoint, args = parse_path(self.path)
+        root = XML.Element("Res", Code="0")
+        if endpoint == "settings":
+            # settings(ip=..,port=..,tcp=1,password=..) or settings(com=..,baud=..,tcp=0) connects the device
+            if args:
+                self.server.device_settings.update(args)
+                with self.server.stats_lock:
+                    self.server.device_connects += 1
+            stgs = XML.SubElement(root, "settings")
+            XML.SubElement(stgs, "defVer").text = str(self.server.def_version)
+            for tag, text in self.server.device_settings.items():
+                XML.SubElement(stgs, tag).text = text
+        elif endpoint == "finddevice":
+            if self.server.found_device:
+                device = XML.SubElement(root, "device")
+                com, baud = self.server.found_device
+                XML.SubElement(device, "com").text = com
+                XML.SubElement(device, "baud").text = str(baud)
+        elif endpoint == "clientremove":
+            # who=me, who=all or ip=..
+            self.server.removed_clients.append(args)
+        self._answer(root)
+
+    def _execute(self, command):
+        name = command.get("Name")
+        with self.server.stats_lock:
+            self.server.commands.append(name)
+        if name == "RawRead":
+            # the next line of the report asked before (electronic journal), empty at the end
+            with self.server.stats_lock:
+                line = self.server.raw_lines.pop(0) if self.server.raw_lines else b""
+            root = XML.Element("Res", Code="0")
+            XML.SubElement(root, "Res", Name="Bytes", Value=base64.b64encode(line).decode(), Type="Base64")
+            return root
+        errors = self.server.errors
+        if self.server.closed_on and self.server.errors_after_close:
+            errors = dict(errors, **self.server.errors_after_close)
+        if name in errors:
+            ste1, ste2 = errors[name]
+            root = XML.Element("Res", Code="40")
+            err = XML.SubElement(root, "Err", Source="FP", STE1="%02X" % ste1, STE2="%02X" % ste2)
+            XML.SubElement(err, "Message").text = "FP error"
+            return root
+        self._print(name, command)
+        root = XML.Element("Res", Code="0")
+        for res_name, typ, value in self.server.responses.get(name, []):
+            XML.SubElement(root, "Res", Name=res_name, Value=value, Type=typ)
+        return root
+
+    def _print(self, name, command):
+        """The paper the device uses for the command."""
+        server = self.server
+        if name in BUFFERED_PRINT_TYPES:
+            arg_name, buffered_values = BUFFERED_PRINT_TYPES[name]
+            arg = command.find(f"Args/Arg[@Name='{arg_name}']")
+            server.buffered = arg is not None and arg.get("Value") in buffered_values
+            server.buffer = 0
+        elif name in PRINTING_COMMANDS:
+            if server.buffered:
+                server.buffer += 1
+            else:
+                if server.line_print_time:
+                    time.sleep(server.line_print_time)
+                server.paper_lines += 1
+        elif name in CLOSING_COMMANDS:
+            # the buffered lines are printed after the close is acknowledged
+            server.closed_on.append(device_name(server.device_settings))
+            server.paper_lines += server.buffer
+            server.buffered, server.buffer = False, 0
+        elif name == "CancelReceipt":
+            server.buffered, server.buffer = False, 0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = XML.fromstring(self.rfile.read(length))
+        with self.server.stats_lock:
+            self.server.requests += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+            busy = self.server.busy or self.server.exclusive and self.server.in_flight > 1
+        if busy:
+            # the real server waits for the command of the other client, then gives up
+            root = XML.Element("Res", Code=str(SErrorType.ServWaitOtherClientCmdProcessingTimeOut))
+            XML.SubElement(XML.SubElement(root, "Err", Source="Server"), "Message").text = "Wait other client"
+            with self.server.stats_lock:
+                self.server.in_flight -= 1
+                self.server.busy_answers += 1
+            self._answer(root)
+            return
+        try:
+            if self.server.latency:
+                time.sleep(self.server.latency)  # the device printing
+            self._post(request)
+        finally:
+            with self.server.stats_lock:
+                self.server.in_flight -= 1
+
+    def _post(self, request):
+        if request.tag != "Commands":
+            self._answer(self._execute(request))
+        elif not self.server.accept_batches:
+            # ServDefMissing by default, like for an unknown command
+            root = XML.Element("Res", Code=str(self.server.batch_error_code))
+            XML.SubElement(XML.SubElement(root, "Err", Source="Server"), "Message").text = "Batch not supported"
+            self._answer(root)
+        else:
+            root = XML.Element("Commands")
+            for command in request.findall("Command"):
+                res = self._execute(command)
+                root.append(res)
+                if res.get("Code") != "0":
+                    break  # the device stops at the first failed command
+            self._answer(root)
+
+
+class ZfpLabMockServer(ThreadingHTTPServer):
+    """ZfpLab server answering every command with success, running in a daemon thread.
+
+    Counts the TCP connections, the HTTP requests and the names of the received commands.
+    Without accept_batches, a <Commands> request is answered with batch_error_code, executing nothing.
+    errors maps a command name to the (STE1, STE2) the device answers to it; errors_after_close adds to it
+    once a receipt was closed.
+    Endpoints: device_settings is what settings(...) set, device_connects counts the settings(...)
+    (each one makes the real server reconnect to the device); finddevice answers found_device (com, baud)
+    if set; removed_clients has the arguments of the clientremove(...) requests. RawRead answers the next
+    of raw_lines (bytes).
+    latency is the seconds the device takes for a request; max_in_flight is the most requests
+    that the server handled at the same time. exclusive: like the real server, a request arriving while
+    another one is handled is answered ServWaitOtherClientCmdProcessingTimeOut (counted in busy_answers);
+    busy: every request is answered so. The next drop_answers requests are executed, then the connection is
+    closed without an answer.
+    Printing: a receipt opened step by step prints each line when it receives it, waiting
+    line_print_time seconds; an opened postponed/buffered receipt keeps its lines until closed
+    (dropped by CancelReceipt). paper_lines counts the printed lines, closed_on has the device (device_name())
+    of each closed receipt.
+    """
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0):
+        super().__init__((host, port), ZfpLabMockHandler)
+        self.def_version = FP._timestamp
+        self.responses = dict(DEFAULT_RESPONSES)
+        self.errors = {}
+        self.errors_after_close = {}
+        self.accept_batches = True
+        self.batch_error_code = SErrorType.ServDefMissing
+        self.exclusive = False
+        self.busy = False
+        self.drop_answers = 0
+        self.device_settings = dict(DEFAULT_DEVICE_SETTINGS)
+        self.found_device = None
+        self.removed_clients = []
+        self.raw_lines = []
+        self.latency = 0.0
+        self.line_print_time = 0.0
+        self.buffered = False
+        self.buffer = 0
+        self.paper_lines = 0
+        self.closed_on = []
+        self.stats_lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.commands = []
+        self.device_connects = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.busy_answers = 0
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.connections = 0
+            self.requests = 0
+            self.commands = []
+            self.device_connects = 0
+            self.max_in_flight = 0
+            self.busy_answers = 0
+            self.paper_lines = 0
+            self.closed_on = []
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()